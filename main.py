@@ -1,12 +1,11 @@
+import numpy as np
 from src.data.data_loader import DataLoader
 from src.features.technical_indicators import TechnicalFeatures
 from src.features.feature_engineering import FeatureEngineer
 from src.data.data_splitter import DataSplitter
-from src.models.lstm_model import LSTMModel
-from src.models.random_forest_model import RandomForestModel
 from src.evaluation.metrics import EvaluationMetrics
-from src.visualization.visualizer import Visualizer
 from src.utils.config import ModelConfig
+from src.utils.plugins import MODELS, VISUALIZERS
 
 def main():
     # Initialize configuration
@@ -40,26 +39,24 @@ def main():
             df, target, config
         )
         
-        # Train models
-        models = {
-            'lstm': LSTMModel(config),
-            'rf': RandomForestModel(config)
-        }
+        # Train models; each back-end is imported only if it is selected
+        models = {name: MODELS.create(name, config) for name in config.models}
         
         results = {}
         for name, model in models.items():
             print(f"\nTraining {name.upper()} model...")
             history = model.train(X_train, y_train, X_val, y_val)
             
-            # Make predictions
-            y_pred = model.predict(X_test)
+            # Earlier rows give sequence models full lookback windows for every test row
+            y_pred = model.predict(X_test, context=np.concatenate([X_train, X_val]))
             
             # Calculate metrics
             metrics = EvaluationMetrics.calculate_metrics(y_test, y_pred)
             results[name] = metrics
             
             # Visualize results
-            Visualizer.plot_predictions(y_test, y_pred, f"{name.upper()} Predictions")
+            if config.show_plots:
+                VISUALIZERS.get('model_predictions')(y_test, y_pred, f"{name.upper()} Predictions")
             print(f"{name.upper()} Metrics:", metrics)
         
     except Exception as e:
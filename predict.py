@@ -1,9 +1,9 @@
 from src.data.stock_data import fetch_stock_data
-from src.features.feature_generator import add_technical_features
+from src.features.feature_cache import cached_technical_features
+from src.features.feature_constants import TRAINING_FEATURES
+from src.models.model_registry import ModelRegistry
 from src.models.stock_predictor import StockPredictor
-from src.visualization.plotter import plot_predictions
-from src.data.scrapers.yahoo_finance import YahooFinanceScraper
-from src.visualization.financial_plot import plot_financial_summary
+from src.utils.plugins import VISUALIZERS
 
 def main():
     # Get stock symbol from user
@@ -11,31 +11,38 @@ def main():
     
     # Initialize scraper and get additional data
     print("\nFetching financial data...")
+    from src.data.scrapers.yahoo_finance import YahooFinanceScraper
     scraper = YahooFinanceScraper(symbol)
     analyst_data = scraper.get_analyst_data()
     earnings_data = scraper.get_earnings_data()
     financials = scraper.get_financials()
     
     # Show financial summary
-    plot_financial_summary(symbol, analyst_data, earnings_data, financials)
+    VISUALIZERS.get('financial_summary')(symbol, analyst_data, earnings_data, financials)
     
     # Fetch and process data for price prediction
     df = fetch_stock_data(symbol)
-    df = add_technical_features(df)
+    df = cached_technical_features(symbol, df, TRAINING_FEATURES)
     
-    # Initialize and train model
-    predictor = StockPredictor()
-    X_scaled, y, features = predictor.prepare_data(df)
-    
-    print("\nTraining model...")
-    predictor.train(X_scaled, y)
+    # Reuse a model already trained on these bars, otherwise train and register one
+    registry = ModelRegistry()
+    predictor = StockPredictor.from_registry(registry, symbol, df)
+    if predictor is not None:
+        print("\nUsing registered model trained on data up to the latest bar")
+    else:
+        predictor = StockPredictor()
+        X_scaled, y, features = predictor.prepare_data(df)
+        
+        print("\nTraining model...")
+        predictor.train(X_scaled, y)
+        predictor.register(registry, symbol, df.index[0], df.index[-1])
     
     # Generate predictions
     print("\nGenerating future predictions...")
-    future_predictions = predictor.predict_future(df)
+    forecast = predictor.forecast(df, n_paths=10000)
     
     # Plot results
-    plot_predictions(df, future_predictions)
+    VISUALIZERS.get('predictions')(df, forecast.expected_returns(), forecast.bands((5, 95)))
 
 if __name__ == "__main__":
     main()
@@ -1,21 +1,30 @@
-import yfinance as yf
 import pandas as pd
 from typing import Optional, Tuple
+from .providers.base_provider import BaseDataProvider
 
 class DataLoader:
-    def __init__(self, symbol: str, start_date: str, end_date: str):
+    def __init__(self, symbol: str, start_date: str, end_date: str,
+                 provider: Optional[BaseDataProvider] = None):
         self.symbol = symbol
         self.start_date = start_date
         self.end_date = end_date
+        self.provider = provider
         
     def fetch_data(self) -> pd.DataFrame:
-        """Fetch historical data from Yahoo Finance."""
+        """Fetch historical data through the configured (cached) provider."""
         try:
-            df = yf.download(self.symbol, start=self.start_date, end=self.end_date)
+            df = self._get_provider().fetch_data(self.symbol, self.start_date, self.end_date)
             return self._validate_data(df)
         except Exception as e:
             raise Exception(f"Error fetching data for {self.symbol}: {str(e)}")
     
+    def _get_provider(self) -> BaseDataProvider:
+        if self.provider is None:
+            from .providers.provider_factory import create_provider
+            from src.utils.config import ModelConfig
+            self.provider = create_provider(ModelConfig())
+        return self.provider
+    
     def _validate_data(self, df: pd.DataFrame) -> pd.DataFrame:
         """Validate and clean the downloaded data."""
         if df.empty:
@@ -29,4 +38,4 @@ class DataLoader:
         if not all(col in df.columns for col in required_columns):
             raise ValueError(f"Missing required columns in data")
             
-        return df
\ No newline at end of file
+        return df
@@ -1,56 +1,103 @@
 import pandas as pd
 import os
 from datetime import datetime, timedelta
-from typing import Optional
-from .data_loader import DataLoader
+from typing import List, Optional
 from .ticker_manager import TickerManager
+from .refresh import RefreshSummary, WatchlistRefresher
+from .providers.base_provider import BaseDataProvider
+from .storage.base_storage import BaseStorage
+from .storage.csv_storage import CsvStorage
+from .storage.parquet_storage import ParquetStorage
+
+STORAGE_BACKENDS = {
+    'csv': CsvStorage,
+    'parquet': ParquetStorage
+}
 
 class DataManager:
-    def __init__(self, storage_path: str = 'data/stock_data'):
+    def __init__(self, storage_path: str = 'data/stock_data', storage_backend: Optional[str] = None,
+                 storage: Optional[BaseStorage] = None, provider: Optional[BaseDataProvider] = None,
+                 config=None):
+        """storage_backend and provider default to the settings in config (ModelConfig() if not given)"""
+        from src.utils.config import ModelConfig
+        config = config or ModelConfig()
         self.storage_path = storage_path
         os.makedirs(storage_path, exist_ok=True)
+        if storage is None:
+            storage_backend = storage_backend or config.storage_backend
+            if storage_backend not in STORAGE_BACKENDS:
+                raise ValueError(f"Unknown storage backend: {storage_backend}")
+            storage = STORAGE_BACKENDS[storage_backend](storage_path)
+        self.storage = storage
+        if provider is None:
+            from .providers.provider_factory import create_provider
+            provider = create_provider(config)
+        self.provider = provider
         self.ticker_manager = TickerManager()
     
-    def update_data(self, ticker: Optional[str] = None) -> None:
-        """Update data for one ticker or all tickers in watchlist"""
+    def update_data(self, ticker: Optional[str] = None, max_workers: int = 8,
+                    rate_limit: Optional[float] = None, batch_size: int = 50,
+                    max_retries: int = 2) -> RefreshSummary:
+        """Update data for one ticker or all tickers in watchlist
+        
+        Tickers are fetched concurrently by up to max_workers threads, grouped
+        into multi-symbol requests of up to batch_size tickers sharing a start
+        date, and throttled to rate_limit requests per second. Failing tickers
+        are retried and reported in the returned summary instead of aborting
+        the run.
+        """
         tickers = [ticker] if ticker else self.ticker_manager.get_tickers()
         
+        # Plan each ticker's start date from the manifest without reading data
+        plan = {}
         for symbol in tickers:
-            # Get latest data date
             last_date = self._get_last_date(symbol)
             start_date = last_date + timedelta(days=1) if last_date else None
-            
-            # Fetch new data
-            loader = DataLoader(
-                symbol=symbol,
-                start_date=start_date.strftime('%Y-%m-%d') if start_date else None,
-                end_date=datetime.now().strftime('%Y-%m-%d')
-            )
-            
-            new_data = loader.fetch_data()
-            if not new_data.empty:
-                self._save_data(symbol, new_data)
+            plan[symbol] = start_date.strftime('%Y-%m-%d') if start_date else None
+        
+        refresher = WatchlistRefresher(
+            self.provider,
+            max_workers=max_workers,
+            rate_limit=rate_limit,
+            batch_size=batch_size,
+            max_retries=max_retries
+        )
+        
+        with self.storage.manifest.deferred():
+            summary = refresher.run(plan, datetime.now().strftime('%Y-%m-%d'), self._save_data)
+        
+        print(summary.report())
+        return summary
     
-    def get_data(self, ticker: str) -> pd.DataFrame:
-        """Get stored data for a ticker"""
-        file_path = os.path.join(self.storage_path, f'{ticker}.csv')
-        if os.path.exists(file_path):
-            return pd.read_csv(file_path, index_col=0, parse_dates=True)
-        return pd.DataFrame()
+    def get_data(self, ticker: str, columns: Optional[List[str]] = None,
+                 start_date: Optional[str] = None, end_date: Optional[str] = None,
+                 resolution: Optional[str] = None) -> pd.DataFrame:
+        """Get stored data for a ticker, optionally limited to columns and a date range
+        
+        Daily bars are stored under the ticker itself; intraday bars built by
+        the streaming aggregator are stored per resolution (e.g. '1min').
+        """
+        key = self.bar_key(ticker, resolution)
+        return self.storage.read(key, columns=columns, start_date=start_date, end_date=end_date)
+    
+    @staticmethod
+    def bar_key(ticker: str, resolution: Optional[str] = None) -> str:
+        """Storage key for a ticker's bars at a resolution (None for daily bars)"""
+        return f'{ticker}_{resolution}' if resolution else ticker
+    
+    def get_stale_tickers(self, as_of: Optional[datetime] = None,
+                          max_age: pd.DateOffset = pd.offsets.BDay(1)) -> List[str]:
+        """List watchlist tickers whose stored data ends before as_of - max_age (business days by default)"""
+        cutoff = pd.Timestamp(as_of or datetime.now()).normalize() - max_age
+        stale = []
+        for symbol in self.ticker_manager.get_tickers():
+            last_date = self.storage.manifest.last_date(symbol)
+            if last_date is None or last_date < cutoff:
+                stale.append(symbol)
+        return stale
     
     def _get_last_date(self, ticker: str) -> Optional[datetime]:
-        data = self.get_data(ticker)
-        if not data.empty:
-            return pd.to_datetime(data.index[-1])
-        return None
+        return self.storage.last_date(ticker)
     
     def _save_data(self, ticker: str, data: pd.DataFrame) -> None:
-        file_path = os.path.join(self.storage_path, f'{ticker}.csv')
-        
-        # Append to existing data if it exists
-        existing_data = self.get_data(ticker)
-        if not existing_data.empty:
-            data = pd.concat([existing_data, data])
-            data = data[~data.index.duplicated(keep='last')]
-        
-        data.sort_index().to_csv(file_path)
\ No newline at end of file
+        self.storage.append(ticker, data)
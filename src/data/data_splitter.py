@@ -1,8 +1,16 @@
 import numpy as np
 import pandas as pd
-from typing import Tuple
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
 from sklearn.preprocessing import StandardScaler
 
+@dataclass(frozen=True)
+class Fold:
+    index: int
+    train: slice
+    val: slice
+    test: slice
+
 class DataSplitter:
     @staticmethod
     def train_val_test_split(df: pd.DataFrame, target: str, config) -> Tuple:
@@ -29,4 +37,39 @@ class DataSplitter:
         y_val = val_data[target].values
         y_test = test_data[target].values
         
-        return (X_train, X_val, X_test, y_train, y_val, y_test, scaler)
\ No newline at end of file
+        return (X_train, X_val, X_test, y_train, y_val, y_test, scaler)
+    
+    @staticmethod
+    def walk_forward_splits(n: int, test_size: int, min_train_size: int, val_size: Optional[int] = None,
+                            window: str = 'expanding', train_size: Optional[int] = None,
+                            purge: int = 0, embargo: int = 0) -> List[Fold]:
+        """Walk-forward folds as contiguous slices over n time-ordered rows.
+        
+        Each fold trains on rows before its validation window and tests on the
+        test_size rows after it. 'expanding' windows train from row 0; 'rolling'
+        windows keep the last train_size rows (default min_train_size). purge
+        rows are dropped between train, validation and test so labels that
+        look ahead cannot overlap the evaluated rows. embargo drops a further
+        embargo rows from the end of every training range; set it to at least
+        the forecast horizon so no training label is computed from prices that
+        fall inside the validation or test window.
+        """
+        if window not in ('expanding', 'rolling'):
+            raise ValueError(f"window must be 'expanding' or 'rolling', got {window}")
+        val_size = test_size if val_size is None else val_size
+        train_size = train_size or min_train_size
+        
+        folds = []
+        test_start = (train_size if window == 'rolling' else min_train_size) + embargo + val_size + 2 * purge
+        while test_start < n:
+            val_start = test_start - purge - val_size
+            train_end = val_start - purge - embargo
+            train_start = 0 if window == 'expanding' else train_end - train_size
+            folds.append(Fold(
+                index=len(folds),
+                train=slice(train_start, train_end),
+                val=slice(val_start, val_start + val_size),
+                test=slice(test_start, min(test_start + test_size, n))
+            ))
+            test_start += test_size
+        return folds
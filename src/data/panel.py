@@ -0,0 +1,125 @@
+import json
+import os
+import numpy as np
+import pandas as pd
+from typing import Dict, List, Optional, Union
+
+class OHLCVPanel:
+    """Memory-mapped multi-ticker OHLCV panel.
+    
+    Each field is stored as one contiguous ``{field}.npy`` array shaped
+    (time, ticker) over a shared date axis, with missing bars as NaN. Arrays
+    are opened with ``np.load(mmap_mode='r')`` so every process reading the
+    same panel shares the OS page cache instead of holding its own parsed
+    copy. Ticker and date slices are returned as zero-copy NumPy views.
+    """
+    
+    FIELDS = ['Open', 'High', 'Low', 'Close', 'Volume']
+    META_FILE = 'meta.json'
+    DATES_FILE = 'dates.npy'
+    
+    def __init__(self, path: str, mmap_mode: Optional[str] = 'r'):
+        self.path = path
+        with open(os.path.join(path, self.META_FILE), 'r') as f:
+            meta = json.load(f)
+        self.tickers: List[str] = meta['tickers']
+        self.fields: List[str] = meta['fields']
+        self._ticker_positions = {ticker: i for i, ticker in enumerate(self.tickers)}
+        self.dates = pd.DatetimeIndex(np.load(os.path.join(path, self.DATES_FILE)).astype('datetime64[ns]'))
+        self._arrays = {
+            field: np.load(os.path.join(path, f'{field}.npy'), mmap_mode=mmap_mode)
+            for field in self.fields
+        }
+    
+    @classmethod
+    def build(cls, data_manager, path: str, tickers: Optional[List[str]] = None,
+              start_date: Optional[str] = None, end_date: Optional[str] = None,
+              fields: Optional[List[str]] = None, dtype=np.float64) -> 'OHLCVPanel':
+        """Write a panel from a DataManager store, holding one ticker in memory at a time"""
+        tickers = list(tickers) if tickers is not None else data_manager.ticker_manager.get_tickers()
+        fields = list(fields or cls.FIELDS)
+        os.makedirs(path, exist_ok=True)
+        
+        # First pass: union of all dates using index-only reads
+        dates = pd.DatetimeIndex([])
+        for ticker in tickers:
+            index = data_manager.get_data(ticker, columns=[], start_date=start_date, end_date=end_date).index
+            dates = dates.union(pd.DatetimeIndex(index))
+        
+        shape = (len(dates), len(tickers))
+        arrays = {
+            field: np.lib.format.open_memmap(os.path.join(path, f'{field}.npy'), mode='w+', dtype=dtype, shape=shape)
+            for field in fields
+        }
+        for array in arrays.values():
+            array[:] = np.nan
+        
+        # Second pass: scatter each ticker's bars into its column
+        for column, ticker in enumerate(tickers):
+            data = data_manager.get_data(ticker, columns=fields, start_date=start_date, end_date=end_date)
+            if data.empty:
+                continue
+            rows = dates.get_indexer(pd.DatetimeIndex(data.index))
+            for field in fields:
+                if field in data.columns:
+                    arrays[field][rows, column] = data[field].to_numpy(dtype=dtype)
+        
+        for array in arrays.values():
+            array.flush()
+        np.save(os.path.join(path, cls.DATES_FILE), dates.values.astype('datetime64[ns]').astype(np.int64))
+        with open(os.path.join(path, cls.META_FILE), 'w') as f:
+            json.dump({'tickers': tickers, 'fields': fields, 'dtype': np.dtype(dtype).str, 'shape': shape}, f)
+        
+        return cls(path)
+    
+    @property
+    def shape(self) -> tuple:
+        return (len(self.dates), len(self.tickers))
+    
+    def field(self, name: str) -> np.ndarray:
+        """Full (time, ticker) array for a field"""
+        return self._arrays[name]
+    
+    def ticker_position(self, ticker: str) -> int:
+        return self._ticker_positions[ticker]
+    
+    def ticker(self, ticker: str, start_date: Optional[str] = None, end_date: Optional[str] = None,
+               fields: Optional[List[str]] = None) -> Dict[str, np.ndarray]:
+        """Zero-copy 1-D views of one ticker's fields over a date range"""
+        rows = self._date_slice(start_date, end_date)
+        column = self._ticker_positions[ticker]
+        return {field: self._arrays[field][rows, column] for field in fields or self.fields}
+    
+    def slice(self, start_date: Optional[str] = None, end_date: Optional[str] = None,
+              tickers: Optional[List[str]] = None, fields: Optional[List[str]] = None) -> Dict[str, np.ndarray]:
+        """2-D (time, ticker) views over a date range and set of tickers
+        
+        Tickers that are adjacent in the panel are returned as views; an
+        arbitrary ticker selection needs fancy indexing and is copied.
+        """
+        rows = self._date_slice(start_date, end_date)
+        columns = self._ticker_slice(tickers)
+        return {field: self._arrays[field][rows, columns] for field in fields or self.fields}
+    
+    def dates_between(self, start_date: Optional[str] = None, end_date: Optional[str] = None) -> pd.DatetimeIndex:
+        return self.dates[self._date_slice(start_date, end_date)]
+    
+    def to_frame(self, ticker: str, start_date: Optional[str] = None,
+                 end_date: Optional[str] = None) -> pd.DataFrame:
+        """One ticker as the usual OHLCV frame, dropping dates without a bar"""
+        views = self.ticker(ticker, start_date, end_date)
+        df = pd.DataFrame(views, index=self.dates_between(start_date, end_date))
+        return df.dropna(how='all')
+    
+    def _date_slice(self, start_date: Optional[str], end_date: Optional[str]) -> slice:
+        start = self.dates.searchsorted(pd.Timestamp(start_date), side='left') if start_date is not None else 0
+        end = self.dates.searchsorted(pd.Timestamp(end_date), side='right') if end_date is not None else len(self.dates)
+        return slice(start, end)
+    
+    def _ticker_slice(self, tickers: Optional[List[str]]) -> Union[slice, np.ndarray]:
+        if tickers is None:
+            return slice(None)
+        positions = np.array([self._ticker_positions[ticker] for ticker in tickers])
+        if len(positions) and np.all(np.diff(positions) == 1):
+            return slice(positions[0], positions[-1] + 1)
+        return positions
@@ -1,8 +1,12 @@
 from abc import ABC, abstractmethod
 import pandas as pd
-from typing import Optional
+from typing import Dict, List, Optional
 
 class BaseDataProvider(ABC):
     @abstractmethod
     def fetch_data(self, symbol: str, start_date: Optional[str] = None, end_date: Optional[str] = None) -> pd.DataFrame:
-        pass
\ No newline at end of file
+        pass
+    
+    def fetch_batch(self, symbols: List[str], start_date: Optional[str] = None, end_date: Optional[str] = None) -> Dict[str, pd.DataFrame]:
+        """Fetch several symbols sharing a date range; providers with multi-symbol endpoints override this"""
+        return {symbol: self.fetch_data(symbol, start_date, end_date) for symbol in symbols}
@@ -0,0 +1,190 @@
+import json
+import os
+import threading
+import time
+import pandas as pd
+from collections import defaultdict
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+from .base_provider import BaseDataProvider
+
+Interval = Tuple[pd.Timestamp, pd.Timestamp]
+
+class CachedProvider(BaseDataProvider):
+    """Read-through on-disk bar cache around any BaseDataProvider.
+    
+    For each symbol the cache remembers which [start, end) date ranges have
+    already been fetched, so a request overlapping cached data only goes to
+    the wrapped provider for the missing gaps and the pieces are stitched
+    together. Ranges reaching today are only marked as covered up to
+    yesterday so the still-forming bar is fetched again, and a symbol that
+    comes back missing or empty for a range with business days is not marked
+    covered, so a failed fetch is retried. When the cache grows past
+    max_size_mb the least recently used symbols are evicted.
+    """
+    
+    EPOCH = pd.Timestamp('1970-01-01')
+    INDEX_FILE = 'index.json'
+    
+    def __init__(self, provider: BaseDataProvider, cache_dir: str = 'data/cache/bars',
+                 max_size_mb: float = 512, namespace: Optional[str] = None):
+        self.provider = provider
+        self.cache_dir = os.path.join(cache_dir, namespace or type(provider).__name__)
+        self.max_size_bytes = int(max_size_mb * 1024 * 1024)
+        os.makedirs(self.cache_dir, exist_ok=True)
+        self.index_file = os.path.join(self.cache_dir, self.INDEX_FILE)
+        self.index = self._load_index()
+        self._lock = threading.Lock()
+    
+    def fetch_data(self, symbol: str, start_date: Optional[str] = None, end_date: Optional[str] = None) -> pd.DataFrame:
+        return self.fetch_batch([symbol], start_date, end_date)[symbol]
+    
+    def fetch_batch(self, symbols: List[str], start_date: Optional[str] = None, end_date: Optional[str] = None) -> Dict[str, pd.DataFrame]:
+        start, end = self._request_range(start_date, end_date)
+        
+        # Symbols missing the same gaps are fetched together
+        groups = defaultdict(list)
+        for symbol in symbols:
+            groups[tuple(self._gaps(symbol, start, end))].append(symbol)
+        
+        for gaps, group in groups.items():
+            for gap_start, gap_end in gaps:
+                # An open start is passed on as None so the provider returns its full
+                # history in one request; covering from EPOCH then records that
+                # nothing exists before the earliest bar it returned
+                fetched = self.provider.fetch_batch(
+                    group, gap_start.strftime('%Y-%m-%d') if gap_start > self.EPOCH else None,
+                    gap_end.strftime('%Y-%m-%d')
+                )
+                for symbol in group:
+                    self._store(symbol, fetched.get(symbol), (gap_start, gap_end))
+        
+        results = {}
+        for symbol in symbols:
+            data = self._read(symbol)
+            results[symbol] = data[(data.index >= start) & (data.index < end)] if not data.empty else data
+        self._evict(keep=set(symbols))
+        return results
+    
+    def clear(self) -> None:
+        with self._lock:
+            for symbol in list(self.index):
+                self._remove(symbol)
+            self._save_index()
+    
+    def _request_range(self, start_date: Optional[str], end_date: Optional[str]) -> Interval:
+        start = pd.Timestamp(start_date) if start_date else self.EPOCH
+        tomorrow = pd.Timestamp(datetime.now().date() + timedelta(days=1))
+        end = pd.Timestamp(end_date) if end_date else tomorrow
+        return start, min(end, tomorrow)
+    
+    def _gaps(self, symbol: str, start: pd.Timestamp, end: pd.Timestamp) -> List[Interval]:
+        gaps = []
+        cursor = start
+        for covered_start, covered_end in self._intervals(symbol):
+            if covered_end <= cursor:
+                continue
+            if covered_start >= end:
+                break
+            if covered_start > cursor:
+                gaps.append((cursor, covered_start))
+            cursor = max(cursor, covered_end)
+        if cursor < end:
+            gaps.append((cursor, end))
+        return gaps
+    
+    def _store(self, symbol: str, data: Optional[pd.DataFrame], fetched: Interval) -> None:
+        # Bars from today may still change, so never mark today as covered
+        today = pd.Timestamp(datetime.now().date())
+        covered = (fetched[0], min(fetched[1], today))
+        
+        # A missing or empty result is usually a failed fetch; only trust it for
+        # ranges without business days, otherwise the gap is fetched again next time
+        if data is None or data.empty:
+            if covered[0] >= covered[1] or len(pd.bdate_range(covered[0], covered[1] - pd.Timedelta(days=1))):
+                return
+            data = pd.DataFrame()
+        
+        with self._lock:
+            cached = self._read(symbol)
+            if not data.empty:
+                data = data.copy()
+                data.index = pd.DatetimeIndex(data.index)
+                if data.index.tz is not None:
+                    data.index = data.index.tz_localize(None)
+                cached = pd.concat([cached, data]) if not cached.empty else data
+                cached = cached[~cached.index.duplicated(keep='last')].sort_index()
+                cached.to_pickle(self._file_path(symbol))
+            
+            intervals = self._intervals(symbol)
+            if covered[0] < covered[1]:
+                intervals = self._merge(intervals + [covered])
+            
+            path = self._file_path(symbol)
+            self.index[symbol] = {
+                'intervals': [[s.isoformat(), e.isoformat()] for s, e in intervals],
+                'size': os.path.getsize(path) if os.path.exists(path) else 0,
+                'last_access': time.time()
+            }
+            self._save_index()
+    
+    def _read(self, symbol: str) -> pd.DataFrame:
+        path = self._file_path(symbol)
+        if symbol in self.index and os.path.exists(path):
+            self.index[symbol]['last_access'] = time.time()
+            return pd.read_pickle(path)
+        return pd.DataFrame()
+    
+    def _evict(self, keep: set) -> None:
+        with self._lock:
+            total = sum(entry['size'] for entry in self.index.values())
+            if total <= self.max_size_bytes:
+                self._save_index()
+                return
+            
+            by_age = sorted(self.index.items(), key=lambda item: item[1]['last_access'])
+            for symbol, entry in by_age:
+                if total <= self.max_size_bytes:
+                    break
+                if symbol in keep:
+                    continue
+                total -= entry['size']
+                self._remove(symbol)
+            self._save_index()
+    
+    def _remove(self, symbol: str) -> None:
+        self.index.pop(symbol, None)
+        path = self._file_path(symbol)
+        if os.path.exists(path):
+            os.remove(path)
+    
+    def _intervals(self, symbol: str) -> List[Interval]:
+        entry = self.index.get(symbol)
+        if not entry:
+            return []
+        return [(pd.Timestamp(s), pd.Timestamp(e)) for s, e in entry['intervals']]
+    
+    @staticmethod
+    def _merge(intervals: List[Interval]) -> List[Interval]:
+        merged = []
+        for start, end in sorted(intervals):
+            if merged and start <= merged[-1][1]:
+                merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+            else:
+                merged.append((start, end))
+        return merged
+    
+    def _file_path(self, symbol: str) -> str:
+        return os.path.join(self.cache_dir, f'{symbol}.pkl')
+    
+    def _load_index(self) -> Dict:
+        if os.path.exists(self.index_file):
+            with open(self.index_file, 'r') as f:
+                return json.load(f)
+        return {}
+    
+    def _save_index(self) -> None:
+        tmp_path = f'{self.index_file}.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump(self.index, f)
+        os.replace(tmp_path, self.index_file)
@@ -0,0 +1,78 @@
+import threading
+import time
+import zlib
+import numpy as np
+import pandas as pd
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Union
+from .base_provider import BaseDataProvider
+
+class FakeProvider(BaseDataProvider):
+    """Offline provider serving deterministic synthetic bars for tests and benchmarks.
+
+    Symbols without explicit ``data`` get a seeded random walk over business
+    days up to today, generated once so overlapping requests agree.
+    ``latency`` (seconds, or a callable of the symbol) is slept before every
+    call. ``failures`` maps a symbol to the number of calls that raise before
+    it starts succeeding. Every call is recorded in ``calls``.
+    """
+
+    def __init__(self, data: Optional[Dict[str, pd.DataFrame]] = None,
+                 latency: Union[float, Callable[[str], float]] = 0.0,
+                 failures: Optional[Dict[str, int]] = None,
+                 default_start: str = '2020-01-01'):
+        self.data = data or {}
+        self.latency = latency
+        self.failures = dict(failures or {})
+        self.default_start = default_start
+        self.calls: List[tuple] = []
+        self._lock = threading.Lock()
+
+    def fetch_data(self, symbol: str, start_date: Optional[str] = None, end_date: Optional[str] = None) -> pd.DataFrame:
+        self._record(symbol, start_date, end_date)
+        return self._bars(symbol, start_date, end_date)
+
+    def fetch_batch(self, symbols: List[str], start_date: Optional[str] = None, end_date: Optional[str] = None) -> Dict[str, pd.DataFrame]:
+        self._record(tuple(symbols), start_date, end_date)
+        return {symbol: self._bars(symbol, start_date, end_date) for symbol in symbols}
+
+    def _record(self, key, start_date: Optional[str], end_date: Optional[str]) -> None:
+        with self._lock:
+            self.calls.append((key, start_date, end_date))
+            symbols = key if isinstance(key, tuple) else (key,)
+            failing = [symbol for symbol in symbols if self.failures.get(symbol, 0) > 0]
+            for symbol in failing:
+                self.failures[symbol] -= 1
+
+        delay = max(self.latency(s) if callable(self.latency) else self.latency for s in symbols)
+        if delay:
+            time.sleep(delay)
+        if failing:
+            raise ConnectionError(f"Simulated failure for {', '.join(failing)}")
+
+    def _bars(self, symbol: str, start_date: Optional[str], end_date: Optional[str]) -> pd.DataFrame:
+        if symbol not in self.data:
+            with self._lock:
+                self.data.setdefault(symbol, self._random_walk(symbol))
+        df = self.data[symbol]
+
+        # Match yfinance: start is inclusive and end is exclusive
+        if start_date is not None:
+            df = df[df.index >= pd.Timestamp(start_date)]
+        if end_date is not None:
+            df = df[df.index < pd.Timestamp(end_date)]
+        return df.copy()
+
+    def _random_walk(self, symbol: str) -> pd.DataFrame:
+        dates = pd.bdate_range(self.default_start, datetime.now().strftime('%Y-%m-%d'))
+        rng = np.random.default_rng(zlib.crc32(symbol.encode()))
+        close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, len(dates))))
+        open_ = close * (1 + rng.normal(0, 0.003, len(dates)))
+        spread = np.abs(rng.normal(0, 0.005, len(dates))) * close
+        return pd.DataFrame({
+            'Open': open_,
+            'High': np.maximum(open_, close) + spread,
+            'Low': np.minimum(open_, close) - spread,
+            'Close': close,
+            'Volume': rng.integers(1_000_000, 10_000_000, len(dates)).astype(float)
+        }, index=pd.DatetimeIndex(dates, name='Date'))
@@ -1,44 +1,123 @@
+import numpy as np
 import pandas as pd
 import requests
-from typing import Optional
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Dict, List, Optional, Tuple
+from datetime import datetime, timedelta
 from .base_provider import BaseDataProvider
+from src.utils.rate_limiter import RateLimiter
 
 class FinnhubProvider(BaseDataProvider):
-    def __init__(self, api_key: str):
+    """Finnhub candle client with a pooled session, rate limiting and chunked ranges.
+    
+    All requests share one keep-alive session whose adapter retries throttled
+    and failed responses with exponential backoff (honouring Retry-After), and
+    pass through a token bucket sized to the plan's calls per minute. Long
+    ranges are split into chunk_days windows, and the chunks of all requested
+    symbols are fetched by one pool of max_workers threads, matching the
+    session's connection pool size.
+    """
+    
+    def __init__(self, api_key: str, base_url: str = "https://finnhub.io/api/v1",
+                 calls_per_minute: int = 60, chunk_days: int = 365, max_workers: int = 4,
+                 max_retries: int = 3, timeout: float = 10.0):
         self.api_key = api_key
-        self.base_url = "https://finnhub.io/api/v1"
+        self.base_url = base_url
+        self.chunk_days = chunk_days
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self.rate_limiter = RateLimiter.per_minute(calls_per_minute)
+        self.session = self._create_session(max_workers, max_retries)
     
     def fetch_data(self, symbol: str, start_date: Optional[str] = None, end_date: Optional[str] = None) -> pd.DataFrame:
-        try:
-            # Convert dates to timestamps
-            start_ts = int(datetime.strptime(start_date, '%Y-%m-%d').timestamp()) if start_date else None
-            end_ts = int(datetime.strptime(end_date, '%Y-%m-%d').timestamp()) if end_date else int(datetime.now().timestamp())
-            
-            # Make API request
-            url = f"{self.base_url}/stock/candle"
-            params = {
-                'symbol': symbol,
-                'resolution': 'D',
-                'from': start_ts,
-                'to': end_ts,
-                'token': self.api_key
-            }
-            
-            response = requests.get(url, params=params)
-            data = response.json()
-            
-            if data['s'] == 'ok':
-                df = pd.DataFrame({
-                    'Open': data['o'],
-                    'High': data['h'],
-                    'Low': data['l'],
-                    'Close': data['c'],
-                    'Volume': data['v']
-                }, index=pd.to_datetime([datetime.fromtimestamp(t) for t in data['t']]))
-                return df
-            
+        return self.fetch_batch([symbol], start_date, end_date)[symbol]
+    
+    def fetch_batch(self, symbols: List[str], start_date: Optional[str] = None, end_date: Optional[str] = None) -> Dict[str, pd.DataFrame]:
+        """Fetch every (symbol, chunk) pair from one pool of max_workers threads
+        
+        A single pool keeps concurrent requests within the session's
+        connection pool; the shared rate limiter keeps the total within the plan.
+        """
+        # Convert dates to timestamps
+        start_ts = int(datetime.strptime(start_date, '%Y-%m-%d').timestamp()) if start_date else None
+        end_ts = int(datetime.strptime(end_date, '%Y-%m-%d').timestamp()) if end_date else int(datetime.now().timestamp())
+        
+        tasks = [(symbol, chunk) for symbol in symbols for chunk in self._chunk_range(start_ts, end_ts)]
+        with ThreadPoolExecutor(max_workers=max(1, min(self.max_workers, len(tasks)))) as executor:
+            futures = [executor.submit(self._fetch_chunk, symbol, *chunk) for symbol, chunk in tasks]
+        
+        frames = {symbol: [] for symbol in symbols}
+        for (symbol, _), future in zip(tasks, futures):
+            try:
+                frame = future.result()
+            except Exception as e:
+                raise Exception(f"Error fetching data from Finnhub for {symbol}: {str(e)}")
+            if not frame.empty:
+                frames[symbol].append(frame)
+        
+        results = {}
+        for symbol, symbol_frames in frames.items():
+            if not symbol_frames:
+                results[symbol] = pd.DataFrame()
+                continue
+            df = pd.concat(symbol_frames)
+            results[symbol] = df[~df.index.duplicated(keep='last')].sort_index()
+        return results
+    
+    def _fetch_chunk(self, symbol: str, start_ts: Optional[int], end_ts: int) -> pd.DataFrame:
+        # Make API request
+        url = f"{self.base_url}/stock/candle"
+        params = {
+            'symbol': symbol,
+            'resolution': 'D',
+            'from': start_ts,
+            'to': end_ts,
+            'token': self.api_key
+        }
+        
+        self.rate_limiter.acquire()
+        response = self.session.get(url, params=params, timeout=self.timeout)
+        response.raise_for_status()
+        data = response.json()
+        
+        if data.get('s') != 'ok':
             return pd.DataFrame()
-            
-        except Exception as e:
-            raise Exception(f"Error fetching data from Finnhub for {symbol}: {str(e)}")
\ No newline at end of file
+        
+        index = pd.to_datetime(np.asarray(data['t'], dtype='int64'), unit='s')
+        return pd.DataFrame({
+            'Open': data['o'],
+            'High': data['h'],
+            'Low': data['l'],
+            'Close': data['c'],
+            'Volume': data['v']
+        }, index=index)
+    
+    def _chunk_range(self, start_ts: Optional[int], end_ts: int) -> List[Tuple[Optional[int], int]]:
+        if start_ts is None:
+            return [(None, end_ts)]
+        
+        step = int(timedelta(days=self.chunk_days).total_seconds())
+        chunks = []
+        chunk_start = start_ts
+        while chunk_start <= end_ts:
+            chunk_end = min(chunk_start + step - 1, end_ts)
+            chunks.append((chunk_start, chunk_end))
+            chunk_start = chunk_end + 1
+        return chunks
+    
+    @staticmethod
+    def _create_session(pool_size: int, max_retries: int) -> requests.Session:
+        retry = Retry(
+            total=max_retries,
+            backoff_factor=0.5,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=['GET'],
+            respect_retry_after_header=True
+        )
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+        session = requests.Session()
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        return session
@@ -0,0 +1,131 @@
+import threading
+import time
+import pandas as pd
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, asdict
+from typing import Callable, Dict, List, Optional
+from .base_provider import BaseDataProvider
+
+@dataclass
+class ProviderStats:
+    name: str
+    calls: int = 0
+    errors: int = 0
+    consecutive_errors: int = 0
+    latency_ewma: Optional[float] = None
+    demoted_until: float = 0.0
+    
+    @property
+    def error_rate(self) -> float:
+        return self.errors / self.calls if self.calls else 0.0
+    
+    def is_demoted(self, now: float) -> bool:
+        return now < self.demoted_until
+
+class HedgedProvider(BaseDataProvider):
+    """Composite provider that hedges slow requests across an ordered provider list.
+    
+    The first healthy provider is asked first. If it has not answered within
+    latency_budget seconds (or fails), the next provider is asked too, and the
+    first successful answer wins. Slower requests keep running in the
+    background and still update the statistics. A provider with
+    max_consecutive_errors failures in a row, or whose smoothed latency
+    exceeds slow_factor times the budget, is demoted to the back of the order
+    for demotion_period seconds.
+    """
+    
+    def __init__(self, providers: List[BaseDataProvider], latency_budget: float = 2.0,
+                 max_consecutive_errors: int = 3, slow_factor: float = 3.0,
+                 demotion_period: float = 300.0, ewma_alpha: float = 0.2):
+        if not providers:
+            raise ValueError("HedgedProvider needs at least one provider")
+        self.providers = providers
+        self.latency_budget = latency_budget
+        self.max_consecutive_errors = max_consecutive_errors
+        self.slow_factor = slow_factor
+        self.demotion_period = demotion_period
+        self.ewma_alpha = ewma_alpha
+        self._stats = [ProviderStats(f'{type(p).__name__}[{i}]') for i, p in enumerate(providers)]
+        self._executor = ThreadPoolExecutor(max_workers=4 * len(providers))
+        self._lock = threading.Lock()
+    
+    def fetch_data(self, symbol: str, start_date: Optional[str] = None, end_date: Optional[str] = None) -> pd.DataFrame:
+        return self._hedged(lambda provider: provider.fetch_data(symbol, start_date, end_date), symbol)
+    
+    def fetch_batch(self, symbols: List[str], start_date: Optional[str] = None, end_date: Optional[str] = None) -> Dict[str, pd.DataFrame]:
+        return self._hedged(lambda provider: provider.fetch_batch(symbols, start_date, end_date), ', '.join(symbols))
+    
+    def stats(self) -> List[Dict]:
+        """Snapshot of per-provider latency and error statistics"""
+        with self._lock:
+            return [{**asdict(stats), 'error_rate': stats.error_rate} for stats in self._stats]
+    
+    def _ranked(self) -> List[int]:
+        now = time.monotonic()
+        with self._lock:
+            healthy = [i for i, stats in enumerate(self._stats) if not stats.is_demoted(now)]
+            demoted = sorted(
+                (i for i, stats in enumerate(self._stats) if stats.is_demoted(now)),
+                key=lambda i: self._stats[i].demoted_until
+            )
+        return healthy + demoted
+    
+    def _hedged(self, call: Callable[[BaseDataProvider], object], description: str):
+        pending: Dict[Future, int] = {}
+        errors = []
+        order = iter(self._ranked())
+        
+        def launch_next() -> bool:
+            index = next(order, None)
+            if index is None:
+                return False
+            pending[self._executor.submit(self._timed_call, index, call)] = index
+            return True
+        
+        launch_next()
+        while pending:
+            # Only wait for the budget while there is still someone to hedge to
+            done, _ = wait(list(pending), timeout=self.latency_budget, return_when=FIRST_COMPLETED)
+            if not done:
+                launch_next()
+                continue
+            
+            for future in done:
+                index = pending.pop(future)
+                try:
+                    return future.result()
+                except Exception as e:
+                    # Fail over straight away instead of waiting out the budget
+                    errors.append(f"{self._stats[index].name}: {str(e)}")
+                    launch_next()
+        
+        raise Exception(f"All providers failed for {description}: {'; '.join(errors)}")
+    
+    def _timed_call(self, index: int, call: Callable[[BaseDataProvider], object]):
+        started = time.monotonic()
+        try:
+            result = call(self.providers[index])
+        except Exception:
+            self._record(index, None)
+            raise
+        self._record(index, time.monotonic() - started)
+        return result
+    
+    def _record(self, index: int, latency: Optional[float]) -> None:
+        with self._lock:
+            stats = self._stats[index]
+            stats.calls += 1
+            if latency is None:
+                stats.errors += 1
+                stats.consecutive_errors += 1
+            else:
+                stats.consecutive_errors = 0
+                stats.latency_ewma = latency if stats.latency_ewma is None else (
+                    self.ewma_alpha * latency + (1 - self.ewma_alpha) * stats.latency_ewma
+                )
+            
+            too_many_errors = stats.consecutive_errors >= self.max_consecutive_errors
+            too_slow = stats.latency_ewma is not None and stats.latency_ewma > self.slow_factor * self.latency_budget
+            if too_many_errors or too_slow:
+                stats.demoted_until = time.monotonic() + self.demotion_period
+                stats.consecutive_errors = 0
@@ -0,0 +1,32 @@
+from .base_provider import BaseDataProvider
+from .cached_provider import CachedProvider
+
+def create_provider(config) -> BaseDataProvider:
+    """Build the data provider selected in config, wrapped in the bar cache if enabled"""
+    if config.data_provider == 'hedged':
+        from .hedged_provider import HedgedProvider
+        # Finnhub only joins the hedge when a key is configured
+        names = [name for name in config.hedged_providers if name != 'finnhub' or config.finnhub_api_key]
+        provider = HedgedProvider(
+            [_create_base_provider(name, config) for name in names],
+            latency_budget=config.hedge_latency_budget
+        )
+    else:
+        provider = _create_base_provider(config.data_provider, config)
+    
+    if config.use_bar_cache:
+        provider = CachedProvider(provider, cache_dir=config.bar_cache_dir,
+                                  max_size_mb=config.bar_cache_max_mb)
+    return provider
+
+def _create_base_provider(name: str, config) -> BaseDataProvider:
+    if name == 'yfinance':
+        from .yfinance_provider import YFinanceProvider
+        return YFinanceProvider()
+    if name == 'finnhub':
+        from .finnhub_provider import FinnhubProvider
+        if not config.finnhub_api_key:
+            raise ValueError("finnhub_api_key is required when using the 'finnhub' provider")
+        return FinnhubProvider(config.finnhub_api_key,
+                               calls_per_minute=config.finnhub_calls_per_minute)
+    raise ValueError(f"Unknown data provider: {name}")
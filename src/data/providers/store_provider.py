@@ -0,0 +1,21 @@
+import pandas as pd
+from typing import Optional
+from .base_provider import BaseDataProvider
+
+class StoreProvider(BaseDataProvider):
+    """Serve bars already persisted by a DataManager, e.g. streamed intraday bars.
+    
+    Lets DataLoader and the feature pipeline consume stored bars through the
+    same interface as the network providers.
+    """
+    
+    def __init__(self, data_manager, resolution: Optional[str] = None):
+        self.data_manager = data_manager
+        self.resolution = resolution
+    
+    def fetch_data(self, symbol: str, start_date: Optional[str] = None, end_date: Optional[str] = None) -> pd.DataFrame:
+        df = self.data_manager.get_data(symbol, start_date=start_date, resolution=self.resolution)
+        # Match the network providers: end_date is exclusive
+        if end_date is not None and not df.empty:
+            df = df[df.index < pd.Timestamp(end_date)]
+        return df
@@ -1,12 +1,34 @@
 import yfinance as yf
 import pandas as pd
-from typing import Optional
+from typing import Dict, List, Optional
 from .base_provider import BaseDataProvider
 
 class YFinanceProvider(BaseDataProvider):
     def fetch_data(self, symbol: str, start_date: Optional[str] = None, end_date: Optional[str] = None) -> pd.DataFrame:
         try:
-            df = yf.download(symbol, start=start_date, end=end_date)
+            df = yf.download(symbol, start=start_date, end=end_date, progress=False)
+            if isinstance(df.columns, pd.MultiIndex):
+                df.columns = df.columns.get_level_values(0)
             return df
         except Exception as e:
-            raise Exception(f"Error fetching data for {symbol}: {str(e)}")
\ No newline at end of file
+            raise Exception(f"Error fetching data for {symbol}: {str(e)}")
+    
+    def fetch_batch(self, symbols: List[str], start_date: Optional[str] = None, end_date: Optional[str] = None) -> Dict[str, pd.DataFrame]:
+        """Download all symbols in a single multi-symbol request"""
+        try:
+            df = yf.download(symbols, start=start_date, end=end_date,
+                             group_by='ticker', threads=False, progress=False)
+        except Exception as e:
+            raise Exception(f"Error fetching data for {', '.join(symbols)}: {str(e)}")
+        
+        results = {}
+        for symbol in symbols:
+            if isinstance(df.columns, pd.MultiIndex):
+                if symbol not in df.columns.get_level_values(0):
+                    continue
+                frame = df[symbol]
+            else:
+                frame = df
+            # Symbols yfinance could not fetch come back as all-NaN columns
+            results[symbol] = frame.dropna(how='all')
+        return results
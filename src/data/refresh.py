@@ -0,0 +1,144 @@
+import threading
+import time
+import pandas as pd
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Tuple
+from .providers.base_provider import BaseDataProvider
+from src.utils.rate_limiter import RateLimiter
+
+@dataclass
+class RefreshSummary:
+    fetched: Dict[str, int] = field(default_factory=dict)  # ticker -> new rows
+    up_to_date: List[str] = field(default_factory=list)
+    failed: Dict[str, str] = field(default_factory=dict)  # ticker -> last error
+    requests: int = 0
+    elapsed: float = 0.0
+    
+    def report(self) -> str:
+        lines = [
+            f"Refreshed {len(self.fetched)} tickers ({sum(self.fetched.values())} rows) "
+            f"in {self.elapsed:.1f}s using {self.requests} requests",
+            f"Already up to date: {len(self.up_to_date)}",
+            f"Failed: {len(self.failed)}"
+        ]
+        for ticker, error in sorted(self.failed.items()):
+            lines.append(f"  {ticker}: {error}")
+        return '\n'.join(lines)
+
+class WatchlistRefresher:
+    """Fetch many tickers concurrently, batching tickers that share a start date.
+    
+    Each batch is one multi-symbol request. If a batch request fails, its
+    tickers are retried one by one with exponential backoff, so a single bad
+    symbol never aborts the run. All requests go through a shared rate limiter.
+    """
+    
+    def __init__(self, provider: BaseDataProvider, max_workers: int = 8,
+                 rate_limit: Optional[float] = None, batch_size: int = 50,
+                 max_retries: int = 2, retry_delay: float = 1.0):
+        self.provider = provider
+        self.max_workers = max_workers
+        self.rate_limiter = RateLimiter(rate_limit) if rate_limit else None
+        self.batch_size = batch_size
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay
+        self._requests = 0
+        self._lock = threading.Lock()
+    
+    def run(self, plan: Dict[str, Optional[str]], end_date: Optional[str],
+            on_data: Callable[[str, pd.DataFrame], None]) -> RefreshSummary:
+        """Fetch every ticker in plan (ticker -> start date) and hand new rows to on_data
+        
+        on_data is always called from the calling thread, so it may write to
+        storage without extra locking.
+        """
+        summary = RefreshSummary()
+        started = time.perf_counter()
+        self._requests = 0
+        
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = [
+                executor.submit(self._fetch_batch, batch, start_date, end_date)
+                for start_date, batch in self._batches(plan)
+            ]
+            for future in as_completed(futures):
+                results, errors = future.result()
+                for ticker, data in results.items():
+                    data = data.dropna()
+                    if data.empty:
+                        if self._expects_bars(plan[ticker], end_date):
+                            summary.failed[ticker] = f"No data returned since {plan[ticker] or 'the start'}"
+                        else:
+                            summary.up_to_date.append(ticker)
+                        continue
+                    try:
+                        on_data(ticker, data)
+                        summary.fetched[ticker] = len(data)
+                    except Exception as e:
+                        summary.failed[ticker] = f"Error saving data: {str(e)}"
+                summary.failed.update(errors)
+        
+        summary.requests = self._requests
+        summary.elapsed = time.perf_counter() - started
+        return summary
+    
+    @staticmethod
+    def _expects_bars(start_date: Optional[str], end_date: Optional[str]) -> bool:
+        """Whether [start_date, end_date) holds a business day, so an empty result means a failed fetch"""
+        if start_date is None:
+            return True
+        end = pd.Timestamp(end_date) if end_date else pd.Timestamp.now().normalize()
+        return len(pd.bdate_range(start_date, end - pd.Timedelta(days=1))) > 0
+    
+    def _batches(self, plan: Dict[str, Optional[str]]) -> List[Tuple[Optional[str], List[str]]]:
+        groups = defaultdict(list)
+        for ticker, start_date in plan.items():
+            groups[start_date].append(ticker)
+        
+        batches = []
+        for start_date, tickers in groups.items():
+            for i in range(0, len(tickers), self.batch_size):
+                batches.append((start_date, tickers[i:i + self.batch_size]))
+        return batches
+    
+    def _fetch_batch(self, tickers: List[str], start_date: Optional[str],
+                     end_date: Optional[str]) -> Tuple[Dict[str, pd.DataFrame], Dict[str, str]]:
+        results, errors = {}, {}
+        try:
+            self._throttle()
+            results = self.provider.fetch_batch(tickers, start_date, end_date)
+        except Exception as e:
+            errors = {ticker: str(e) for ticker in tickers}
+        
+        # Retry failed or missing tickers individually
+        for ticker in tickers:
+            if ticker in results:
+                continue
+            data, error = self._fetch_single(ticker, start_date, end_date)
+            if data is not None:
+                results[ticker] = data
+                errors.pop(ticker, None)
+            else:
+                errors[ticker] = error
+        return results, errors
+    
+    def _fetch_single(self, ticker: str, start_date: Optional[str],
+                      end_date: Optional[str]) -> Tuple[Optional[pd.DataFrame], Optional[str]]:
+        error = None
+        for attempt in range(self.max_retries + 1):
+            if attempt:
+                time.sleep(self.retry_delay * 2 ** (attempt - 1))
+            try:
+                self._throttle()
+                return self.provider.fetch_data(ticker, start_date, end_date), None
+            except Exception as e:
+                error = str(e)
+        return None, error
+    
+    def _throttle(self) -> None:
+        with self._lock:
+            self._requests += 1
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire()
@@ -0,0 +1,90 @@
+import os
+import pickle
+import threading
+import time
+from typing import Any, Callable, Dict, Optional
+
+class FundamentalsCache:
+    """Persistent per-symbol snapshot of upstream fundamentals payloads.
+    
+    Each payload (``info``, ``recommendations``, ``earnings``, ``calendar``)
+    is fetched at most once per TTL and kept both in memory and in a pickle
+    per symbol, so every accessor in a run, and later runs, share one fetch.
+    If a refresh fails, the stale value is served instead of nothing.
+    """
+    
+    DEFAULT_TTLS = {
+        'info': 24 * 3600,
+        'recommendations': 24 * 3600,
+        'earnings': 24 * 3600,
+        'calendar': 12 * 3600
+    }
+    
+    def __init__(self, cache_dir: str = 'data/cache/fundamentals',
+                 ttls: Optional[Dict[str, float]] = None, default_ttl: float = 24 * 3600):
+        self.cache_dir = cache_dir
+        os.makedirs(cache_dir, exist_ok=True)
+        self.ttls = {**self.DEFAULT_TTLS, **(ttls or {})}
+        self.default_ttl = default_ttl
+        self._snapshots: Dict[str, Dict[str, Dict]] = {}
+        self._lock = threading.Lock()
+    
+    def get(self, symbol: str, field: str, fetch: Callable[[], Any]) -> Any:
+        """Return the cached payload if fresh, otherwise fetch and persist it"""
+        entry = self._snapshot(symbol).get(field)
+        if entry is not None and self.is_fresh(entry, field):
+            return entry['value']
+        
+        try:
+            value = fetch()
+        except Exception as e:
+            if entry is not None:
+                print(f"Error refreshing {field} for {symbol}, using cached value: {str(e)}")
+                return entry['value']
+            raise
+        
+        with self._lock:
+            snapshot = self._snapshot(symbol)
+            snapshot[field] = {'value': value, 'fetched_at': time.time()}
+            self._save(symbol, snapshot)
+        return value
+    
+    def is_fresh(self, entry: Dict, field: str) -> bool:
+        return time.time() - entry['fetched_at'] < self.ttls.get(field, self.default_ttl)
+    
+    def stale_fields(self, symbol: str, fields) -> list:
+        snapshot = self._snapshot(symbol)
+        return [
+            field for field in fields
+            if field not in snapshot or not self.is_fresh(snapshot[field], field)
+        ]
+    
+    def invalidate(self, symbol: str) -> None:
+        with self._lock:
+            self._snapshots.pop(symbol, None)
+            path = self._file_path(symbol)
+            if os.path.exists(path):
+                os.remove(path)
+    
+    def _snapshot(self, symbol: str) -> Dict[str, Dict]:
+        if symbol not in self._snapshots:
+            path = self._file_path(symbol)
+            snapshot = {}
+            if os.path.exists(path):
+                try:
+                    with open(path, 'rb') as f:
+                        snapshot = pickle.load(f)
+                except Exception:
+                    snapshot = {}
+            self._snapshots[symbol] = snapshot
+        return self._snapshots[symbol]
+    
+    def _save(self, symbol: str, snapshot: Dict[str, Dict]) -> None:
+        path = self._file_path(symbol)
+        tmp_path = f'{path}.tmp'
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(snapshot, f)
+        os.replace(tmp_path, path)
+    
+    def _file_path(self, symbol: str) -> str:
+        return os.path.join(self.cache_dir, f'{symbol}.pkl')
@@ -1,25 +1,51 @@
 import yfinance as yf
-from bs4 import BeautifulSoup
-import requests
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional
+from .fundamentals_cache import FundamentalsCache
 
 class YahooFinanceScraper:
-    def __init__(self, symbol: str):
+    FIELDS = ['info', 'recommendations', 'earnings', 'calendar']
+    
+    def __init__(self, symbol: str, cache: Optional[FundamentalsCache] = None):
         self.symbol = symbol
         self.ticker = yf.Ticker(symbol)
+        self.cache = cache if cache is not None else FundamentalsCache()
+    
+    @classmethod
+    def refresh_watchlist(cls, symbols: List[str], max_workers: int = 8,
+                          cache: Optional[FundamentalsCache] = None) -> Dict[str, Dict[str, Any]]:
+        """Refresh stale fundamentals for many symbols concurrently"""
+        cache = cache if cache is not None else FundamentalsCache()
+        
+        def refresh(symbol: str) -> Dict[str, Any]:
+            scraper = cls(symbol, cache)
+            errors = {}
+            for field in cache.stale_fields(symbol, cls.FIELDS):
+                try:
+                    scraper._get(field)
+                except Exception as e:
+                    errors[field] = str(e)
+            return errors
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return dict(zip(symbols, executor.map(refresh, symbols)))
+    
+    def _get(self, field: str) -> Any:
+        """Read an upstream payload through the fundamentals cache"""
+        return self.cache.get(self.symbol, field, lambda: getattr(self.ticker, field))
     
     def get_analyst_data(self) -> Dict[str, Any]:
         """Get analyst recommendations and price targets"""
         try:
             # Get analyst recommendations
-            recommendations = self.ticker.recommendations
+            recommendations = self._get('recommendations')
             if recommendations is not None:
                 recommendations = recommendations.tail()
             
             # Get analyst price targets
-            target_data = self.ticker.info
+            target_data = self._get('info')
             return {
                 'recommendations': recommendations,
                 'current_price': target_data.get('currentPrice'),
@@ -36,8 +62,8 @@ class YahooFinanceScraper:
         """Get earnings data and next earnings date"""
         try:
             # Get earnings data
-            earnings = self.ticker.earnings
-            next_earnings = self.ticker.calendar
+            earnings = self._get('earnings')
+            next_earnings = self._get('calendar')
             
             return {
                 'historical_earnings': earnings,
@@ -50,7 +76,7 @@ class YahooFinanceScraper:
     def get_financials(self) -> Dict[str, Any]:
         """Get key financial metrics"""
         try:
-            info = self.ticker.info
+            info = self._get('info')
             return {
                 'market_cap': info.get('marketCap'),
                 'pe_ratio': info.get('forwardPE'),
@@ -63,4 +89,4 @@ class YahooFinanceScraper:
         except Exception as e:
             print(f"Error fetching financial data: {str(e)}")
             return {}
-        
\ No newline at end of file
+    
@@ -0,0 +1,102 @@
+import queue
+import threading
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+from typing import Iterator, Optional, Tuple
+
+class SequenceDataset:
+    """Lookback windows over a 2-D (time, features) array without copying it.
+
+    Window i covers rows i .. i + lookback - 1 and is paired with the target
+    of its last row, so windows and targets line up with rows lookback - 1
+    onwards. ``windows`` is a strided view of shape
+    (n_windows, lookback, n_features); only batches are materialized, so
+    peak memory is the feature matrix plus one batch (times the prefetch
+    depth) whatever the lookback.
+    """
+
+    def __init__(self, X: np.ndarray, y: Optional[np.ndarray] = None, lookback: int = 20):
+        X = np.asarray(X, dtype=np.float32)
+        if X.ndim != 2:
+            raise ValueError(f"Expected a 2-D (time, features) array, got shape {X.shape}")
+        if len(X) < lookback:
+            raise ValueError(f"Need at least {lookback} rows for a lookback of {lookback}, got {len(X)}")
+        self.X = X
+        self.lookback = lookback
+        self.windows = sliding_window_view(X, (lookback, X.shape[1]))[:, 0]
+        self.targets = None if y is None else np.asarray(y, dtype=np.float32)[lookback - 1:]
+        if self.targets is not None and len(self.targets) != len(self.windows):
+            raise ValueError(f"X has {len(X)} rows but y has {len(y)}")
+
+    @property
+    def n_features(self) -> int:
+        return self.X.shape[1]
+
+    def __len__(self) -> int:
+        return len(self.windows)
+
+    def batches(self, batch_size: int = 32, shuffle: bool = False,
+                seed: Optional[int] = None) -> Iterator[Tuple[np.ndarray, Optional[np.ndarray]]]:
+        """(windows, targets) batches; each batch is the only copy made"""
+        order = np.arange(len(self))
+        if shuffle:
+            np.random.default_rng(seed).shuffle(order)
+        for start in range(0, len(order), batch_size):
+            index = order[start:start + batch_size]
+            if not shuffle:
+                index = slice(index[0], index[-1] + 1)
+            X_batch = np.ascontiguousarray(self.windows[index])
+            y_batch = None if self.targets is None else self.targets[index]
+            yield X_batch, y_batch
+
+    def prefetch_batches(self, batch_size: int = 32, shuffle: bool = False, seed: Optional[int] = None,
+                         prefetch: int = 2) -> Iterator[Tuple[np.ndarray, Optional[np.ndarray]]]:
+        """batches() assembled ahead in a background thread, at most prefetch at a time"""
+        buffer = queue.Queue(maxsize=prefetch)
+        done = object()
+        stop = threading.Event()
+
+        def produce():
+            try:
+                for batch in self.batches(batch_size, shuffle, seed):
+                    while not stop.is_set():
+                        try:
+                            buffer.put(batch, timeout=0.1)
+                            break
+                        except queue.Full:
+                            continue
+                    if stop.is_set():
+                        return
+            finally:
+                if not stop.is_set():
+                    buffer.put(done)
+
+        threading.Thread(target=produce, daemon=True).start()
+        try:
+            while True:
+                batch = buffer.get()
+                if batch is done:
+                    return
+                yield batch
+        finally:
+            stop.set()
+
+    def to_tf_dataset(self, batch_size: int = 32, shuffle: bool = False, seed: Optional[int] = None):
+        """tf.data pipeline streaming batches from the strided view, prefetched by TensorFlow
+        
+        With shuffle, every pass over the dataset (every epoch) uses a new order.
+        """
+        import tensorflow as tf
+
+        rng = np.random.default_rng(seed)
+        epoch_batches = lambda: self.batches(batch_size, shuffle, int(rng.integers(2 ** 32)))
+        window_spec = tf.TensorSpec(shape=(None, self.lookback, self.n_features), dtype=tf.float32)
+        if self.targets is None:
+            generator = lambda: (X_batch for X_batch, _ in epoch_batches())
+            signature = window_spec
+        else:
+            generator = epoch_batches
+            signature = (window_spec, tf.TensorSpec(shape=(None,), dtype=tf.float32))
+
+        dataset = tf.data.Dataset.from_generator(generator, output_signature=signature)
+        return dataset.prefetch(tf.data.AUTOTUNE)
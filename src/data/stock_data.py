@@ -1,15 +1,21 @@
-import yfinance as yf
 import pandas as pd
 from datetime import datetime, timedelta
+from typing import Optional
+from .providers.base_provider import BaseDataProvider
 
-def fetch_stock_data(symbol: str) -> pd.DataFrame:
-    """Fetch stock data from Yahoo Finance"""
+def fetch_stock_data(symbol: str, provider: Optional[BaseDataProvider] = None) -> pd.DataFrame:
+    """Fetch stock data through the configured (cached) provider"""
     print(f"Fetching data for {symbol}...")
     
+    if provider is None:
+        from .providers.provider_factory import create_provider
+        from src.utils.config import ModelConfig
+        provider = create_provider(ModelConfig())
+    
     # Calculate start date (2 years ago from today)
     end_date = datetime.now()
     start_date = end_date - timedelta(days=730)  # 730 days = 2 years
     
-    df = yf.download(symbol, start=start_date.strftime('%Y-%m-%d'), end=end_date.strftime('%Y-%m-%d'))
+    df = provider.fetch_data(symbol, start_date.strftime('%Y-%m-%d'), end_date.strftime('%Y-%m-%d'))
     df.columns = df.columns.map(lambda x: x if isinstance(x, str) else x[0])
-    return df
\ No newline at end of file
+    return df
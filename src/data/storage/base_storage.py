@@ -0,0 +1,80 @@
+import os
+from abc import ABC, abstractmethod
+import pandas as pd
+from typing import Dict, List, Optional
+from .manifest import StorageManifest
+
+class BaseStorage(ABC):
+    """Storage engine used by DataManager to persist OHLCV bars per ticker."""
+
+    INDEX_NAME = 'Date'
+    MANIFEST_FILE = 'manifest.json'
+
+    def __init__(self, root: str):
+        self.root = root
+        os.makedirs(root, exist_ok=True)
+        self.manifest = StorageManifest(os.path.join(root, self.MANIFEST_FILE))
+
+    def append(self, ticker: str, data: pd.DataFrame) -> None:
+        """Persist new rows for a ticker; rows with existing dates replace old ones"""
+        data = self._normalize(data)
+        if data.empty:
+            return
+
+        # Only rows overlapping the stored range can be duplicates
+        duplicate_rows = 0
+        last_date = self.last_date(ticker)
+        if last_date is not None and data.index[0] <= last_date:
+            stored = self.read(ticker, columns=[], start_date=data.index[0], end_date=last_date)
+            duplicate_rows = int(data.index.isin(stored.index).sum())
+
+        self._write(ticker, data)
+        self.manifest.record(ticker, data, duplicate_rows)
+
+    def describe(self, ticker: str) -> Optional[Dict]:
+        """Manifest entry for a ticker, rebuilt from the data if it predates the manifest"""
+        entry = self.manifest.get(ticker)
+        if entry is None and ticker in self.tickers():
+            data = self.read(ticker)
+            if not data.empty:
+                self.manifest.record(ticker, self._normalize(data))
+                entry = self.manifest.get(ticker)
+        return entry
+
+    def last_date(self, ticker: str) -> Optional[pd.Timestamp]:
+        entry = self.describe(ticker)
+        return pd.Timestamp(entry['last_date']) if entry else None
+
+    @abstractmethod
+    def _write(self, ticker: str, data: pd.DataFrame) -> None:
+        """Write a normalized, date-sorted batch of rows for a ticker"""
+        pass
+
+    @abstractmethod
+    def read(self, ticker: str, columns: Optional[List[str]] = None,
+             start_date: Optional[str] = None, end_date: Optional[str] = None) -> pd.DataFrame:
+        """Read stored rows for a ticker, optionally projected to columns and a date range"""
+        pass
+
+    @abstractmethod
+    def tickers(self) -> List[str]:
+        """List tickers that have stored data"""
+        pass
+
+    def _normalize(self, data: pd.DataFrame) -> pd.DataFrame:
+        data = data.copy()
+        if isinstance(data.columns, pd.MultiIndex):
+            data.columns = data.columns.get_level_values(0)
+        data.index = pd.DatetimeIndex(data.index, name=self.INDEX_NAME)
+        data = data[~data.index.duplicated(keep='last')]
+        return data.sort_index()
+
+    @staticmethod
+    def _slice_dates(data: pd.DataFrame, start_date: Optional[str] = None,
+                     end_date: Optional[str] = None) -> pd.DataFrame:
+        """Restrict a date-indexed frame to the inclusive [start_date, end_date] range"""
+        if start_date is not None:
+            data = data[data.index >= pd.Timestamp(start_date)]
+        if end_date is not None:
+            data = data[data.index <= pd.Timestamp(end_date)]
+        return data
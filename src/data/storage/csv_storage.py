@@ -0,0 +1,42 @@
+import os
+import pandas as pd
+from typing import List, Optional
+from .base_storage import BaseStorage
+
+class CsvStorage(BaseStorage):
+    """One CSV file per ticker; every append rewrites the ticker's file."""
+
+    def _write(self, ticker: str, data: pd.DataFrame) -> None:
+        existing_data = self.read(ticker)
+        if not existing_data.empty:
+            data = pd.concat([existing_data, data])
+            data = data[~data.index.duplicated(keep='last')]
+
+        data.sort_index().to_csv(self._file_path(ticker))
+
+    def read(self, ticker: str, columns: Optional[List[str]] = None,
+             start_date: Optional[str] = None, end_date: Optional[str] = None) -> pd.DataFrame:
+        file_path = self._file_path(ticker)
+        if not os.path.exists(file_path):
+            return pd.DataFrame()
+
+        usecols = None
+        if columns is not None:
+            # Position 0 is the date index and must always be parsed
+            header = self._header(file_path)
+            usecols = [0] + [i for i, col in enumerate(header) if i > 0 and col in columns]
+        data = pd.read_csv(file_path, index_col=0, parse_dates=True, usecols=usecols)
+        return self._slice_dates(data, start_date, end_date)
+
+    def tickers(self) -> List[str]:
+        return sorted(
+            name[:-len('.csv')] for name in os.listdir(self.root) if name.endswith('.csv')
+        )
+
+    def _file_path(self, ticker: str) -> str:
+        return os.path.join(self.root, f'{ticker}.csv')
+
+    @staticmethod
+    def _header(file_path: str) -> List[str]:
+        with open(file_path, 'r') as f:
+            return f.readline().rstrip('\n').split(',')
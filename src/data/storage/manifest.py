@@ -0,0 +1,102 @@
+import json
+import os
+import hashlib
+import pandas as pd
+from contextlib import contextmanager
+from datetime import datetime
+from typing import Dict, List, Optional
+
+class StorageManifest:
+    """Per-ticker metadata kept next to a store in ``manifest.json``.
+
+    Each entry records the first and last timestamp, row count, column schema
+    and a checksum chained over every appended batch, so callers can plan
+    incremental updates without opening any data files.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.entries = self._load()
+        self._deferred = 0
+        self._dirty = False
+
+    def get(self, ticker: str) -> Optional[Dict]:
+        return self.entries.get(ticker)
+
+    def tickers(self) -> List[str]:
+        return sorted(self.entries)
+
+    def first_date(self, ticker: str) -> Optional[pd.Timestamp]:
+        entry = self.get(ticker)
+        return pd.Timestamp(entry['first_date']) if entry else None
+
+    def last_date(self, ticker: str) -> Optional[pd.Timestamp]:
+        entry = self.get(ticker)
+        return pd.Timestamp(entry['last_date']) if entry else None
+
+    def record(self, ticker: str, data: pd.DataFrame, duplicate_rows: int = 0) -> None:
+        """Fold a newly appended batch into the ticker's entry"""
+        if data.empty:
+            return
+
+        entry = self.entries.get(ticker)
+        schema = {str(col): str(dtype) for col, dtype in data.dtypes.items()}
+        first_date, last_date = data.index[0], data.index[-1]
+        previous_checksum = ''
+        rows = len(data) - duplicate_rows
+
+        if entry:
+            first_date = min(first_date, pd.Timestamp(entry['first_date']))
+            last_date = max(last_date, pd.Timestamp(entry['last_date']))
+            schema = {**entry['schema'], **schema}
+            previous_checksum = entry['checksum']
+            rows += entry['rows']
+
+        self.entries[ticker] = {
+            'first_date': first_date.isoformat(),
+            'last_date': last_date.isoformat(),
+            'rows': int(rows),
+            'schema': schema,
+            'checksum': self._chain_checksum(previous_checksum, data),
+            'updated': datetime.now().isoformat()
+        }
+        self._mark_dirty()
+
+    def remove(self, ticker: str) -> None:
+        if self.entries.pop(ticker, None) is not None:
+            self._mark_dirty()
+
+    @contextmanager
+    def deferred(self):
+        """Batch many updates into a single manifest write"""
+        self._deferred += 1
+        try:
+            yield self
+        finally:
+            self._deferred -= 1
+            if self._deferred == 0 and self._dirty:
+                self.save()
+
+    def save(self) -> None:
+        # Write to a temporary file first so a crash never leaves a torn manifest
+        tmp_path = f'{self.path}.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump(self.entries, f, indent=2)
+        os.replace(tmp_path, self.path)
+        self._dirty = False
+
+    def _mark_dirty(self) -> None:
+        self._dirty = True
+        if self._deferred == 0:
+            self.save()
+
+    def _load(self) -> Dict:
+        if os.path.exists(self.path):
+            with open(self.path, 'r') as f:
+                return json.load(f)
+        return {}
+
+    @staticmethod
+    def _chain_checksum(previous: str, data: pd.DataFrame) -> str:
+        batch_hash = pd.util.hash_pandas_object(data, index=True).values.tobytes()
+        return hashlib.sha256(previous.encode() + batch_hash).hexdigest()
@@ -0,0 +1,102 @@
+import os
+import time
+import pandas as pd
+from typing import List, Optional
+from .base_storage import BaseStorage
+
+class ParquetStorage(BaseStorage):
+    """Columnar storage partitioned as ``{root}/{ticker}/year={YYYY}/part-*.parquet``.
+
+    Appends write new part files instead of rewriting history, so a daily
+    refresh costs I/O proportional to the new bars only. Reads prune year
+    partitions outside the requested date range and only load the requested
+    columns. Rows written later win when dates overlap; ``compact`` merges the
+    parts of a partition once they accumulate.
+    """
+
+    def __init__(self, root: str):
+        super().__init__(root)
+        self._last_part_id = 0
+
+    def _write(self, ticker: str, data: pd.DataFrame) -> None:
+        for year, rows in data.groupby(data.index.year):
+            partition = self._partition_path(ticker, int(year))
+            os.makedirs(partition, exist_ok=True)
+            rows.to_parquet(os.path.join(partition, f'part-{self._next_part_id():020d}.parquet'))
+
+    def read(self, ticker: str, columns: Optional[List[str]] = None,
+             start_date: Optional[str] = None, end_date: Optional[str] = None) -> pd.DataFrame:
+        start = pd.Timestamp(start_date) if start_date is not None else None
+        end = pd.Timestamp(end_date) if end_date is not None else None
+
+        filters = []
+        if start is not None:
+            filters.append((self.INDEX_NAME, '>=', start))
+        if end is not None:
+            filters.append((self.INDEX_NAME, '<=', end))
+
+        frames = []
+        for year in self._years(ticker):
+            if (start is not None and year < start.year) or (end is not None and year > end.year):
+                continue
+            for part in self._parts(ticker, year):
+                frames.append(pd.read_parquet(part, columns=columns, filters=filters or None))
+
+        # Index-only reads (columns=[]) have no columns but still carry rows
+        frames = [frame for frame in frames if len(frame)]
+        if not frames:
+            return pd.DataFrame()
+
+        data = pd.concat(frames)
+        data = data[~data.index.duplicated(keep='last')]
+        return data.sort_index()
+
+    def tickers(self) -> List[str]:
+        return sorted(
+            name for name in os.listdir(self.root)
+            if os.path.isdir(os.path.join(self.root, name))
+        )
+
+    def compact(self, ticker: str, year: Optional[int] = None) -> None:
+        """Merge the part files of a ticker's partitions into a single part each"""
+        years = [year] if year is not None else self._years(ticker)
+        for partition_year in years:
+            parts = self._parts(ticker, partition_year)
+            if len(parts) < 2:
+                continue
+
+            data = pd.concat(pd.read_parquet(part) for part in parts)
+            data = data[~data.index.duplicated(keep='last')].sort_index()
+
+            # Write the merged part first so a crash never loses rows
+            partition = self._partition_path(ticker, partition_year)
+            data.to_parquet(os.path.join(partition, f'part-{self._next_part_id():020d}.parquet'))
+            for part in parts:
+                os.remove(part)
+
+    def _next_part_id(self) -> int:
+        # Part names sort in write order, which defines which duplicate wins on read
+        self._last_part_id = max(time.time_ns(), self._last_part_id + 1)
+        return self._last_part_id
+
+    def _ticker_path(self, ticker: str) -> str:
+        return os.path.join(self.root, ticker)
+
+    def _partition_path(self, ticker: str, year: int) -> str:
+        return os.path.join(self._ticker_path(ticker), f'year={year}')
+
+    def _years(self, ticker: str) -> List[int]:
+        ticker_path = self._ticker_path(ticker)
+        if not os.path.isdir(ticker_path):
+            return []
+        return sorted(
+            int(name.split('=', 1)[1]) for name in os.listdir(ticker_path)
+            if name.startswith('year=')
+        )
+
+    def _parts(self, ticker: str, year: int) -> List[str]:
+        partition = self._partition_path(ticker, year)
+        return [
+            os.path.join(partition, name) for name in sorted(os.listdir(partition))
+            if name.startswith('part-') and name.endswith('.parquet')
+        ]
@@ -0,0 +1,99 @@
+import pandas as pd
+from typing import AsyncIterable, AsyncIterator, Dict, Iterable, Iterator, List, NamedTuple, Tuple
+
+class Trade(NamedTuple):
+    timestamp: pd.Timestamp
+    symbol: str
+    price: float
+    size: float
+
+class Bar(NamedTuple):
+    symbol: str
+    resolution: str
+    start: pd.Timestamp
+    open: float
+    high: float
+    low: float
+    close: float
+    volume: float
+
+class BarAggregator:
+    """Build OHLCV bars at several resolutions from a stream of trades.
+    
+    A bar is emitted as soon as a trade for the same symbol falls into a later
+    bucket, so completed bars trail the feed by at most one trade. Trades
+    older than the symbol's open bucket are counted in ``late_trades`` and
+    dropped. Call ``flush`` at the end of the stream to emit the open bars.
+    """
+    
+    def __init__(self, resolutions: Iterable[str] = ('1min', '5min')):
+        self.resolutions = list(resolutions)
+        self._bucket_ns = {res: pd.Timedelta(res).value for res in self.resolutions}
+        # (symbol, resolution) -> [bucket_start_ns, open, high, low, close, volume]
+        self._open_bars: Dict[Tuple[str, str], list] = {}
+        self.late_trades = 0
+    
+    def update(self, trade: Trade) -> List[Bar]:
+        """Add one trade and return the bars it completed"""
+        ts = pd.Timestamp(trade.timestamp).value
+        completed = []
+        for resolution, bucket_ns in self._bucket_ns.items():
+            bucket = ts - ts % bucket_ns
+            key = (trade.symbol, resolution)
+            state = self._open_bars.get(key)
+            
+            if state is None or bucket > state[0]:
+                if state is not None:
+                    completed.append(self._to_bar(key, state))
+                self._open_bars[key] = [bucket, trade.price, trade.price, trade.price, trade.price, trade.size]
+            elif bucket == state[0]:
+                state[2] = max(state[2], trade.price)
+                state[3] = min(state[3], trade.price)
+                state[4] = trade.price
+                state[5] += trade.size
+            else:
+                self.late_trades += 1
+        return completed
+    
+    def flush(self) -> List[Bar]:
+        """Emit and clear all open bars"""
+        bars = [self._to_bar(key, state) for key, state in self._open_bars.items()]
+        self._open_bars.clear()
+        return sorted(bars, key=lambda bar: (bar.start, bar.symbol, bar.resolution))
+    
+    def aggregate(self, trades: Iterable[Trade], flush: bool = True) -> Iterator[Bar]:
+        for trade in trades:
+            yield from self.update(trade)
+        if flush:
+            yield from self.flush()
+    
+    async def aggregate_async(self, trades: AsyncIterable[Trade], flush: bool = True) -> AsyncIterator[Bar]:
+        async for trade in trades:
+            for bar in self.update(trade):
+                yield bar
+        if flush:
+            for bar in self.flush():
+                yield bar
+    
+    @staticmethod
+    def _to_bar(key: Tuple[str, str], state: list) -> Bar:
+        symbol, resolution = key
+        return Bar(symbol, resolution, pd.Timestamp(state[0]), *state[1:])
+
+def bars_to_frame(bars: Iterable[Bar]) -> pd.DataFrame:
+    """Convert bars of one symbol and resolution into the usual OHLCV frame"""
+    bars = list(bars)
+    return pd.DataFrame({
+        'Open': [bar.open for bar in bars],
+        'High': [bar.high for bar in bars],
+        'Low': [bar.low for bar in bars],
+        'Close': [bar.close for bar in bars],
+        'Volume': [bar.volume for bar in bars]
+    }, index=pd.DatetimeIndex([bar.start for bar in bars], name='Date'))
+
+def replay_trades(path: str, chunksize: int = 100_000) -> Iterator[Trade]:
+    """Stream trades from a CSV with timestamp, symbol, price and size columns"""
+    for chunk in pd.read_csv(path, chunksize=chunksize):
+        timestamps = pd.to_datetime(chunk['timestamp'])
+        for ts, symbol, price, size in zip(timestamps, chunk['symbol'], chunk['price'], chunk['size']):
+            yield Trade(ts, symbol, float(price), float(size))
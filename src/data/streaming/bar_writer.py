@@ -0,0 +1,62 @@
+import time
+from collections import defaultdict
+from typing import AsyncIterable, Dict, Iterable, List, Tuple
+from .bar_aggregator import Bar, BarAggregator, Trade, bars_to_frame
+
+class BarWriter:
+    """Buffer completed bars and flush them to a DataManager store in micro-batches.
+    
+    Buffered bars are written once batch_size bars are pending or
+    flush_interval seconds have passed, with one storage append per symbol
+    and resolution, so the store never rewrites a file per bar.
+    """
+    
+    def __init__(self, data_manager, batch_size: int = 500, flush_interval: float = 5.0):
+        self.data_manager = data_manager
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._buffer: Dict[Tuple[str, str], List[Bar]] = defaultdict(list)
+        self._pending = 0
+        self._last_flush = time.monotonic()
+        self.bars_written = 0
+    
+    def write(self, bars: Iterable[Bar]) -> None:
+        for bar in bars:
+            self._buffer[(bar.symbol, bar.resolution)].append(bar)
+            self._pending += 1
+        
+        if self._pending >= self.batch_size or time.monotonic() - self._last_flush >= self.flush_interval:
+            self.flush()
+    
+    def flush(self) -> None:
+        with self.data_manager.storage.manifest.deferred():
+            for (symbol, resolution), bars in self._buffer.items():
+                if bars:
+                    key = self.data_manager.bar_key(symbol, resolution)
+                    self.data_manager.storage.append(key, bars_to_frame(bars))
+                    self.bars_written += len(bars)
+        self._buffer.clear()
+        self._pending = 0
+        self._last_flush = time.monotonic()
+
+def stream_to_store(trades: Iterable[Trade], data_manager, resolutions: Iterable[str] = ('1min', '5min'),
+                    batch_size: int = 500, flush_interval: float = 5.0) -> int:
+    """Aggregate a trade stream into bars and persist them; returns the number of bars written"""
+    aggregator = BarAggregator(resolutions)
+    writer = BarWriter(data_manager, batch_size, flush_interval)
+    for trade in trades:
+        writer.write(aggregator.update(trade))
+    writer.write(aggregator.flush())
+    writer.flush()
+    return writer.bars_written
+
+async def stream_to_store_async(trades: AsyncIterable[Trade], data_manager,
+                                resolutions: Iterable[str] = ('1min', '5min'),
+                                batch_size: int = 500, flush_interval: float = 5.0) -> int:
+    aggregator = BarAggregator(resolutions)
+    writer = BarWriter(data_manager, batch_size, flush_interval)
+    async for trade in trades:
+        writer.write(aggregator.update(trade))
+    writer.write(aggregator.flush())
+    writer.flush()
+    return writer.bars_written
@@ -0,0 +1,109 @@
+import os
+import joblib
+import numpy as np
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence
+
+@dataclass
+class DriftReport:
+    psi: Dict[str, float]
+    baseline_rmse: Optional[float]
+    recent_rmse: Optional[float]
+    reasons: List[str] = field(default_factory=list)
+
+    @property
+    def needs_retrain(self) -> bool:
+        return bool(self.reasons)
+
+class DriftDetector:
+    """Decides whether incremental updates are still enough or a full retrain is due.
+
+    Feature drift is measured with the population stability index (PSI) of
+    each feature in all rows checked so far against the last reference_rows
+    training rows, using decile bins of the reference. PSI is only computed
+    once min_rows new rows have accumulated, since a few days of data give
+    meaningless bin shares. Performance drift compares the RMSE on the rows
+    of each check (predicted before the model sees them) with a baseline
+    RMSE; if no baseline is given, the first check's RMSE becomes the
+    baseline.
+    """
+
+    def __init__(self, X_reference: np.ndarray, feature_names: Optional[Sequence[str]] = None,
+                 baseline_rmse: Optional[float] = None, psi_threshold: float = 0.25,
+                 error_ratio_threshold: float = 1.5, n_bins: int = 10,
+                 reference_rows: int = 252, min_rows: int = 60):
+        X_reference = np.asarray(X_reference, dtype=float)[-reference_rows:]
+        self.min_rows = min_rows
+        self._seen: List[np.ndarray] = []
+        self.feature_names = list(feature_names or [f'feature_{j}' for j in range(X_reference.shape[1])])
+        self.baseline_rmse = baseline_rmse
+        self.psi_threshold = psi_threshold
+        self.error_ratio_threshold = error_ratio_threshold
+
+        # Inner bin edges per feature; outer bins are open-ended
+        quantiles = np.linspace(0, 1, n_bins + 1)[1:-1]
+        self.edges = [np.unique(np.nanquantile(column, quantiles)) for column in X_reference.T]
+        self.reference_shares = [
+            self._shares(column, edges) for column, edges in zip(X_reference.T, self.edges)
+        ]
+
+    @staticmethod
+    def _shares(values: np.ndarray, edges: np.ndarray) -> np.ndarray:
+        values = values[np.isfinite(values)]
+        counts = np.bincount(np.searchsorted(edges, values, side='right'), minlength=len(edges) + 1)
+        # Floor empty bins so the log ratio stays finite
+        return np.maximum(counts / max(len(values), 1), 1e-4)
+
+    def psi(self, X_new: np.ndarray) -> Dict[str, float]:
+        X_new = np.asarray(X_new, dtype=float)
+        result = {}
+        for name, column, edges, expected in zip(self.feature_names, X_new.T, self.edges, self.reference_shares):
+            actual = self._shares(column, edges)
+            result[name] = float(np.sum((actual - expected) * np.log(actual / expected)))
+        return result
+
+    def check(self, X_new: np.ndarray, y_new: Optional[np.ndarray] = None,
+              y_pred: Optional[np.ndarray] = None) -> DriftReport:
+        self._seen.append(np.asarray(X_new, dtype=float))
+        seen = np.concatenate(self._seen)
+        psi = self.psi(seen) if len(seen) >= self.min_rows else {}
+        reasons = [
+            f"{name} PSI {value:.3f} > {self.psi_threshold}"
+            for name, value in psi.items() if value > self.psi_threshold
+        ]
+
+        recent_rmse = None
+        if y_new is not None and y_pred is not None and len(y_new):
+            y_new = np.asarray(y_new, dtype=float).reshape(len(y_new), -1)
+            y_pred = np.asarray(y_pred, dtype=float).reshape(len(y_new), -1)
+            recent_rmse = float(np.sqrt(np.mean((y_new - y_pred) ** 2)))
+            if self.baseline_rmse is None:
+                self.baseline_rmse = recent_rmse
+            elif recent_rmse > self.error_ratio_threshold * self.baseline_rmse:
+                reasons.append(f"RMSE {recent_rmse:.6g} > {self.error_ratio_threshold}x baseline {self.baseline_rmse:.6g}")
+
+        return DriftReport(psi, self.baseline_rmse, recent_rmse, reasons)
+
+    def save(self, path: str) -> None:
+        joblib.dump(self, path)
+
+    @staticmethod
+    def load(path: str) -> Optional['DriftDetector']:
+        """Detector saved at path, or None if there is none"""
+        return joblib.load(path) if os.path.exists(path) else None
+
+def drift_gate(detector: Optional[DriftDetector], X_new: np.ndarray, y_new: Optional[np.ndarray] = None,
+               y_pred: Optional[np.ndarray] = None) -> DriftReport:
+    """Check new rows before an incremental update
+
+    Every incremental update path goes through this gate: if the report
+    needs_retrain, the caller must retrain on the full history instead of
+    updating. y_pred should come from the current model, before it has seen
+    the new rows.
+    """
+    if detector is None:
+        raise ValueError("Model must be trained before it can be updated")
+    report = detector.check(X_new, y_new, y_pred)
+    if report.needs_retrain:
+        print("Drift detected, full retrain needed: " + "; ".join(report.reasons))
+    return report
@@ -0,0 +1,143 @@
+import hashlib
+import os
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional
+from sklearn.preprocessing import StandardScaler
+from src.data.data_splitter import DataSplitter, Fold
+from src.evaluation.metrics import EvaluationMetrics
+from src.models.base_model import BaseModel
+
+# Arrays opened by this process, so later folds in the same worker reuse the mapping
+_ARRAYS: Dict[str, np.ndarray] = {}
+
+def _open_array(path: str) -> np.ndarray:
+    if path not in _ARRAYS:
+        _ARRAYS[path] = np.load(path, mmap_mode='r')
+    return _ARRAYS[path]
+
+def _run_fold(x_path: str, y_path: str, fold: Fold, model_factory: Callable[[], BaseModel],
+              n_jobs: int = -1) -> Dict:
+    """Scale, train and evaluate one fold; X and y are views into the mapped arrays
+
+    The model and BLAS/OpenMP thread pools are limited to n_jobs threads so
+    parallel folds share the cores instead of each using all of them.
+    """
+    from threadpoolctl import threadpool_limits
+    X, y = _open_array(x_path), _open_array(y_path)
+
+    scaler = StandardScaler()
+    X_train = scaler.fit_transform(X[fold.train])
+    X_val = scaler.transform(X[fold.val])
+    X_test = scaler.transform(X[fold.test])
+
+    model = model_factory()
+    estimator = getattr(model, 'model', model)
+    if hasattr(estimator, 'get_params') and 'n_jobs' in estimator.get_params():
+        estimator.set_params(n_jobs=n_jobs)
+    with threadpool_limits(None if n_jobs == -1 else n_jobs):
+        history = model.train(X_train, y[fold.train], X_val, y[fold.val])
+        # Feature rows up to the test window (the purge gap included) give sequence models full windows
+        context = scaler.transform(X[fold.val.start:fold.test.start])
+        y_pred = np.asarray(model.predict(X_test, context=context)).reshape(-1)
+
+    return {
+        'fold': fold,
+        'y_pred': y_pred,
+        'metrics': EvaluationMetrics.calculate_metrics(np.asarray(y[fold.test]), y_pred),
+        'history': history if isinstance(history, dict) else {}
+    }
+
+@dataclass
+class WalkForwardResult:
+    folds: List[Dict]  # Per fold: fold slices, metrics, predictions
+    y_true: np.ndarray  # Test targets of every fold, concatenated in time order
+    y_pred: np.ndarray
+
+    @property
+    def fold_metrics(self) -> List[Dict]:
+        return [fold['metrics'] for fold in self.folds]
+
+    def aggregate(self) -> Dict:
+        """Mean and std of each metric across folds, plus metrics over all test rows pooled"""
+        summary = {}
+        for name in self.fold_metrics[0]:
+            values = np.array([metrics[name] for metrics in self.fold_metrics])
+            summary[f'{name}_mean'] = float(np.nanmean(values))
+            summary[f'{name}_std'] = float(np.nanstd(values))
+        summary['pooled'] = EvaluationMetrics.calculate_metrics(self.y_true, self.y_pred)
+        summary['n_folds'] = len(self.folds)
+        return summary
+
+class WalkForwardEngine:
+    """Walk-forward backtests with folds run in parallel worker processes.
+
+    The feature matrix and target are written once as ``.npy`` files (or the
+    existing file is reused when X is already a memory-mapped ``.npy``, such as
+    a ``FeatureCache`` entry) and every worker maps them read-only, so folds
+    are slices of one shared array rather than pickled copies. Files are
+    named by a hash of their contents, so repeated backtests over the same
+    data write nothing. With several workers, each fold's model gets
+    cpu_count // workers threads, so folds do not oversubscribe the cores.
+    """
+
+    def __init__(self, cache_dir: str = 'data/cache/walk_forward', n_jobs: Optional[int] = None):
+        self.cache_dir = cache_dir
+        self.n_jobs = n_jobs or os.cpu_count() or 1
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def run(self, X: np.ndarray, y: np.ndarray, model_factory: Callable[[], BaseModel],
+            folds: Optional[List[Fold]] = None, **split_params) -> WalkForwardResult:
+        """Backtest model_factory() on every fold
+
+        model_factory must be picklable (a class or functools.partial) when
+        n_jobs > 1. Without folds, split_params are passed to
+        DataSplitter.walk_forward_splits.
+        """
+        if len(X) != len(y):
+            raise ValueError(f"X has {len(X)} rows but y has {len(y)}")
+        if folds is None:
+            folds = DataSplitter.walk_forward_splits(len(X), **split_params)
+        if not folds:
+            raise ValueError("No walk-forward folds fit in the data")
+
+        x_path, y_path = self._array_path(X), self._array_path(y)
+
+        workers = min(self.n_jobs, len(folds))
+        if workers == 1:
+            results = [_run_fold(x_path, y_path, fold, model_factory) for fold in folds]
+        else:
+            # Split the cores between fold workers and each fold's model threads
+            fold_jobs = max(1, (os.cpu_count() or 1) // workers)
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                futures = [executor.submit(_run_fold, x_path, y_path, fold, model_factory, fold_jobs)
+                           for fold in folds]
+                results = [future.result() for future in futures]
+
+        for result in results:
+            fold = result['fold']
+            print(f"Fold {fold.index}: train {fold.train.start}-{fold.train.stop}, "
+                  f"test {fold.test.start}-{fold.test.stop}, rmse {result['metrics']['rmse']:.6f}")
+
+        y_true = np.concatenate([np.asarray(y[result['fold'].test]) for result in results])
+        y_pred = np.concatenate([result['y_pred'] for result in results])
+        return WalkForwardResult(results, y_true, y_pred)
+
+    def _array_path(self, array: np.ndarray) -> str:
+        filename = getattr(array, 'filename', None)
+        if filename and filename.endswith('.npy') and array.flags.c_contiguous:
+            mapped = _open_array(filename)
+            # A C-contiguous view with the file's shape and dtype is the whole file
+            if mapped.shape == array.shape and mapped.dtype == array.dtype:
+                return filename
+
+        array = np.ascontiguousarray(array)
+        digest = hashlib.sha256(f'{array.dtype}|{array.shape}|'.encode())
+        digest.update(array.data)
+        path = os.path.join(self.cache_dir, f'{digest.hexdigest()[:32]}.npy')
+        if not os.path.exists(path):
+            tmp_path = f'{path}.{os.getpid()}.tmp.npy'
+            np.save(tmp_path, array)
+            os.replace(tmp_path, path)
+        return path
@@ -0,0 +1,96 @@
+"""Vectorized candlestick pattern library.
+
+Every pattern is computed in one pass over plain OHLC arrays (1-D series or
+2-D (time, ticker) panels) using shifted views of the previous bars, with no
+DataFrame copies. Flags are 1.0 where the pattern completes on that bar and
+0.0 elsewhere, including bars without enough history.
+"""
+import numpy as np
+from typing import Dict, Optional
+from . import kernels as K
+from .rolling_quantile import rolling_quantile
+
+def doji(body_size: np.ndarray, upper_shadow: np.ndarray, lower_shadow: np.ndarray,
+         window: Optional[int] = None, body_q: float = 0.2, shadow_q: float = 0.8) -> np.ndarray:
+    """Small body with a long shadow
+    
+    Without a window the thresholds are quantiles over the whole history, so
+    earlier flags change as bars are appended. With a window they are causal
+    rolling quantiles over the last window bars.
+    """
+    if window is None:
+        body_threshold = np.nanquantile(body_size, body_q, axis=0)
+        shadow_threshold = np.nanquantile(upper_shadow, shadow_q, axis=0)
+    else:
+        body_threshold = rolling_quantile(body_size, window, body_q)
+        shadow_threshold = rolling_quantile(upper_shadow, window, shadow_q)
+    with np.errstate(invalid='ignore'):
+        return ((body_size <= body_threshold) &
+                ((upper_shadow >= shadow_threshold) | (lower_shadow >= shadow_threshold))).astype(float)
+
+def hammer(body_size: np.ndarray, lower_shadow: np.ndarray, upper_shadow: np.ndarray) -> np.ndarray:
+    with np.errstate(invalid='ignore'):
+        return ((body_size > 0) & (lower_shadow > 2 * body_size) & (upper_shadow < body_size)).astype(float)
+
+def shooting_star(body_size: np.ndarray, upper_shadow: np.ndarray, lower_shadow: np.ndarray) -> np.ndarray:
+    with np.errstate(invalid='ignore'):
+        return ((body_size > 0) & (upper_shadow > 2 * body_size) & (lower_shadow < body_size)).astype(float)
+
+def engulfing(open_: np.ndarray, close: np.ndarray, bullish: bool = True) -> np.ndarray:
+    """Body that fully covers the opposite-coloured body of the previous bar"""
+    sign = 1 if bullish else -1
+    open_1, close_1 = K.shift(open_, 1), K.shift(close, 1)
+    body, body_1 = sign * (close - open_), sign * (close_1 - open_1)
+    # Bullish: opens at or below the previous close and closes at or above the previous open
+    with np.errstate(invalid='ignore'):
+        return ((body_1 < 0) & (body > -body_1) &
+                (sign * (close_1 - open_) >= 0) & (sign * (close - open_1) >= 0)).astype(float)
+
+def harami(open_: np.ndarray, close: np.ndarray, bullish: bool = True) -> np.ndarray:
+    """Body contained inside the opposite-coloured body of the previous bar"""
+    open_1, close_1 = K.shift(open_, 1), K.shift(close, 1)
+    body, body_1 = close - open_, close_1 - open_1
+    if not bullish:
+        body, body_1 = -body, -body_1
+    with np.errstate(invalid='ignore'):
+        return ((body_1 < 0) & (body > 0) &
+                (np.maximum(open_, close) <= np.maximum(open_1, close_1)) &
+                (np.minimum(open_, close) >= np.minimum(open_1, close_1)) &
+                (body < -body_1)).astype(float)
+
+def star(open_: np.ndarray, close: np.ndarray, bullish: bool = True) -> np.ndarray:
+    """Morning (bullish) or evening (bearish) star over three bars
+    
+    A long first body, a small gapping second body and a third body that
+    closes beyond the midpoint of the first.
+    """
+    sign = 1 if bullish else -1
+    open_1, close_1 = K.shift(open_, 1), K.shift(close, 1)
+    open_2, close_2 = K.shift(open_, 2), K.shift(close, 2)
+    body, body_1, body_2 = sign * (close - open_), close_1 - open_1, sign * (close_2 - open_2)
+    # Second body must gap past the first close (below it for a morning star)
+    if bullish:
+        gap = close_2 - np.maximum(open_1, close_1)
+    else:
+        gap = np.minimum(open_1, close_1) - close_2
+    with np.errstate(invalid='ignore'):
+        return ((body_2 < 0) & (np.abs(body_1) < 0.5 * np.abs(body_2)) & (gap >= 0) &
+                (body > 0) & (sign * (close - (open_2 + close_2) / 2) > 0)).astype(float)
+
+def detect_patterns(open_: np.ndarray, high: np.ndarray, low: np.ndarray, close: np.ndarray,
+                    doji_window: Optional[int] = None) -> Dict[str, np.ndarray]:
+    """All single-bar, two-bar and three-bar patterns from OHLC arrays"""
+    body_size = np.abs(close - open_)
+    upper_shadow = high - np.maximum(open_, close)
+    lower_shadow = np.minimum(open_, close) - low
+    return {
+        'Doji': doji(body_size, upper_shadow, lower_shadow, doji_window),
+        'Hammer': hammer(body_size, lower_shadow, upper_shadow),
+        'Shooting_Star': shooting_star(body_size, upper_shadow, lower_shadow),
+        'Bullish_Engulfing': engulfing(open_, close, bullish=True),
+        'Bearish_Engulfing': engulfing(open_, close, bullish=False),
+        'Bullish_Harami': harami(open_, close, bullish=True),
+        'Bearish_Harami': harami(open_, close, bullish=False),
+        'Morning_Star': star(open_, close, bullish=True),
+        'Evening_Star': star(open_, close, bullish=False)
+    }
@@ -0,0 +1,201 @@
+import hashlib
+import json
+import os
+import threading
+import time
+import numpy as np
+import pandas as pd
+from typing import Dict, List, Optional, Sequence, Tuple
+from .feature_registry import REGISTRY, RAW_INPUTS, FeatureRegistry
+
+class FeatureCache:
+    """Content-addressed on-disk cache of feature matrices.
+    
+    An entry is keyed by a hash of the raw input bars plus the fingerprint of
+    the feature definitions, and stored as a ``.npy`` matrix that is loaded
+    with memory mapping, next to a hash per bar. When the bars overlap an
+    entry, e.g. a rolling window that dropped old bars and appended new
+    ones, the overlapping rows are reused and only the rest is recomputed,
+    with the registry's warm-up history. Requests containing non-causal
+    features fall back to a full recompute. Total size is capped with
+    least-recently-used eviction.
+    """
+    
+    INDEX_FILE = 'index.json'
+    
+    def __init__(self, cache_dir: str = 'data/cache/features', max_size_mb: float = 1024,
+                 registry: FeatureRegistry = REGISTRY):
+        self.cache_dir = cache_dir
+        self.max_size_bytes = int(max_size_mb * 1024 * 1024)
+        self.registry = registry
+        os.makedirs(cache_dir, exist_ok=True)
+        self.index_file = os.path.join(cache_dir, self.INDEX_FILE)
+        self.index = self._load_index()
+        self._lock = threading.Lock()
+    
+    def get_or_compute(self, symbol: str, df: pd.DataFrame, features: Sequence[str]) -> np.ndarray:
+        """Feature matrix (rows of df, features) for the bars in df, read-only and memory-mapped"""
+        features = list(features)
+        fingerprint = self.registry.fingerprint(features)
+        columns = self.registry.raw_dependencies(features)
+        bars_hash = self._hash_bars(df, columns)
+        key = hashlib.sha256(f'{fingerprint}|{bars_hash}'.encode()).hexdigest()
+        
+        if key in self.index and os.path.exists(self._file_path(key)):
+            self._touch(key)
+            return np.load(self._file_path(key), mmap_mode='r')
+        
+        row_hashes = self._hash_rows(df, columns)
+        overlap = self._find_overlap(symbol, fingerprint, row_hashes) if self.registry.is_causal(features) else None
+        if overlap is not None:
+            base, offset = overlap
+            matrix = self._extend(base, offset, df, features)
+        else:
+            matrix = self.registry.compute(df, features)
+        
+        self._store(key, matrix, row_hashes, {
+            'symbol': symbol,
+            'fingerprint': fingerprint,
+            'bars_hash': bars_hash,
+            'rows': len(df),
+            'first_date': df.index[0].isoformat() if len(df) else None,
+            'features': features
+        })
+        # The new entry supersedes one it extends past, but not one it is a slice of
+        if overlap is not None and offset + len(df) >= self.index[base]['rows']:
+            self._remove(base)
+        self._evict(keep=key)
+        return np.load(self._file_path(key), mmap_mode='r')
+    
+    def get_or_compute_frame(self, symbol: str, df: pd.DataFrame, features: Sequence[str]) -> pd.DataFrame:
+        return pd.DataFrame(self.get_or_compute(symbol, df, features), index=df.index, columns=list(features))
+    
+    def clear(self) -> None:
+        with self._lock:
+            for key in list(self.index):
+                self._remove_unlocked(key)
+            self._save_index()
+    
+    def _find_overlap(self, symbol: str, fingerprint: str, row_hashes: np.ndarray) -> Optional[Tuple[str, int]]:
+        """Cached entry whose bars from some offset on are the leading bars of df, longest overlap first
+        
+        A rolling download window moves its first bar every day, so entries
+        are matched on the overlapping bars rather than on the same start.
+        """
+        best, best_overlap = None, 0
+        for key, entry in self.index.items():
+            if entry['symbol'] != symbol or entry['fingerprint'] != fingerprint:
+                continue
+            if not os.path.exists(self._file_path(key)) or not os.path.exists(self._rows_path(key)):
+                continue
+            cached_hashes = np.load(self._rows_path(key), mmap_mode='r')
+            starts = np.flatnonzero(cached_hashes == row_hashes[0]) if len(row_hashes) else []
+            if not len(starts):
+                continue
+            offset = int(starts[0])
+            overlap = min(len(cached_hashes) - offset, len(row_hashes))
+            if overlap > best_overlap and np.array_equal(cached_hashes[offset:offset + overlap], row_hashes[:overlap]):
+                best, best_overlap = (key, offset), overlap
+        return best
+    
+    def _extend(self, base: str, offset: int, df: pd.DataFrame, features: List[str]) -> np.ndarray:
+        """Reuse the overlapping rows of an entry and recompute the rest
+        
+        When df starts later than the entry, its first warm-up rows lack the
+        history the entry had and are recomputed from df; the rows after the
+        overlap are recomputed from the warm-up history before them.
+        """
+        cached = np.load(self._file_path(base), mmap_mode='r')
+        overlap = min(len(cached) - offset, len(df))
+        warmup = self.registry.warmup(features)
+        
+        matrix = np.empty((len(df), len(features)))
+        head = min(warmup, overlap) if offset else 0
+        if head:
+            matrix[:head] = self.registry.compute(df.iloc[:head], features)
+        matrix[head:overlap] = cached[offset + head:offset + overlap]
+        if overlap < len(df):
+            start = max(0, overlap - warmup)
+            matrix[overlap:] = self.registry.compute(df.iloc[start:], features)[overlap - start:]
+        return matrix
+    
+    def _store(self, key: str, matrix: np.ndarray, row_hashes: np.ndarray, meta: Dict) -> None:
+        path = self._file_path(key)
+        rows_path = self._rows_path(key)
+        for target, array in ((rows_path, row_hashes), (path, matrix)):
+            tmp_path = f'{target}.tmp.npy'
+            np.save(tmp_path, array)
+            os.replace(tmp_path, target)
+        with self._lock:
+            size = os.path.getsize(path) + os.path.getsize(rows_path)
+            self.index[key] = {**meta, 'size': size, 'last_access': time.time()}
+            self._save_index()
+    
+    def _touch(self, key: str) -> None:
+        with self._lock:
+            self.index[key]['last_access'] = time.time()
+            self._save_index()
+    
+    def _evict(self, keep: str) -> None:
+        with self._lock:
+            total = sum(entry['size'] for entry in self.index.values())
+            for key, entry in sorted(self.index.items(), key=lambda item: item[1]['last_access']):
+                if total <= self.max_size_bytes:
+                    break
+                if key == keep:
+                    continue
+                total -= entry['size']
+                self._remove_unlocked(key)
+            self._save_index()
+    
+    def _remove(self, key: str) -> None:
+        with self._lock:
+            self._remove_unlocked(key)
+            self._save_index()
+    
+    def _remove_unlocked(self, key: str) -> None:
+        self.index.pop(key, None)
+        for path in (self._file_path(key), self._rows_path(key)):
+            if os.path.exists(path):
+                os.remove(path)
+    
+    @staticmethod
+    def _hash_bars(df: pd.DataFrame, columns: List[str]) -> str:
+        digest = hashlib.sha256(np.ascontiguousarray(pd.DatetimeIndex(df.index).asi8).tobytes())
+        for column in columns:
+            digest.update(column.encode())
+            digest.update(np.ascontiguousarray(df[column].to_numpy(dtype=float)).tobytes())
+        return digest.hexdigest()
+    
+    @staticmethod
+    def _hash_rows(df: pd.DataFrame, columns: List[str]) -> np.ndarray:
+        """One hash per bar over its timestamp and raw inputs"""
+        return pd.util.hash_pandas_object(df[columns].astype(float), index=True).to_numpy()
+    
+    def _file_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f'{key}.npy')
+    
+    def _rows_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f'{key}.rows.npy')
+    
+    def _load_index(self) -> Dict:
+        if os.path.exists(self.index_file):
+            with open(self.index_file, 'r') as f:
+                return json.load(f)
+        return {}
+    
+    def _save_index(self) -> None:
+        tmp_path = f'{self.index_file}.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump(self.index, f)
+        os.replace(tmp_path, self.index_file)
+
+def cached_technical_features(symbol: str, df: pd.DataFrame, features: Sequence[str],
+                              cache: Optional[FeatureCache] = None) -> pd.DataFrame:
+    """Cached equivalent of ``add_technical_features(df, features=features)``"""
+    cache = cache if cache is not None else FeatureCache()
+    values = cache.get_or_compute(symbol, df, features)
+    result = df[list(RAW_INPUTS)].copy()
+    for j, name in enumerate(features):
+        result[name] = values[:, j]
+    return result.dropna()
@@ -20,4 +20,42 @@ PREDICTION_FEATURES = [
     'Trend',
     'Volume_Trend',
     'RSI'
-]
\ No newline at end of file
+]
+
+# Columns produced by add_technical_features
+TECHNICAL_FEATURES = [
+    'Returns',
+    'Log_Returns',
+    'SMA20',
+    'SMA50',
+    'EMA20',
+    'Volatility',
+    'ATR',
+    'Price_Momentum',
+    'Trend',
+    'Volume_Change',
+    'Volume_MA20',
+    'Volume_Trend',
+    'Doji',
+    'Hammer',
+    'Shooting_Star',
+    'Support',
+    'Resistance',
+    'Support_Distance',
+    'Resistance_Distance',
+    'RSI',
+    'MACD',
+    'MACD_Signal'
+]
+
+# Columns produced by FeatureEngineer.create_features with the default lookbacks
+ENGINEERED_FEATURES = [
+    'Returns',
+    'Lag_Return_1',
+    'Lag_Return_5',
+    'Lag_Return_10',
+    'Rolling_Mean_5',
+    'Rolling_Std_5',
+    'Price_Momentum',
+    'Next_Day_Return'
+]
@@ -1,11 +1,23 @@
 import pandas as pd
 import numpy as np
-from typing import Dict
+from typing import Dict, List, Optional
 from .technical_patterns import TechnicalPatterns
 from .feature_constants import PREDICTION_FEATURES
+from .feature_registry import REGISTRY, RAW_INPUTS
 
-def add_technical_features(df: pd.DataFrame) -> pd.DataFrame:
-    """Add technical indicators to the dataset"""
+def add_technical_features(df: pd.DataFrame, features: Optional[List[str]] = None) -> pd.DataFrame:
+    """Add technical indicators to the dataset
+    
+    When features is given, only those columns (and the intermediates they
+    depend on) are computed through the feature registry.
+    """
+    if features is not None:
+        values = REGISTRY.compute(df, features)
+        result = df[list(RAW_INPUTS)].copy()
+        for j, name in enumerate(features):
+            result[name] = values[:, j]
+        return result.dropna()
+    
     df = df.copy()
     
     # Basic price features
@@ -41,56 +53,59 @@ def add_technical_features(df: pd.DataFrame) -> pd.DataFrame:
     
     return df.dropna()
 
-def generate_future_features(df: pd.DataFrame, last_known: pd.Series, n_days: int = 15) -> pd.DataFrame:
-    """Generate dynamic features for future predictions"""
-    features_list = []
+def simulate_future_features(df: pd.DataFrame, last_known: pd.Series, n_days: int = 15,
+                             n_paths: int = 1000, seed: Optional[int] = None) -> np.ndarray:
+    """Simulate feature paths for Monte Carlo forecasts
+    
+    Returns an array of shape (n_paths, n_days, len(PREDICTION_FEATURES)).
+    All random draws come from one seeded Generator up front; the only loop
+    is over days, with every path advanced together as a vector.
+    """
+    rng = np.random.default_rng(seed)
     
     # Historical statistics
     hist_volatility = df['Volatility'].mean()
     hist_returns_std = df['Returns'].std()
     
-    # Current state
-    current_sma20 = last_known['SMA20']
-    current_sma50 = last_known['SMA50']
-    current_returns = last_known['Returns']
-    current_volatility = last_known['Volatility']
-    current_momentum = last_known['Price_Momentum']
-    current_trend = 1 if current_sma20 > current_sma50 else -1
-    current_volume_trend = last_known['Volume_Trend']
-    current_rsi = last_known['RSI']
+    return_shocks = rng.normal(0, hist_returns_std, size=(n_paths, n_days))
+    volatility_shocks = rng.normal(0, 0.1, size=(n_paths, n_days))
+    
+    features = np.empty((n_paths, n_days, len(PREDICTION_FEATURES)))
+    column = {name: j for j, name in enumerate(PREDICTION_FEATURES)}
+    
+    # Current state, one value per path
+    current_sma20 = np.full(n_paths, float(last_known['SMA20']))
+    current_sma50 = np.full(n_paths, float(last_known['SMA50']))
+    current_momentum = np.full(n_paths, float(last_known['Price_Momentum']))
+    current_rsi = np.full(n_paths, float(last_known['RSI']))
+    
+    features[:, :, column['Volatility']] = hist_volatility * (1 + volatility_shocks)
+    features[:, :, column['Trend']] = 1 if last_known['SMA20'] > last_known['SMA50'] else -1
+    features[:, :, column['Volume_Trend']] = last_known['Volume_Trend']
     
     for i in range(n_days):
-        # Generate returns considering market conditions
-        base_return = np.random.normal(0, hist_returns_std)
+        # Damp returns when overbought, amplify when oversold
+        base_return = return_shocks[:, i] * np.where(
+            current_rsi > 70, 0.8, np.where(current_rsi < 30, 1.2, 1.0)
+        )
         
-        # Adjust returns based on RSI
-        if current_rsi > 70:  # Overbought
-            base_return *= 0.8
-        elif current_rsi < 30:  # Oversold
-            base_return *= 1.2
-            
-        # Update features
-        current_returns = base_return
-        current_volatility = hist_volatility * (1 + np.random.normal(0, 0.1))
         current_momentum = current_momentum * 0.95 + base_return
-        current_rsi += (base_return * 2) * (-1 if current_rsi > 50 else 1)
-        current_rsi = max(0, min(100, current_rsi))
+        current_rsi = np.clip(current_rsi + 2 * base_return * np.where(current_rsi > 50, -1, 1), 0, 100)
         
-        features_dict = {
-            'SMA20': current_sma20,
-            'SMA50': current_sma50,
-            'Returns': current_returns,
-            'Volatility': current_volatility,
-            'Price_Momentum': current_momentum,
-            'Trend': current_trend,
-            'Volume_Trend': current_volume_trend,
-            'RSI': current_rsi
-        }
-        
-        features_list.append(features_dict)
+        features[:, i, column['SMA20']] = current_sma20
+        features[:, i, column['SMA50']] = current_sma50
+        features[:, i, column['Returns']] = base_return
+        features[:, i, column['Price_Momentum']] = current_momentum
+        features[:, i, column['RSI']] = current_rsi
         
         # Update moving averages
-        current_sma20 = current_sma20 * 0.95 + current_returns * 0.05
-        current_sma50 = current_sma50 * 0.98 + current_returns * 0.02
+        current_sma20 = current_sma20 * 0.95 + base_return * 0.05
+        current_sma50 = current_sma50 * 0.98 + base_return * 0.02
     
-    return pd.DataFrame(features_list)
\ No newline at end of file
+    return features
+
+def generate_future_features(df: pd.DataFrame, last_known: pd.Series, n_days: int = 15,
+                             seed: Optional[int] = None) -> pd.DataFrame:
+    """Generate dynamic features for future predictions (a single simulated path)"""
+    paths = simulate_future_features(df, last_known, n_days, n_paths=1, seed=seed)
+    return pd.DataFrame(paths[0], columns=PREDICTION_FEATURES)
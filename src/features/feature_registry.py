@@ -0,0 +1,254 @@
+"""Declarative feature registry resolved into a dependency graph.
+
+Every feature declares the columns it is computed from. A request such as
+``TRAINING_FEATURES`` is resolved into a topologically ordered plan that
+contains only the features it needs, so shared intermediates (returns,
+rolling windows, EWMs) are computed once and everything else is skipped.
+Results are written straight into one preallocated array; intermediates are
+released as soon as their last consumer has run.
+"""
+import hashlib
+import inspect
+import numpy as np
+import pandas as pd
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+from . import kernels as K
+from . import candlestick_patterns as CP
+
+RAW_INPUTS = ('Open', 'High', 'Low', 'Close', 'Volume')
+
+# Bump to invalidate cached feature matrices after changes the fingerprint cannot see
+FEATURE_SET_VERSION = 1
+
+@dataclass(frozen=True)
+class FeatureSpec:
+    name: str
+    inputs: Tuple[str, ...]
+    compute: Callable[..., np.ndarray]
+    params: Dict = field(default_factory=dict)
+    warmup: int = 0  # Extra bars of history needed before values are exact
+    causal: bool = True  # False if a row depends on later rows (lookahead, full-history stats)
+
+class FeatureRegistry:
+    def __init__(self, raw_inputs: Sequence[str] = RAW_INPUTS):
+        self.raw_inputs = tuple(raw_inputs)
+        self._specs: Dict[str, FeatureSpec] = {}
+    
+    def add(self, name: str, inputs: Sequence[str], compute: Callable[..., np.ndarray],
+            warmup: int = 0, causal: bool = True, **params) -> None:
+        self._specs[name] = FeatureSpec(name, tuple(inputs), compute, params, warmup, causal)
+    
+    def spec(self, name: str) -> FeatureSpec:
+        return self._specs[name]
+    
+    @property
+    def names(self) -> List[str]:
+        return list(self._specs)
+    
+    def resolve(self, requested: Sequence[str]) -> List[str]:
+        """Topologically ordered features needed for a request, raw inputs excluded"""
+        order, state = [], {}
+        
+        def visit(name: str) -> None:
+            if name in self.raw_inputs or state.get(name) == 'done':
+                return
+            if name not in self._specs:
+                raise KeyError(f"Unknown feature: {name}")
+            if state.get(name) == 'visiting':
+                raise ValueError(f"Circular feature dependency at {name}")
+            state[name] = 'visiting'
+            for dependency in self._specs[name].inputs:
+                visit(dependency)
+            state[name] = 'done'
+            order.append(name)
+        
+        for name in requested:
+            visit(name)
+        return order
+    
+    def warmup(self, requested: Sequence[str]) -> int:
+        """Longest chain of warm-up bars behind any requested feature"""
+        depth = {name: 0 for name in self.raw_inputs}
+        for name in self.resolve(requested):
+            spec = self._specs[name]
+            depth[name] = spec.warmup + max((depth[i] for i in spec.inputs), default=0)
+        return max((depth[name] for name in requested), default=0)
+    
+    def is_causal(self, requested: Sequence[str]) -> bool:
+        """Whether appending bars leaves every earlier row of the request unchanged"""
+        return all(self._specs[name].causal for name in self.resolve(requested))
+    
+    def raw_dependencies(self, requested: Sequence[str]) -> List[str]:
+        plan = self.resolve(requested)
+        needed = {i for name in plan for i in self._specs[name].inputs}
+        needed |= set(requested)
+        return [name for name in self.raw_inputs if name in needed]
+    
+    def fingerprint(self, requested: Sequence[str]) -> str:
+        """Hash of the definitions behind a request: names, inputs, parameters and code"""
+        digest = hashlib.sha256(f'v{FEATURE_SET_VERSION}|{list(requested)}'.encode())
+        for name in self.resolve(requested):
+            spec = self._specs[name]
+            digest.update(f'|{name}|{spec.inputs}|{sorted(spec.params.items())}|'.encode())
+            digest.update(inspect.getsource(spec.compute).encode())
+        return digest.hexdigest()
+    
+    def compute(self, data, requested: Sequence[str], out: Optional[np.ndarray] = None) -> np.ndarray:
+        """Compute requested features from a frame or mapping of raw arrays
+        
+        Inputs may be 1-D series or 2-D (time, ticker) panels; the result has
+        the input shape plus a trailing feature axis, e.g. (time, features).
+        """
+        requested = list(requested)
+        plan = self.resolve(requested)
+        values = {name: np.asarray(data[name], dtype=float) for name in self.raw_dependencies(requested)}
+        shape = next(iter(values.values())).shape
+        
+        if out is None:
+            out = np.empty(shape + (len(requested),))
+        
+        # Release each intermediate after its last consumer
+        last_use = {}
+        for step, name in enumerate(plan):
+            for dependency in self._specs[name].inputs:
+                last_use[dependency] = step
+        keep = set(requested)
+        # Output columns of each requested name; a name requested twice fills both
+        positions = {}
+        for j, name in enumerate(requested):
+            positions.setdefault(name, []).append(j)
+        
+        for step, name in enumerate(plan):
+            spec = self._specs[name]
+            values[name] = spec.compute(*(values[i] for i in spec.inputs), **spec.params)
+            for dependency in spec.inputs:
+                if last_use.get(dependency) == step and dependency not in keep:
+                    del values[dependency]
+            for j in positions.get(name, ()):
+                out[..., j] = values[name]
+        
+        for name in self.raw_inputs:
+            for j in positions.get(name, ()):
+                out[..., j] = values[name]
+        return out
+    
+    def compute_frame(self, df: pd.DataFrame, requested: Sequence[str]) -> pd.DataFrame:
+        return pd.DataFrame(self.compute(df, requested), index=df.index, columns=list(requested))
+
+def _identity(x):
+    return x
+
+def _log_return(close):
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.log(close / K.shift(close, 1))
+
+def _subtract(a, b):
+    return a - b
+
+def _abs(x):
+    return np.abs(x)
+
+def _upper_shadow(high, open_, close):
+    return high - np.maximum(open_, close)
+
+def _lower_shadow(low, open_, close):
+    return np.minimum(open_, close) - low
+
+def _gain(delta, close):
+    # Like Series.where(delta > 0, 0) the first change counts as 0, but rows
+    # before a ticker's first bar stay NaN so panel warm-ups stay per ticker
+    with np.errstate(invalid='ignore'):
+        return np.where(np.isnan(close), np.nan, np.where(delta > 0, delta, 0.0))
+
+def _loss(delta, close):
+    with np.errstate(invalid='ignore'):
+        return np.where(np.isnan(close), np.nan, np.where(delta < 0, -delta, 0.0))
+
+def _rsi(avg_gain, avg_loss):
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return 100 - 100 / (1 + avg_gain / avg_loss)
+
+def _wilder_rsi(avg_gain, avg_loss):
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.where(avg_loss == 0, 100.0, 100 - 100 / (1 + avg_gain / avg_loss))
+
+def _distance(close, level):
+    return (close - level) / close
+
+def _band(mean, std, k):
+    return mean + k * std
+
+def _ewm_warmup(span: float) -> int:
+    # (1 - alpha) ** (10 * span) is below 1e-8, well inside float tolerance for features
+    return int(10 * span)
+
+REGISTRY = FeatureRegistry()
+
+# Returns and price changes
+REGISTRY.add('Returns', ['Close'], K.pct_change, warmup=1)
+REGISTRY.add('Daily_Return', ['Returns'], _identity)
+REGISTRY.add('Log_Returns', ['Close'], _log_return, warmup=1)
+REGISTRY.add('Price_Momentum', ['Close'], K.pct_change, warmup=5, periods=5)
+REGISTRY.add('Volume_Change', ['Volume'], K.pct_change, warmup=1)
+for _period in (1, 5, 10):
+    REGISTRY.add(f'Lag_Return_{_period}', ['Returns'], K.shift, warmup=_period, periods=_period)
+REGISTRY.add('Next_Day_Return', ['Returns'], K.shift, causal=False, periods=-1)
+
+# Moving averages and trends
+REGISTRY.add('SMA20', ['Close'], K.rolling_mean, warmup=20, window=20)
+REGISTRY.add('SMA50', ['Close'], K.rolling_mean, warmup=50, window=50)
+REGISTRY.add('SMA_20', ['SMA20'], _identity)
+REGISTRY.add('SMA_50', ['SMA50'], _identity)
+REGISTRY.add('EMA20', ['Close'], K.ewm_mean, warmup=_ewm_warmup(20), span=20)
+REGISTRY.add('Rolling_Mean_5', ['Close'], K.rolling_mean, warmup=5, window=5)
+REGISTRY.add('Trend', ['SMA20', 'SMA50'], K.where_greater)
+
+# Volatility
+REGISTRY.add('Volatility', ['Returns'], K.rolling_std, warmup=20, window=20)
+REGISTRY.add('Rolling_Std_5', ['Close'], K.rolling_std, warmup=5, window=5)
+REGISTRY.add('ATR', ['High', 'Low'], _subtract)
+REGISTRY.add('Close_Std_20', ['Close'], K.rolling_std, warmup=20, window=20, ddof=0)
+REGISTRY.add('BB_upper', ['SMA20', 'Close_Std_20'], _band, k=2.0)
+REGISTRY.add('BB_lower', ['SMA20', 'Close_Std_20'], _band, k=-2.0)
+
+# Volume analysis
+REGISTRY.add('Volume_MA20', ['Volume'], K.rolling_mean, warmup=20, window=20)
+REGISTRY.add('Volume_Trend', ['Volume', 'Volume_MA20'], K.where_greater)
+
+# Momentum: RSI (rolling and Wilder averages) and MACD
+REGISTRY.add('Close_Delta', ['Close'], K.diff, warmup=1)
+REGISTRY.add('Gain', ['Close_Delta', 'Close'], _gain)
+REGISTRY.add('Loss', ['Close_Delta', 'Close'], _loss)
+REGISTRY.add('Avg_Gain_14', ['Gain'], K.rolling_mean, warmup=14, window=14)
+REGISTRY.add('Avg_Loss_14', ['Loss'], K.rolling_mean, warmup=14, window=14)
+REGISTRY.add('RSI', ['Avg_Gain_14', 'Avg_Loss_14'], _rsi)
+REGISTRY.add('Wilder_Gain_14', ['Gain'], K.ewm_mean, warmup=_ewm_warmup(27), alpha=1 / 14, min_periods=14)
+REGISTRY.add('Wilder_Loss_14', ['Loss'], K.ewm_mean, warmup=_ewm_warmup(27), alpha=1 / 14, min_periods=14)
+REGISTRY.add('RSI_Wilder', ['Wilder_Gain_14', 'Wilder_Loss_14'], _wilder_rsi)
+REGISTRY.add('EMA12', ['Close'], K.ewm_mean, warmup=_ewm_warmup(12), span=12)
+REGISTRY.add('EMA26', ['Close'], K.ewm_mean, warmup=_ewm_warmup(26), span=26)
+REGISTRY.add('MACD', ['EMA12', 'EMA26'], _subtract)
+REGISTRY.add('MACD_Signal', ['MACD'], K.ewm_mean, warmup=_ewm_warmup(9), span=9)
+
+# Candlestick patterns
+REGISTRY.add('Body', ['Close', 'Open'], _subtract)
+REGISTRY.add('Body_Size', ['Body'], _abs)
+REGISTRY.add('Upper_Shadow', ['High', 'Open', 'Close'], _upper_shadow)
+REGISTRY.add('Lower_Shadow', ['Low', 'Open', 'Close'], _lower_shadow)
+REGISTRY.add('Doji', ['Body_Size', 'Upper_Shadow', 'Lower_Shadow'], CP.doji, causal=False)
+REGISTRY.add('Rolling_Doji_50', ['Body_Size', 'Upper_Shadow', 'Lower_Shadow'], CP.doji, warmup=50, window=50)
+REGISTRY.add('Hammer', ['Body_Size', 'Lower_Shadow', 'Upper_Shadow'], CP.hammer)
+REGISTRY.add('Shooting_Star', ['Body_Size', 'Upper_Shadow', 'Lower_Shadow'], CP.shooting_star)
+REGISTRY.add('Bullish_Engulfing', ['Open', 'Close'], CP.engulfing, warmup=1, bullish=True)
+REGISTRY.add('Bearish_Engulfing', ['Open', 'Close'], CP.engulfing, warmup=1, bullish=False)
+REGISTRY.add('Bullish_Harami', ['Open', 'Close'], CP.harami, warmup=1, bullish=True)
+REGISTRY.add('Bearish_Harami', ['Open', 'Close'], CP.harami, warmup=1, bullish=False)
+REGISTRY.add('Morning_Star', ['Open', 'Close'], CP.star, warmup=2, bullish=True)
+REGISTRY.add('Evening_Star', ['Open', 'Close'], CP.star, warmup=2, bullish=False)
+
+# Support and resistance
+REGISTRY.add('Support', ['Low'], K.rolling_min, warmup=20, window=20)
+REGISTRY.add('Resistance', ['High'], K.rolling_max, warmup=20, window=20)
+REGISTRY.add('Support_Distance', ['Close', 'Support'], _distance)
+REGISTRY.add('Resistance_Distance', ['Close', 'Resistance'], _distance)
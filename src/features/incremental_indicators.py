@@ -0,0 +1,333 @@
+import json
+import math
+import os
+import pandas as pd
+from abc import ABC, abstractmethod
+from typing import Dict, Iterable, List, Optional
+
+NAN = float('nan')
+
+class RollingWindow:
+    """Ring buffer keeping a running sum and sum of squares over the last ``window`` values.
+    
+    Sums are taken around a shift so variance does not lose precision on
+    large prices, and are recomputed from the buffer once per window to stop
+    floating point drift; both keep updates amortized O(1). Like pandas with
+    the default min_periods, results are NaN until the window is full or
+    while it contains a NaN.
+    """
+    
+    def __init__(self, window: int):
+        self.window = window
+        self.buffer: List[float] = [NAN] * window
+        self.position = 0
+        self.count = 0
+        self.nan_count = 0
+        self.shift: Optional[float] = None
+        self.total = 0.0
+        self.total_sq = 0.0
+        self.updates = 0
+    
+    def update(self, x: float) -> None:
+        if self.count == self.window:
+            self._remove(self.buffer[self.position])
+        else:
+            self.count += 1
+        
+        self.buffer[self.position] = x
+        self.position = (self.position + 1) % self.window
+        if math.isnan(x):
+            self.nan_count += 1
+        else:
+            if self.shift is None:
+                self.shift = x
+            d = x - self.shift
+            self.total += d
+            self.total_sq += d * d
+        
+        self.updates += 1
+        if self.updates % self.window == 0:
+            self._resync()
+    
+    def mean(self) -> float:
+        if not self.ready():
+            return NAN
+        return self.shift + self.total / self.window
+    
+    def std(self, ddof: int = 1) -> float:
+        if not self.ready():
+            return NAN
+        var = (self.total_sq - self.total * self.total / self.window) / (self.window - ddof)
+        return math.sqrt(max(var, 0.0))
+    
+    def ready(self) -> bool:
+        return self.count == self.window and self.nan_count == 0
+    
+    def _remove(self, x: float) -> None:
+        if math.isnan(x):
+            self.nan_count -= 1
+        else:
+            d = x - self.shift
+            self.total -= d
+            self.total_sq -= d * d
+    
+    def _resync(self) -> None:
+        values = [x for x in self.buffer if not math.isnan(x)]
+        if not values:
+            return
+        self.shift = sum(values) / len(values)
+        self.total = sum(x - self.shift for x in values)
+        self.total_sq = sum((x - self.shift) ** 2 for x in values)
+
+class EMA:
+    """Recursive exponential moving average matching ``ewm(adjust=False)``
+    
+    Leading NaNs are skipped, and the value is NaN until min_periods valid
+    inputs have been seen.
+    """
+    
+    def __init__(self, span: Optional[float] = None, alpha: Optional[float] = None, min_periods: int = 0):
+        self.alpha = alpha if alpha is not None else 2.0 / (span + 1.0)
+        self.min_periods = min_periods
+        self.value = NAN
+        self.count = 0
+    
+    def update(self, x: float) -> float:
+        if not math.isnan(x):
+            self.value = x if self.count == 0 else self.alpha * x + (1 - self.alpha) * self.value
+            self.count += 1
+        return self.value if self.count >= max(self.min_periods, 1) else NAN
+
+class Indicator(ABC):
+    """Stateful indicator updated with one bar at a time.
+    
+    ``update`` receives the bar's values plus every output computed earlier
+    in the same update and returns this indicator's outputs.
+    """
+    
+    outputs: List[str] = []
+    
+    @abstractmethod
+    def update(self, values: Dict[str, float]) -> Dict[str, float]:
+        pass
+    
+    def state_dict(self) -> Dict:
+        return _state(self)
+    
+    def load_state(self, state: Dict) -> None:
+        _load_state(self, state)
+
+class PctChange(Indicator):
+    def __init__(self, name: str, source: str = 'Close'):
+        self.outputs = [name]
+        self.source = source
+        self.previous = NAN
+    
+    def update(self, values):
+        x = values[self.source]
+        result = x / self.previous - 1 if not math.isnan(self.previous) else NAN
+        self.previous = x
+        return {self.outputs[0]: result}
+
+class SMA(Indicator):
+    def __init__(self, name: str, window: int, source: str = 'Close'):
+        self.outputs = [name]
+        self.source = source
+        self.rolling = RollingWindow(window)
+    
+    def update(self, values):
+        self.rolling.update(values[self.source])
+        return {self.outputs[0]: self.rolling.mean()}
+
+class RollingStd(Indicator):
+    def __init__(self, name: str, window: int, source: str = 'Close', ddof: int = 1):
+        self.outputs = [name]
+        self.source = source
+        self.ddof = ddof
+        self.rolling = RollingWindow(window)
+    
+    def update(self, values):
+        self.rolling.update(values[self.source])
+        return {self.outputs[0]: self.rolling.std(self.ddof)}
+
+class ExponentialMA(Indicator):
+    def __init__(self, name: str, span: int, source: str = 'Close', min_periods: int = 0):
+        self.outputs = [name]
+        self.source = source
+        self.ema = EMA(span=span, min_periods=min_periods)
+    
+    def update(self, values):
+        return {self.outputs[0]: self.ema.update(values[self.source])}
+
+class RSI(Indicator):
+    """Relative Strength Index over close-to-close changes.
+    
+    ``method='sma'`` averages gains and losses over a rolling window like
+    TechnicalPatterns; ``method='wilder'`` uses Wilder smoothing like ``ta``.
+    """
+    
+    def __init__(self, name: str = 'RSI', window: int = 14, method: str = 'sma', source: str = 'Close'):
+        if method not in ('sma', 'wilder'):
+            raise ValueError(f"Unknown RSI method: {method}")
+        self.outputs = [name]
+        self.source = source
+        self.method = method
+        self.previous = NAN
+        if method == 'sma':
+            self.gains, self.losses = RollingWindow(window), RollingWindow(window)
+        else:
+            self.gains = EMA(alpha=1.0 / window, min_periods=window)
+            self.losses = EMA(alpha=1.0 / window, min_periods=window)
+    
+    def update(self, values):
+        x = values[self.source]
+        delta = x - self.previous
+        self.previous = x
+        # Like Series.where(delta > 0, 0), the first (NaN) change counts as 0
+        gain = delta if delta > 0 else 0.0
+        loss = -delta if delta < 0 else 0.0
+        
+        if self.method == 'sma':
+            self.gains.update(gain)
+            self.losses.update(loss)
+            avg_gain, avg_loss = self.gains.mean(), self.losses.mean()
+            if avg_loss == 0:
+                rsi = NAN if avg_gain == 0 else 100.0
+            else:
+                rsi = 100 - 100 / (1 + avg_gain / avg_loss)
+        else:
+            avg_gain, avg_loss = self.gains.update(gain), self.losses.update(loss)
+            rsi = 100.0 if avg_loss == 0 else 100 - 100 / (1 + avg_gain / avg_loss)
+        
+        return {self.outputs[0]: rsi}
+
+class MACD(Indicator):
+    def __init__(self, names=('MACD', 'MACD_Signal'), fast: int = 12, slow: int = 26,
+                 signal: int = 9, source: str = 'Close', min_periods: bool = False):
+        self.outputs = list(names)
+        self.source = source
+        self.fast = EMA(span=fast, min_periods=fast if min_periods else 0)
+        self.slow = EMA(span=slow, min_periods=slow if min_periods else 0)
+        self.signal = EMA(span=signal, min_periods=signal if min_periods else 0)
+    
+    def update(self, values):
+        x = values[self.source]
+        macd = self.fast.update(x) - self.slow.update(x)
+        return {self.outputs[0]: macd, self.outputs[1]: self.signal.update(macd)}
+
+class BollingerBands(Indicator):
+    """Bands at mean ± k population standard deviations, as in ``ta``"""
+    
+    def __init__(self, names=('BB_upper', 'BB_lower'), window: int = 20, k: float = 2.0, source: str = 'Close'):
+        self.outputs = list(names)
+        self.source = source
+        self.k = k
+        self.rolling = RollingWindow(window)
+    
+    def update(self, values):
+        self.rolling.update(values[self.source])
+        mean, std = self.rolling.mean(), self.rolling.std(ddof=0)
+        return {self.outputs[0]: mean + self.k * std, self.outputs[1]: mean - self.k * std}
+
+class IncrementalIndicators:
+    """Technical indicator engine updated in O(1) per new bar.
+    
+    The default set reproduces the columns of ``add_technical_features``
+    (with RSI/MACD from TechnicalPatterns) plus Bollinger bands and Wilder
+    RSI as computed by ``ta``. State can be checkpointed to JSON next to the
+    stored bars and restored to continue from the last processed bar.
+    """
+    
+    def __init__(self, indicators: Optional[List[Indicator]] = None):
+        self.indicators = indicators if indicators is not None else self.default_indicators()
+        self.last_timestamp: Optional[pd.Timestamp] = None
+    
+    @staticmethod
+    def default_indicators() -> List[Indicator]:
+        return [
+            PctChange('Returns'),
+            SMA('SMA20', 20),
+            SMA('SMA50', 50),
+            ExponentialMA('EMA20', 20),
+            RollingStd('Volatility', 20, source='Returns'),
+            SMA('Volume_MA20', 20, source='Volume'),
+            RSI('RSI', 14, method='sma'),
+            RSI('RSI_Wilder', 14, method='wilder'),
+            MACD(),
+            BollingerBands()
+        ]
+    
+    @property
+    def outputs(self) -> List[str]:
+        return [name for indicator in self.indicators for name in indicator.outputs]
+    
+    def update(self, bar: Dict[str, float], timestamp: Optional[pd.Timestamp] = None) -> Dict[str, float]:
+        """Feed one bar (mapping with Close, Volume, ...) and return the latest indicator values"""
+        values = {key: float(value) for key, value in bar.items()}
+        results = {}
+        for indicator in self.indicators:
+            output = indicator.update(values)
+            values.update(output)
+            results.update(output)
+        if timestamp is not None:
+            self.last_timestamp = pd.Timestamp(timestamp)
+        return results
+    
+    def update_frame(self, df: pd.DataFrame, only_new: bool = True) -> pd.DataFrame:
+        """Feed bars from a frame, skipping ones already processed, and return their indicator rows"""
+        if only_new and self.last_timestamp is not None:
+            df = df[df.index > self.last_timestamp]
+        columns = list(df.columns)
+        rows = [
+            self.update(dict(zip(columns, values)), timestamp)
+            for timestamp, values in zip(df.index, df.itertuples(index=False, name=None))
+        ]
+        return pd.DataFrame(rows, index=df.index, columns=self.outputs)
+    
+    def state_dict(self) -> Dict:
+        return {
+            'last_timestamp': self.last_timestamp.isoformat() if self.last_timestamp is not None else None,
+            'indicators': [indicator.state_dict() for indicator in self.indicators]
+        }
+    
+    def load_state(self, state: Dict) -> None:
+        if len(state['indicators']) != len(self.indicators):
+            raise ValueError("Checkpoint does not match the configured indicators")
+        for indicator, indicator_state in zip(self.indicators, state['indicators']):
+            indicator.load_state(indicator_state)
+        self.last_timestamp = pd.Timestamp(state['last_timestamp']) if state['last_timestamp'] else None
+    
+    def save(self, path: str) -> None:
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        tmp_path = f'{path}.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump(self.state_dict(), f)
+        os.replace(tmp_path, path)
+    
+    @classmethod
+    def load(cls, path: str, indicators: Optional[List[Indicator]] = None) -> 'IncrementalIndicators':
+        engine = cls(indicators)
+        with open(path, 'r') as f:
+            engine.load_state(json.load(f))
+        return engine
+    
+    @staticmethod
+    def checkpoint_path(data_manager, ticker: str) -> str:
+        """Where a ticker's indicator state lives alongside its stored bars"""
+        return os.path.join(data_manager.storage_path, 'indicators', f'{ticker}.json')
+
+def _state(obj) -> Dict:
+    state = {}
+    for key, value in vars(obj).items():
+        if isinstance(value, (RollingWindow, EMA)):
+            state[key] = {'__type__': type(value).__name__, **_state(value)}
+        else:
+            state[key] = value
+    return state
+
+def _load_state(obj, state: Dict) -> None:
+    for key, value in state.items():
+        if isinstance(value, dict) and '__type__' in value:
+            _load_state(getattr(obj, key), {k: v for k, v in value.items() if k != '__type__'})
+        else:
+            setattr(obj, key, value)
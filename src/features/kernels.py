@@ -0,0 +1,109 @@
+"""Vectorized NumPy kernels shared by the feature registry and panel features.
+
+All kernels work along axis 0 (time) of 1-D series or 2-D (time, ticker)
+arrays and reproduce the matching pandas operation, including its NaN
+warm-up: a rolling result is NaN until the window is full and whenever the
+window contains a NaN.
+"""
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+def shift(x: np.ndarray, periods: int = 1) -> np.ndarray:
+    result = np.full(x.shape, np.nan)
+    if periods > 0:
+        result[periods:] = x[:-periods]
+    elif periods < 0:
+        result[:periods] = x[-periods:]
+    else:
+        result[:] = x
+    return result
+
+def pct_change(x: np.ndarray, periods: int = 1) -> np.ndarray:
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return x / shift(x, periods) - 1
+
+def diff(x: np.ndarray, periods: int = 1) -> np.ndarray:
+    return x - shift(x, periods)
+
+def rolling_sum(x: np.ndarray, window: int) -> np.ndarray:
+    # Infinities are masked like NaN so they cannot poison the cumulative sums
+    nan_mask = ~np.isfinite(x)
+    filled = np.where(nan_mask, 0.0, x)
+    zeros = np.zeros((1,) + x.shape[1:])
+    sums = np.concatenate([zeros, np.cumsum(filled, axis=0)])
+    nans = np.concatenate([zeros, np.cumsum(nan_mask, axis=0)])
+    
+    result = np.full(x.shape, np.nan)
+    if len(x) >= window:
+        window_sums = sums[window:] - sums[:-window]
+        window_nans = nans[window:] - nans[:-window]
+        result[window - 1:] = np.where(window_nans > 0, np.nan, window_sums)
+    return result
+
+def rolling_mean(x: np.ndarray, window: int) -> np.ndarray:
+    offset = _column_offset(x)
+    return rolling_sum(x - offset, window) / window + offset
+
+def rolling_std(x: np.ndarray, window: int, ddof: int = 1) -> np.ndarray:
+    centered = x - _column_offset(x)
+    sums = rolling_sum(centered, window)
+    squares = rolling_sum(centered * centered, window)
+    var = (squares - sums * sums / window) / (window - ddof)
+    return np.sqrt(np.maximum(var, 0.0))
+
+def _column_offset(x: np.ndarray) -> np.ndarray:
+    # Centering on the column mean keeps cumulative sums small and precise
+    finite = np.isfinite(x)
+    counts = finite.sum(axis=0)
+    totals = np.where(finite, x, 0.0).sum(axis=0)
+    return np.where(counts > 0, totals / np.maximum(counts, 1), 0.0)
+
+def rolling_min(x: np.ndarray, window: int) -> np.ndarray:
+    return _rolling_reduce(x, window, np.min)
+
+def rolling_max(x: np.ndarray, window: int) -> np.ndarray:
+    return _rolling_reduce(x, window, np.max)
+
+def _rolling_reduce(x: np.ndarray, window: int, reducer) -> np.ndarray:
+    result = np.full(x.shape, np.nan)
+    if len(x) >= window:
+        # NaN propagates through min/max, matching pandas' NaN windows
+        result[window - 1:] = reducer(sliding_window_view(x, window, axis=0), axis=-1)
+    return result
+
+def ewm_mean(x: np.ndarray, span: float = None, alpha: float = None, min_periods: int = 0) -> np.ndarray:
+    """``ewm(adjust=False).mean()`` as a linear filter, starting at each column's first valid value
+    
+    Interior NaNs are forward-filled, which matches pandas for series that
+    only have NaNs in their warm-up period.
+    """
+    alpha = alpha if alpha is not None else 2.0 / (span + 1.0)
+    x = np.asarray(x, dtype=float)
+    squeeze = x.ndim == 1
+    x2 = x.reshape(len(x), -1)
+    
+    valid = ~np.isnan(x2)
+    first = np.where(valid.any(axis=0), valid.argmax(axis=0), len(x2))
+    rows = np.arange(len(x2))[:, None]
+    
+    # Forward-fill, then back-fill the warm-up with the first valid value
+    filled = np.where(valid, x2, np.nan)
+    index = np.where(valid, rows, 0)
+    np.maximum.accumulate(index, axis=0, out=index)
+    filled = filled[index, np.arange(x2.shape[1])]
+    seed = np.where(first < len(x2), x2[np.minimum(first, len(x2) - 1), np.arange(x2.shape[1])], 0.0)
+    filled = np.where(rows < first, seed, filled)
+    
+    # scipy.signal takes about a second to import, so only pay for it when an EWM is computed
+    from scipy.signal import lfilter
+    result = lfilter([alpha], [1.0, alpha - 1.0], filled, axis=0, zi=((1 - alpha) * seed)[None, :])[0]
+    
+    # Restore the warm-up as NaN, counting min_periods from the first valid value
+    valid_count = np.cumsum(valid, axis=0)
+    result[(rows < first) | (valid_count < max(min_periods, 1))] = np.nan
+    return result[:, 0] if squeeze else result
+
+def where_greater(a: np.ndarray, b: np.ndarray, true_value: float = 1.0, false_value: float = -1.0) -> np.ndarray:
+    """``np.where(a > b, 1, -1)``; comparisons with NaN take the false branch like the pandas code"""
+    with np.errstate(invalid='ignore'):
+        return np.where(a > b, true_value, false_value)
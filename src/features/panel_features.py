@@ -0,0 +1,58 @@
+"""Vectorized feature computation over (time, ticker) panels.
+
+The feature registry kernels operate along the time axis of 2-D arrays, so
+a whole universe is computed in one pass per feature instead of one pandas
+call per ticker. Warm-up NaNs are tracked per ticker: a ticker that starts
+trading later simply has leading NaNs in its column. The panel assumes a
+shared trading calendar; a missing bar inside a ticker's history behaves
+like a NaN row in pandas and blanks the rolling windows that contain it.
+"""
+import math
+import os
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Sequence
+from .feature_registry import REGISTRY
+from src.data.panel import OHLCVPanel
+
+def compute_panel_features(panel: OHLCVPanel, features: Sequence[str],
+                           start_date: Optional[str] = None, end_date: Optional[str] = None,
+                           tickers: Optional[List[str]] = None) -> np.ndarray:
+    """Compute features for every ticker at once; returns a (time, ticker, feature) array"""
+    data = panel.slice(start_date, end_date, tickers)
+    return REGISTRY.compute(data, features)
+
+def compute_panel_features_parallel(panel_path: str, features: Sequence[str], out_path: str,
+                                    n_jobs: Optional[int] = None,
+                                    chunk_size: Optional[int] = None) -> np.ndarray:
+    """Split the ticker axis into chunks computed by a process pool
+    
+    Workers memory-map the input panel and write their chunk straight into
+    a shared ``.npy`` output, so neither inputs nor results are pickled.
+    Returns the output opened read-only as a memory map.
+    """
+    panel = OHLCVPanel(panel_path)
+    features = list(features)
+    n_tickers = len(panel.tickers)
+    n_jobs = n_jobs or os.cpu_count() or 1
+    chunk_size = chunk_size or max(1, math.ceil(n_tickers / (n_jobs * 4)))
+    
+    out = np.lib.format.open_memmap(out_path, mode='w+', dtype=np.float64,
+                                    shape=panel.shape + (len(features),))
+    del out
+    
+    chunks = [(start, min(start + chunk_size, n_tickers)) for start in range(0, n_tickers, chunk_size)]
+    with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+        futures = [executor.submit(_compute_chunk, panel_path, out_path, features, chunk) for chunk in chunks]
+        for future in futures:
+            future.result()
+    
+    return np.load(out_path, mmap_mode='r')
+
+def _compute_chunk(panel_path: str, out_path: str, features: List[str], columns: tuple) -> None:
+    start, stop = columns
+    panel = OHLCVPanel(panel_path)
+    data = {field: panel.field(field)[:, start:stop] for field in panel.fields}
+    out = np.load(out_path, mmap_mode='r+')
+    REGISTRY.compute(data, features, out=out[:, start:stop])
+    out.flush()
@@ -0,0 +1,119 @@
+import heapq
+import math
+from collections import deque
+import numpy as np
+
+class RollingQuantile:
+    """Causal rolling quantile over the last ``window`` values in O(log w) per update.
+    
+    Two heaps split the window at the quantile's rank: a max-heap with the
+    smallest k values and a min-heap with the rest, where k puts the lower
+    interpolation point on top of the max-heap. Values leaving the window are
+    deleted lazily when they reach a heap top. Results use pandas' 'linear'
+    interpolation and are NaN until the window is full or while it contains
+    a NaN.
+    """
+    
+    def __init__(self, window: int, q: float):
+        if not 0 <= q <= 1:
+            raise ValueError("Quantile must be between 0 and 1")
+        self.window = window
+        self.q = q
+        position = q * (window - 1)
+        self.rank = int(math.floor(position))
+        self.fraction = position - self.rank
+        self.low = []   # max-heap of (-value, -seq)
+        self.high = []  # min-heap of (value, seq)
+        self.low_size = 0
+        self.high_size = 0
+        self.removed = set()
+        self.buffer = deque()
+        self.seq = 0
+        self.nan_count = 0
+    
+    def update(self, x: float) -> float:
+        item = (x, self.seq)
+        self.seq += 1
+        self.buffer.append(item)
+        if math.isnan(x):
+            self.nan_count += 1
+        else:
+            self._insert(item)
+        
+        if len(self.buffer) > self.window:
+            old = self.buffer.popleft()
+            if math.isnan(old[0]):
+                self.nan_count -= 1
+            else:
+                self._erase(old)
+        
+        if len(self.buffer) < self.window or self.nan_count:
+            return float('nan')
+        return self._quantile()
+    
+    def _quantile(self) -> float:
+        lower = self._low_top()[0]
+        if self.fraction == 0:
+            return lower
+        upper = self._high_top()[0]
+        return lower + self.fraction * (upper - lower)
+    
+    def _insert(self, item) -> None:
+        if self.low_size and item <= self._low_top():
+            heapq.heappush(self.low, (-item[0], -item[1]))
+            self.low_size += 1
+        else:
+            heapq.heappush(self.high, item)
+            self.high_size += 1
+        self._rebalance()
+    
+    def _erase(self, item) -> None:
+        # Decide the side before marking the item, or pruning could drop it first
+        if self.low_size and item <= self._low_top():
+            self.low_size -= 1
+        else:
+            self.high_size -= 1
+        self.removed.add(item[1])
+        self._prune()
+        self._rebalance()
+    
+    def _rebalance(self) -> None:
+        target = min(self.low_size + self.high_size, self.rank + 1)
+        while self.low_size > target:
+            value, seq = self._low_top()
+            heapq.heappop(self.low)
+            heapq.heappush(self.high, (value, seq))
+            self.low_size -= 1
+            self.high_size += 1
+            self._prune()
+        while self.low_size < target:
+            value, seq = self._high_top()
+            heapq.heappop(self.high)
+            heapq.heappush(self.low, (-value, -seq))
+            self.low_size += 1
+            self.high_size -= 1
+            self._prune()
+    
+    def _low_top(self):
+        self._prune()
+        value, seq = self.low[0]
+        return (-value, -seq)
+    
+    def _high_top(self):
+        self._prune()
+        return self.high[0]
+    
+    def _prune(self) -> None:
+        while self.low and -self.low[0][1] in self.removed:
+            self.removed.discard(-heapq.heappop(self.low)[1])
+        while self.high and self.high[0][1] in self.removed:
+            self.removed.discard(heapq.heappop(self.high)[1])
+
+def rolling_quantile(x: np.ndarray, window: int, q: float) -> np.ndarray:
+    """Batch causal rolling quantile along axis 0 of a 1-D or 2-D array"""
+    x = np.asarray(x, dtype=float)
+    if x.ndim == 2:
+        return np.column_stack([rolling_quantile(x[:, j], window, q) for j in range(x.shape[1])])
+    
+    rolling = RollingQuantile(window, q)
+    return np.fromiter((rolling.update(value) for value in x.tolist()), dtype=float, count=len(x))
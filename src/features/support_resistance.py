@@ -0,0 +1,203 @@
+"""Support and resistance from rolling extremes and clustered swing pivots.
+
+Rolling lows/highs for several windows share one monotonic deque per side:
+the deque spans the longest window, and the extreme of any shorter window is
+the first deque entry inside it, found by bisecting the entry indices. Swing
+pivots are confirmed ``pivot_window`` bars after they print and merged into
+price levels within a relative tolerance, each level counting its touches.
+
+``SupportResistanceTracker`` processes one bar at a time for streaming use;
+``support_resistance`` runs the same tracker over a whole frame, so batch and
+streaming results are identical. Work per bar is O(log n) in the number of
+windows and levels, so cost grows linearly with the number of bars.
+"""
+import numpy as np
+import pandas as pd
+from bisect import bisect_left, bisect_right, insort
+from collections import deque
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence
+
+@dataclass
+class PriceLevel:
+    price: float
+    touches: int
+    first_index: int
+    last_index: int
+
+class RollingExtremes:
+    """Rolling minimum or maximum over several windows from one monotonic deque"""
+
+    def __init__(self, windows: Sequence[int], kind: str = 'min'):
+        if kind not in ('min', 'max'):
+            raise ValueError(f"kind must be 'min' or 'max', got {kind}")
+        self.windows = tuple(int(w) for w in windows)
+        self.kind = kind
+        self._span = max(self.windows)
+        # Deque as parallel lists with a moving head so entry indices can be bisected
+        self._index: List[int] = []
+        self._values: List[float] = []
+        self._head = 0
+        self._t = -1
+        self._last_nan = -1
+
+    def update(self, value: float) -> List[float]:
+        """Add the next value and return the extreme for each window
+
+        As with pandas rolling min/max, a window is NaN until it holds
+        ``window`` valid values.
+        """
+        self._t += 1
+        t = self._t
+        if value != value:
+            self._last_nan = t
+        else:
+            values, index = self._values, self._index
+            if self.kind == 'min':
+                while len(values) > self._head and values[-1] >= value:
+                    values.pop()
+                    index.pop()
+            else:
+                while len(values) > self._head and values[-1] <= value:
+                    values.pop()
+                    index.pop()
+            values.append(value)
+            index.append(t)
+
+        while self._head < len(self._index) and self._index[self._head] <= t - self._span:
+            self._head += 1
+        if self._head > 1024 and 2 * self._head > len(self._index):
+            del self._index[:self._head]
+            del self._values[:self._head]
+            self._head = 0
+
+        result = []
+        for window in self.windows:
+            if t - self._last_nan < window:
+                result.append(np.nan)
+            else:
+                result.append(self._values[bisect_left(self._index, t - window + 1, self._head)])
+        return result
+
+class PriceLevels:
+    """Pivot prices clustered into levels kept sorted by price"""
+
+    def __init__(self, tolerance: float = 0.01, min_touches: int = 2):
+        self.tolerance = tolerance
+        self.min_touches = min_touches
+        self._levels: List[PriceLevel] = []
+        self._prices: List[float] = []  # Prices of all levels, parallel to _levels
+        self._confirmed: List[float] = []  # Prices of levels with at least min_touches
+
+    @property
+    def levels(self) -> List[PriceLevel]:
+        return list(self._levels)
+
+    def add(self, price: float, index: int) -> PriceLevel:
+        """Merge a pivot into the nearest level within tolerance, or start a new one"""
+        position = bisect_left(self._prices, price)
+        nearest = min(
+            (p for p in (position - 1, position) if 0 <= p < len(self._prices)),
+            key=lambda p: abs(self._prices[p] - price),
+            default=None
+        )
+        if nearest is None or abs(self._prices[nearest] - price) > self.tolerance * abs(price):
+            level = PriceLevel(price, 1, index, index)
+            self._insert(position, level)
+            return level
+
+        level = self._remove(nearest)
+        level.price += (price - level.price) / (level.touches + 1)
+        level.touches += 1
+        level.last_index = index
+        self._insert(bisect_left(self._prices, level.price), level)
+        return level
+
+    def _insert(self, position: int, level: PriceLevel) -> None:
+        self._levels.insert(position, level)
+        self._prices.insert(position, level.price)
+        if level.touches >= self.min_touches:
+            insort(self._confirmed, level.price)
+
+    def _remove(self, position: int) -> PriceLevel:
+        level = self._levels.pop(position)
+        self._prices.pop(position)
+        if level.touches >= self.min_touches:
+            del self._confirmed[bisect_left(self._confirmed, level.price)]
+        return level
+
+    def nearest(self, price: float) -> Dict[str, Optional[PriceLevel]]:
+        """Closest confirmed level at or below the price and strictly above it"""
+        position = bisect_right(self._confirmed, price)
+        below = self._confirmed[position - 1] if position > 0 else None
+        above = self._confirmed[position] if position < len(self._confirmed) else None
+        return {
+            'support': self._levels[bisect_left(self._prices, below)] if below is not None else None,
+            'resistance': self._levels[bisect_left(self._prices, above)] if above is not None else None
+        }
+
+class SupportResistanceTracker:
+    """Per-bar support/resistance features, updated in streaming fashion"""
+
+    def __init__(self, windows: Sequence[int] = (20,), pivot_window: int = 5,
+                 tolerance: float = 0.01, min_touches: int = 2):
+        self.windows = tuple(windows)
+        self.pivot_window = pivot_window
+        pivot_span = 2 * pivot_window + 1
+        self._lows = RollingExtremes(self.windows + (pivot_span,), 'min')
+        self._highs = RollingExtremes(self.windows + (pivot_span,), 'max')
+        self.levels = PriceLevels(tolerance, min_touches)
+        # The pivot candidate and the bars after it
+        self._recent_highs = deque(maxlen=pivot_window + 1)
+        self._recent_lows = deque(maxlen=pivot_window + 1)
+        self._t = -1
+
+    def update(self, high: float, low: float, close: float) -> Dict[str, float]:
+        """Feed one bar and return its features"""
+        self._t += 1
+        lows = self._lows.update(low)
+        highs = self._highs.update(high)
+
+        self._recent_highs.append(high)
+        self._recent_lows.append(low)
+
+        features = {}
+        for window, support, resistance in zip(self.windows, lows, highs):
+            features[f'Support_{window}'] = support
+            features[f'Resistance_{window}'] = resistance
+            features[f'Support_Distance_{window}'] = (close - support) / close
+            features[f'Resistance_Distance_{window}'] = (close - resistance) / close
+
+        # The bar pivot_window bars back is a pivot if it is the extreme of the
+        # pivot_window bars on each side of it; on flat tops only the last bar counts
+        pivot_high = pivot_low = 0.0
+        candidate = self._t - self.pivot_window
+        later_highs, later_lows = list(self._recent_highs)[1:], list(self._recent_lows)[1:]
+        if highs[-1] == self._recent_highs[0] and all(h < highs[-1] for h in later_highs):
+            pivot_high = 1.0
+            self.levels.add(highs[-1], candidate)
+        if lows[-1] == self._recent_lows[0] and all(l > lows[-1] for l in later_lows):
+            pivot_low = 1.0
+            self.levels.add(lows[-1], candidate)
+        features['Pivot_High'] = pivot_high
+        features['Pivot_Low'] = pivot_low
+
+        nearest = self.levels.nearest(close) if close == close else {'support': None, 'resistance': None}
+        for role, name in (('support', 'Support'), ('resistance', 'Resistance')):
+            level = nearest[role]
+            features[f'Level_{name}'] = level.price if level else np.nan
+            features[f'Level_{name}_Distance'] = (close - level.price) / close if level else np.nan
+            features[f'Level_{name}_Touches'] = float(level.touches) if level else 0.0
+        return features
+
+def support_resistance(df: pd.DataFrame, windows: Sequence[int] = (20,), pivot_window: int = 5,
+                       tolerance: float = 0.01, min_touches: int = 2) -> pd.DataFrame:
+    """Support/resistance features for every bar of an OHLC frame"""
+    tracker = SupportResistanceTracker(windows, pivot_window, tolerance, min_touches)
+    rows = [
+        tracker.update(high, low, close)
+        for high, low, close in zip(df['High'].to_numpy(dtype=float),
+                                    df['Low'].to_numpy(dtype=float),
+                                    df['Close'].to_numpy(dtype=float))
+    ]
+    return pd.DataFrame(rows, index=df.index)
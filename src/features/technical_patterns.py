@@ -1,50 +1,39 @@
 import pandas as pd
 import numpy as np
-from typing import Dict
+from typing import Dict, Optional
+from .candlestick_patterns import detect_patterns
+from .support_resistance import support_resistance
 
 class TechnicalPatterns:
     @staticmethod
-    def detect_candlestick_patterns(df: pd.DataFrame) -> Dict[str, np.ndarray]:
-        """Detect various candlestick patterns"""
-        df = df.copy()
+    def detect_candlestick_patterns(df: pd.DataFrame, window: Optional[int] = None,
+                                    extended: bool = False) -> Dict[str, np.ndarray]:
+        """Detect various candlestick patterns
         
-        # Calculate candlestick properties
-        df['Body'] = df['Close'] - df['Open']
-        df['Upper_Shadow'] = df['High'] - df[['Open', 'Close']].max(axis=1)
-        df['Lower_Shadow'] = df[['Open', 'Close']].min(axis=1) - df['Low']
-        df['Body_Size'] = abs(df['Body'])
+        window switches the Doji thresholds from whole-history quantiles to
+        causal rolling quantiles; extended adds engulfing, harami and
+        morning/evening star patterns.
+        """
+        patterns = detect_patterns(
+            df['Open'].to_numpy(dtype=float),
+            df['High'].to_numpy(dtype=float),
+            df['Low'].to_numpy(dtype=float),
+            df['Close'].to_numpy(dtype=float),
+            doji_window=window
+        )
         
-        patterns = {}
-        
-        # Doji pattern (small body, longer shadows)
-        body_percentile = df['Body_Size'].quantile(0.2)
-        shadow_percentile = df['Upper_Shadow'].quantile(0.8)
-        patterns['Doji'] = (
-            (df['Body_Size'] <= body_percentile) & 
-            ((df['Upper_Shadow'] >= shadow_percentile) | 
-             (df['Lower_Shadow'] >= shadow_percentile))
-        ).astype(int)
-        
-        # Hammer pattern
-        patterns['Hammer'] = (
-            (df['Body_Size'] > 0) &  # Positive body
-            (df['Lower_Shadow'] > 2 * df['Body_Size']) &  # Long lower shadow
-            (df['Upper_Shadow'] < df['Body_Size'])  # Short upper shadow
-        ).astype(int)
-        
-        # Shooting Star pattern
-        patterns['Shooting_Star'] = (
-            (df['Body_Size'] > 0) &  # Positive body
-            (df['Upper_Shadow'] > 2 * df['Body_Size']) &  # Long upper shadow
-            (df['Lower_Shadow'] < df['Body_Size'])  # Short lower shadow
-        ).astype(int)
-        
-        return patterns
+        names = list(patterns) if extended else ['Doji', 'Hammer', 'Shooting_Star']
+        return {name: pd.Series(patterns[name].astype(int), index=df.index) for name in names}
 
     @staticmethod
-    def detect_support_resistance(df: pd.DataFrame, window: int = 20) -> Dict[str, np.ndarray]:
-        """Detect support and resistance levels"""
-        df = df.copy()
+    def detect_support_resistance(df: pd.DataFrame, window: int = 20, pivot_window: Optional[int] = None,
+                                  tolerance: float = 0.01, min_touches: int = 2) -> Dict[str, np.ndarray]:
+        """Detect support and resistance levels
+        
+        With pivot_window, swing pivots are also clustered into price levels
+        and the distance to the nearest confirmed level above and below is
+        added for every bar.
+        """
         levels = {}
         
         # Rolling min/max for support/resistance
@@ -57,6 +46,13 @@ class TechnicalPatterns:
                 (df['Close'] - levels[level_type]) / df['Close']
             )
         
+        if pivot_window is not None:
+            features = support_resistance(df, (window,), pivot_window, tolerance, min_touches)
+            for name in ['Pivot_High', 'Pivot_Low', 'Level_Support', 'Level_Resistance',
+                         'Level_Support_Distance', 'Level_Resistance_Distance',
+                         'Level_Support_Touches', 'Level_Resistance_Touches']:
+                levels[name] = features[name]
+        
         return levels
 
     @staticmethod
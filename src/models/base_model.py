@@ -1,7 +1,7 @@
 from abc import ABC, abstractmethod
 import numpy as np
 import pandas as pd
-from typing import Tuple, Dict
+from typing import Tuple, Dict, Optional
 
 class BaseModel(ABC):
     @abstractmethod
@@ -10,7 +10,9 @@ class BaseModel(ABC):
         pass
     
     @abstractmethod
-    def predict(self, X: np.ndarray) -> np.ndarray:
+    def predict(self, X: np.ndarray, context: Optional[np.ndarray] = None) -> np.ndarray:
+        """One prediction per row of X; context holds the rows just before X,
+        so sequence models can predict its first rows too"""
         pass
     
     @abstractmethod
@@ -0,0 +1,225 @@
+import json
+import os
+import time
+import traceback
+import numpy as np
+import pandas as pd
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+from datetime import datetime
+from multiprocessing import shared_memory
+from typing import Dict, List, Optional
+from src.evaluation.drift import DriftDetector
+from src.evaluation.metrics import EvaluationMetrics
+from src.features.feature_constants import TRAINING_FEATURES
+from src.features.feature_registry import REGISTRY
+from src.models.model_registry import ModelRegistry
+from src.models.stock_predictor import StockPredictor
+
+# Shared feature block as seen by a worker process, attached once by _attach
+_SHARED = {}
+
+def _attach(name: str, shape: tuple, n_jobs: int) -> None:
+    from threadpoolctl import threadpool_limits
+    shm = shared_memory.SharedMemory(name=name)
+    _SHARED['shm'] = shm
+    _SHARED['array'] = np.ndarray(shape, dtype=np.float64, buffer=shm.buf)
+    # Keep BLAS/OpenMP inside each worker to its share of the cores
+    _SHARED['limits'] = threadpool_limits(n_jobs)
+
+def _fit_ticker(ticker: str, rows: slice, data_start: str, data_end: str, registry_root: str,
+                config, horizon: Optional[int], n_jobs: int) -> Dict:
+    """Train one ticker from its rows of the shared block and register the artifact"""
+    start = time.perf_counter()
+    try:
+        block = _SHARED['array'][rows]
+        n_features = len(TRAINING_FEATURES)
+        X = pd.DataFrame(block[:, :n_features], columns=TRAINING_FEATURES)
+        y = block[:, n_features:] if horizon is not None else block[:, n_features]
+
+        predictor = StockPredictor.from_config(config, horizon=horizon) if config else StockPredictor(horizon=horizon)
+        # Out-of-bag predictions give holdout metrics without a second fit
+        predictor.model.set_params(n_jobs=n_jobs, oob_score=True)
+        X_scaled = predictor.scaler.fit_transform(X)
+        predictor.model.fit(X_scaled, y)
+        predictor.drift_detector = DriftDetector(X_scaled, TRAINING_FEATURES)
+
+        oob = predictor.model.oob_prediction_
+        metrics = EvaluationMetrics.calculate_metrics(
+            np.ravel(y if horizon is None else y[:, 0]), np.ravel(oob if horizon is None else oob[:, 0])
+        )
+        metrics = {name: float(value) for name, value in metrics.items()}
+
+        predictor.register(ModelRegistry(registry_root), ticker, data_start, data_end,
+                           {'oob_metrics': metrics, 'rows': len(X)})
+        return {'ticker': ticker, 'status': 'done', 'metrics': metrics,
+                'seconds': time.perf_counter() - start}
+    except Exception:
+        return {'ticker': ticker, 'status': 'failed', 'error': traceback.format_exc(limit=3),
+                'seconds': time.perf_counter() - start}
+
+@dataclass
+class BatchSummary:
+    trained: Dict[str, Dict] = field(default_factory=dict)  # ticker -> out-of-bag metrics
+    skipped: List[str] = field(default_factory=list)
+    failed: Dict[str, str] = field(default_factory=dict)  # ticker -> error
+    elapsed: float = 0.0
+
+    def report(self) -> str:
+        lines = [
+            f"Trained {len(self.trained)} tickers in {self.elapsed:.1f}s",
+            f"Already trained on the latest bars: {len(self.skipped)}",
+            f"Failed: {len(self.failed)}"
+        ]
+        for ticker, error in sorted(self.failed.items()):
+            lines.append(f"  {ticker}: {error.strip().splitlines()[-1]}")
+        return '\n'.join(lines)
+
+class BatchTrainer:
+    """Train one StockPredictor per ticker across a process pool.
+
+    The training rows of every ticker are packed once into a single
+    shared-memory block that workers attach to by name, so no feature
+    matrix is pickled per task. Each worker fits with n_jobs threads, with
+    max_workers * n_jobs kept within the core count. A failing ticker is
+    recorded and the batch carries on. If a worker process dies, the pool
+    cannot tell which ticker killed it, so every unfinished ticker is rerun
+    in a process of its own, up to max_retries more times after it dies
+    there. Every finished ticker is registered
+    in the ModelRegistry and appended to a JSON-lines journal straight
+    away; rerunning after a crash skips tickers the journal already has as
+    trained on the same last bar.
+    """
+
+    def __init__(self, registry: Optional[ModelRegistry] = None, journal_path: str = 'models/batch_journal.jsonl',
+                 max_workers: Optional[int] = None, n_jobs: Optional[int] = None, config=None,
+                 horizon: Optional[int] = None, max_retries: int = 1):
+        cores = os.cpu_count() or 1
+        self.registry = registry or ModelRegistry()
+        self.journal_path = journal_path
+        self.max_workers = max_workers or cores
+        self.n_jobs = n_jobs or max(1, cores // self.max_workers)
+        self.config = config
+        self.horizon = horizon
+        self.max_retries = max_retries
+
+    def run(self, frames: Dict[str, pd.DataFrame]) -> BatchSummary:
+        """Train every ticker in frames (ticker -> feature frame with TRAINING_FEATURES and Returns)"""
+        start = time.perf_counter()
+        summary = BatchSummary()
+        fingerprint = REGISTRY.fingerprint(TRAINING_FEATURES)
+        journal = self._load_journal()
+
+        pending = {}
+        for ticker, df in frames.items():
+            last = journal.get(ticker, {})
+            if (last.get('status') == 'done' and last.get('data_end') == df.index[-1].isoformat()
+                    and last.get('fingerprint') == fingerprint and last.get('horizon') == self.horizon):
+                summary.skipped.append(ticker)
+            else:
+                pending[ticker] = df
+
+        if pending:
+            self._train(pending, fingerprint, summary)
+
+        summary.elapsed = time.perf_counter() - start
+        print(summary.report())
+        return summary
+
+    def _train(self, frames: Dict[str, pd.DataFrame], fingerprint: str, summary: BatchSummary) -> None:
+        # Pack each ticker's training rows (features, then targets) into one block
+        blocks, tasks = [], []
+        offset = 0
+        for ticker, df in frames.items():
+            X, y = StockPredictor(horizon=self.horizon)._features_and_targets(df)
+            block = np.column_stack([X.to_numpy(dtype=float), y.to_numpy(dtype=float)])
+            block = block[np.isfinite(block).all(axis=1)]
+            if len(block) == 0:
+                summary.failed[ticker] = "No complete training rows"
+                self._append_journal({'ticker': ticker, 'status': 'failed', 'error': summary.failed[ticker]})
+                continue
+            blocks.append(block)
+            tasks.append((ticker, slice(offset, offset + len(block)), df.index[0].isoformat(), df.index[-1].isoformat()))
+            offset += len(block)
+        if not tasks:
+            return
+
+        shape = (offset, blocks[0].shape[1])
+        shm = shared_memory.SharedMemory(create=True, size=int(np.prod(shape)) * 8)
+        try:
+            shared = np.ndarray(shape, dtype=np.float64, buffer=shm.buf)
+            for block, (_, rows, _, _) in zip(blocks, tasks):
+                shared[rows] = block
+            del blocks
+
+            unfinished = []
+            with ProcessPoolExecutor(max_workers=min(self.max_workers, len(tasks)), initializer=_attach,
+                                     initargs=(shm.name, shape, self.n_jobs)) as executor:
+                futures = {executor.submit(_fit_ticker, *self._task_args(task)): task for task in tasks}
+                for future in as_completed(futures):
+                    task = futures[future]
+                    try:
+                        result = future.result()
+                    except BrokenProcessPool:
+                        unfinished.append(task)
+                        continue
+                    self._record(result, task, fingerprint, summary)
+
+            if unfinished:
+                print(f"A worker process died; retrying {len(unfinished)} unfinished tickers one per process")
+                with ThreadPoolExecutor(max_workers=min(self.max_workers, len(unfinished))) as threads:
+                    futures = {threads.submit(self._fit_isolated, shm.name, shape, task): task for task in unfinished}
+                    for future in as_completed(futures):
+                        self._record(future.result(), futures[future], fingerprint, summary)
+            del shared
+        finally:
+            shm.close()
+            shm.unlink()
+
+    def _task_args(self, task: tuple) -> tuple:
+        ticker, rows, data_start, data_end = task
+        return (ticker, rows, data_start, data_end, self.registry.root, self.config, self.horizon, self.n_jobs)
+
+    def _fit_isolated(self, shm_name: str, shape: tuple, task: tuple) -> Dict:
+        """Fit one ticker in a process of its own, so a crash is known to be this ticker's"""
+        start = time.perf_counter()
+        for attempt in range(self.max_retries + 1):
+            with ProcessPoolExecutor(max_workers=1, initializer=_attach,
+                                     initargs=(shm_name, shape, self.n_jobs)) as executor:
+                try:
+                    return executor.submit(_fit_ticker, *self._task_args(task)).result()
+                except BrokenProcessPool:
+                    continue
+        return {'ticker': task[0], 'status': 'failed',
+                'error': f"Worker process died in {self.max_retries + 1} isolated attempts",
+                'seconds': time.perf_counter() - start}
+
+    def _record(self, result: Dict, task: tuple, fingerprint: str, summary: BatchSummary) -> None:
+        ticker, data_end = task[0], task[3]
+        if result['status'] == 'done':
+            summary.trained[ticker] = result['metrics']
+        else:
+            summary.failed[ticker] = result['error']
+        self._append_journal({**result, 'data_end': data_end, 'fingerprint': fingerprint,
+                              'horizon': self.horizon})
+
+    def _load_journal(self) -> Dict[str, Dict]:
+        """Latest journal record per ticker"""
+        records = {}
+        if os.path.exists(self.journal_path):
+            with open(self.journal_path) as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue  # Line cut short by a crash
+                    records[record['ticker']] = record
+        return records
+
+    def _append_journal(self, record: Dict) -> None:
+        os.makedirs(os.path.dirname(self.journal_path) or '.', exist_ok=True)
+        with open(self.journal_path, 'a') as f:
+            f.write(json.dumps({**record, 'finished_at': datetime.now().isoformat()}) + '\n')
+            f.flush()
+            os.fsync(f.fileno())
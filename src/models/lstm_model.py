@@ -1,20 +1,55 @@
+import hashlib
+import json
+import os
+import shutil
+import time
 import numpy as np
+from tensorflow.keras.callbacks import BackupAndRestore, Callback, EarlyStopping, ReduceLROnPlateau
 from tensorflow.keras.models import Sequential, load_model
 from tensorflow.keras.layers import LSTM, Dense, Dropout
 from tensorflow.keras.optimizers import Adam
+from src.data.sequence_dataset import SequenceDataset
+from src.evaluation.drift import DriftDetector, drift_gate
 from src.models.base_model import BaseModel
-from typing import Dict
+from typing import Dict, List, Optional
+
+class EpochTimer(Callback):
+    """Logs wall-clock time and throughput of every epoch"""
+    
+    def __init__(self, n_samples: int):
+        super().__init__()
+        self.n_samples = n_samples
+        self.seconds: List[float] = []
+    
+    def on_epoch_begin(self, epoch, logs=None):
+        self._start = time.perf_counter()
+    
+    def on_epoch_end(self, epoch, logs=None):
+        seconds = time.perf_counter() - self._start
+        self.seconds.append(seconds)
+        losses = ', '.join(f'{name} {value:.6g}' for name, value in (logs or {}).items())
+        print(f"Epoch {epoch + 1}: {seconds:.2f}s, {self.n_samples / seconds:.0f} samples/s, {losses}")
 
 class LSTMModel(BaseModel):
+    """Stacked LSTM regressor
+    
+    Accepts either ready-made 3-D (samples, timesteps, features) windows or
+    2-D (time, features) matrices. 2-D input is streamed to Keras as
+    config.lstm_lookback windows over the matrix (see SequenceDataset), so
+    predictions start at row lookback - 1 unless context rows are given.
+    The network is built on first use, once the feature count is known.
+    """
+    
     def __init__(self, config):
         self.config = config
-        self.model = self._build_model()
+        self.model = None
+        self.drift_detector = None
     
-    def _build_model(self) -> Sequential:
+    def _build_model(self, n_features: int) -> Sequential:
         model = Sequential([
             LSTM(units=self.config.lstm_units, 
                  return_sequences=True, 
-                 input_shape=(None, self.config.n_features)),
+                 input_shape=(None, n_features)),
             Dropout(0.2),
             LSTM(units=self.config.lstm_units//2),
             Dropout(0.2),
@@ -27,21 +62,160 @@ class LSTMModel(BaseModel):
         )
         return model
     
-    def train(self, X_train, y_train, X_val, y_val) -> Dict:
+    def _inputs(self, X, y=None, context: Optional[np.ndarray] = None, shuffle: bool = False) -> Dict:
+        """Keyword arguments for fit/predict: arrays for 3-D input, a tf.data pipeline for 2-D
+        
+        context rows (e.g. the end of the preceding split) are prepended so
+        the first rows of X get full windows too.
+        """
+        if np.ndim(X) == 3:
+            inputs = {'x': X, 'batch_size': self.config.batch_size}
+            if y is not None:
+                inputs['y'] = y
+            return inputs
+        
+        X = np.asarray(X)
+        if context is not None and self.config.lstm_lookback > 1:
+            context = np.asarray(context)[-(self.config.lstm_lookback - 1):]
+            X = np.concatenate([context, X])
+            if y is not None:
+                y = np.concatenate([np.full(len(context), np.nan), np.asarray(y, dtype=float)])
+        
+        dataset = SequenceDataset(X, y, lookback=self.config.lstm_lookback)
+        return {'x': dataset.to_tf_dataset(self.config.batch_size, shuffle=shuffle, seed=self.config.random_state)}
+    
+    def _validation_data(self, X_val, y_val, context: Optional[np.ndarray] = None):
+        if X_val is None:
+            return None
+        if np.ndim(X_val) == 3:
+            return (X_val, y_val)
+        return self._inputs(X_val, y_val, context=context)['x']
+    
+    def _n_samples(self, X) -> int:
+        return len(X) if np.ndim(X) == 3 else len(X) - self.config.lstm_lookback + 1
+    
+    def _callbacks(self, n_samples: int, validation: bool, backup_dir: str) -> List[Callback]:
+        """Stop when the monitored loss plateaus, keep the best weights, and
+        back up every epoch so a killed job resumes where it stopped"""
+        monitor = 'val_loss' if validation else 'loss'
+        return [
+            EarlyStopping(monitor=monitor, patience=self.config.lstm_early_stopping_patience,
+                          restore_best_weights=True),
+            ReduceLROnPlateau(monitor=monitor, factor=self.config.lstm_lr_factor,
+                              patience=self.config.lstm_lr_patience, min_lr=self.config.lstm_min_lr),
+            BackupAndRestore(backup_dir),
+            EpochTimer(n_samples)
+        ]
+    
+    def _backup_dir(self, backup_name: str, epochs: int, *arrays) -> str:
+        """Backup directory of this run, cleared if it holds another run's state
+        
+        The directory is named by symbol and a hash of the training data (its
+        features and date range), so jobs on other tickers or data never share
+        one. A marker file records a hash of the config and epochs, and a
+        backup left by a run with different settings is discarded.
+        """
+        data_digest = hashlib.sha256()
+        for array in arrays:
+            if array is not None:
+                array = np.ascontiguousarray(array)
+                data_digest.update(f'{array.dtype}|{array.shape}|'.encode())
+                data_digest.update(array.data)
+        run_key = hashlib.sha256(f'{self.config!r}|{epochs}'.encode()).hexdigest()
+        
+        backup_dir = os.path.join(self.config.lstm_backup_dir, backup_name,
+                                  f'{self.config.symbol}_{data_digest.hexdigest()[:16]}')
+        marker = os.path.join(backup_dir, 'run.json')
+        if os.path.exists(backup_dir):
+            previous = None
+            if os.path.exists(marker):
+                with open(marker) as f:
+                    previous = json.load(f).get('run_key')
+            if previous != run_key:
+                shutil.rmtree(backup_dir)
+        os.makedirs(backup_dir, exist_ok=True)
+        with open(marker, 'w') as f:
+            json.dump({'run_key': run_key}, f)
+        return backup_dir
+    
+    def _fit(self, X, y, X_val, y_val, epochs: int, context: Optional[np.ndarray] = None,
+             val_context: Optional[np.ndarray] = None, backup_name: str = 'train') -> Dict:
+        backup_dir = self._backup_dir(backup_name, epochs, context, X, y, X_val, y_val)
+        callbacks = self._callbacks(self._n_samples(X), X_val is not None, backup_dir)
         history = self.model.fit(
-            X_train, y_train,
-            validation_data=(X_val, y_val),
-            epochs=self.config.lstm_epochs,
-            batch_size=self.config.batch_size,
-            verbose=1
+            **self._inputs(X, y, context=context, shuffle=True),
+            validation_data=self._validation_data(X_val, y_val, context=val_context),
+            epochs=epochs,
+            callbacks=callbacks,
+            verbose=self.config.lstm_verbose
         )
-        return history.history
+        # Finished, so there is nothing left to resume
+        shutil.rmtree(backup_dir, ignore_errors=True)
+        
+        timer = callbacks[-1]
+        result = dict(history.history)
+        result['epoch_seconds'] = timer.seconds
+        print(f"Trained {len(timer.seconds)} of {epochs} epochs in {sum(timer.seconds):.1f}s")
+        return result
+    
+    def _ensure_model(self, X) -> None:
+        if self.model is None:
+            self.model = self._build_model(np.shape(X)[-1])
+    
+    @staticmethod
+    def _feature_rows(X) -> np.ndarray:
+        """One feature row per sample, the last timestep of 3-D windows"""
+        return X[:, -1, :] if np.ndim(X) == 3 else np.asarray(X)
+    
+    def _save_checkpoint(self, checkpoint_path: str) -> None:
+        os.makedirs(os.path.dirname(checkpoint_path) or '.', exist_ok=True)
+        self.save(checkpoint_path)
+    
+    def train(self, X_train, y_train, X_val, y_val) -> Dict:
+        """Train from scratch and write the checkpoint fine_tune continues from"""
+        self._ensure_model(X_train)
+        history = self._fit(X_train, y_train, X_val, y_val, self.config.lstm_epochs, val_context=X_train)
+        self.drift_detector = DriftDetector(self._feature_rows(X_train))
+        self._save_checkpoint(self.config.lstm_checkpoint_path)
+        return history
+    
+    def fine_tune(self, X_new, y_new, X_val=None, y_val=None, checkpoint_path: str = None,
+                  context: Optional[np.ndarray] = None) -> Dict:
+        """Continue training from the last checkpoint on new windows only
+        
+        Uses fewer epochs and a lower learning rate than a full train, then
+        writes the updated weights back to the checkpoint. For 2-D input,
+        context should hold the rows just before X_new. Nothing is trained if
+        the drift gate flags X_new; the result's drift report then says why a
+        full retrain is needed.
+        """
+        checkpoint_path = checkpoint_path or self.config.lstm_checkpoint_path
+        if os.path.exists(checkpoint_path):
+            self.load(checkpoint_path)
+        elif self.model is None:
+            raise ValueError(f"No trained model or checkpoint at {checkpoint_path} to fine-tune")
+        
+        y_pred = self.predict(X_new, context=context)
+        report = drift_gate(self.drift_detector, self._feature_rows(X_new),
+                            np.asarray(y_new)[-len(y_pred):], y_pred)
+        if report.needs_retrain:
+            return {'drift': report}
+        
+        self.model.optimizer.learning_rate.assign(self.config.lstm_finetune_learning_rate)
+        history = self._fit(X_new, y_new, X_val, y_val, self.config.lstm_finetune_epochs,
+                            context=context, val_context=X_new, backup_name='fine_tune')
+        
+        self._save_checkpoint(checkpoint_path)
+        return {**history, 'drift': report}
     
-    def predict(self, X: np.ndarray) -> np.ndarray:
-        return self.model.predict(X)
+    def predict(self, X: np.ndarray, context: Optional[np.ndarray] = None) -> np.ndarray:
+        return self.model.predict(**self._inputs(X, context=context)).reshape(-1)
     
     def save(self, path: str) -> None:
         self.model.save(path)
+        if self.drift_detector is not None:
+            self.drift_detector.save(f'{path}.drift')
     
     def load(self, path: str) -> None:
-        self.model = load_model(path)
\ No newline at end of file
+        self.model = load_model(path)
+        self.drift_detector = DriftDetector.load(f'{path}.drift')
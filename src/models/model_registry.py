@@ -0,0 +1,157 @@
+import glob
+import json
+import os
+import shutil
+import threading
+import joblib
+import pandas as pd
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+class ModelEntry:
+    """A registered artifact; the model and scaler are only loaded on first access"""
+
+    def __init__(self, registry: 'ModelRegistry', path: str, metadata: Dict):
+        self.registry = registry
+        self.path = path
+        self.metadata = metadata
+
+    @property
+    def data_start(self) -> pd.Timestamp:
+        return pd.Timestamp(self.metadata['data_start'])
+
+    @property
+    def data_end(self) -> pd.Timestamp:
+        return pd.Timestamp(self.metadata['data_end'])
+
+    @property
+    def model(self) -> Any:
+        return self.registry._load(self.path, 'model')
+
+    @property
+    def scaler(self) -> Any:
+        return self.registry._load(self.path, 'scaler') if self.metadata.get('has_scaler') else None
+    
+    def artifact(self, name: str) -> Any:
+        """Extra object registered with the model, or None if there is none"""
+        return self.registry._load(self.path, name) if name in self.metadata.get('artifacts', []) else None
+
+    def __repr__(self) -> str:
+        return (f"ModelEntry({self.metadata['ticker']}, {self.metadata['model_type']}, "
+                f"{self.data_start.date()}..{self.data_end.date()})")
+
+class ModelRegistry:
+    """Versioned store of trained models keyed by ticker, model type, feature
+    fingerprint and training data range.
+
+    Each version is a directory ``{ticker}/{model_type}/{fingerprint}/{start}_{end}``
+    holding the model, its scaler, any extra artifacts and ``metadata.json``.
+    scikit-learn objects are stored uncompressed with joblib so their arrays
+    load memory-mapped; Keras models use their native format. Loaded objects are kept in an
+    in-process LRU of max_loaded entries.
+    """
+
+    METADATA_FILE = 'metadata.json'
+
+    def __init__(self, root: str = 'models/registry', max_loaded: int = 8):
+        self.root = root
+        self.max_loaded = max_loaded
+        self._loaded: 'OrderedDict[tuple, Any]' = OrderedDict()
+        self._lock = threading.Lock()
+        os.makedirs(root, exist_ok=True)
+
+    def register(self, ticker: str, model_type: str, fingerprint: str, data_start, data_end,
+                 model: Any, scaler: Any = None, metadata: Optional[Dict] = None,
+                 artifacts: Optional[Dict[str, Any]] = None) -> ModelEntry:
+        """artifacts are further picklable objects stored with the model, such as drift statistics"""
+        data_start, data_end = pd.Timestamp(data_start), pd.Timestamp(data_end)
+        path = self._entry_path(ticker, model_type, fingerprint, data_start, data_end)
+        kind = 'keras' if hasattr(model, 'save') and not hasattr(model, 'get_params') else 'joblib'
+
+        # Write into a temporary directory and swap it in, so readers never see half an artifact
+        tmp_path = f'{path}.tmp-{os.getpid()}'
+        shutil.rmtree(tmp_path, ignore_errors=True)
+        os.makedirs(tmp_path)
+        if kind == 'keras':
+            model.save(os.path.join(tmp_path, 'model.keras'))
+        else:
+            joblib.dump(model, os.path.join(tmp_path, 'model.joblib'))
+        if scaler is not None:
+            joblib.dump(scaler, os.path.join(tmp_path, 'scaler.joblib'))
+        artifacts = {name: obj for name, obj in (artifacts or {}).items() if obj is not None}
+        for name, obj in artifacts.items():
+            joblib.dump(obj, os.path.join(tmp_path, f'{name}.joblib'))
+
+        entry_metadata = {
+            **(metadata or {}),
+            'ticker': ticker,
+            'model_type': model_type,
+            'fingerprint': fingerprint,
+            'data_start': data_start.isoformat(),
+            'data_end': data_end.isoformat(),
+            'kind': kind,
+            'has_scaler': scaler is not None,
+            'artifacts': sorted(artifacts),
+            'created_at': datetime.now().isoformat()
+        }
+        with open(os.path.join(tmp_path, self.METADATA_FILE), 'w') as f:
+            json.dump(entry_metadata, f, indent=2, default=str)
+
+        with self._lock:
+            for key in [key for key in self._loaded if key[0] == path]:
+                del self._loaded[key]
+        shutil.rmtree(path, ignore_errors=True)
+        os.replace(tmp_path, path)
+        return ModelEntry(self, path, entry_metadata)
+
+    def entries(self, ticker: str, model_type: str = '*', fingerprint: Optional[str] = None) -> List[ModelEntry]:
+        """Registered versions, oldest training data end first"""
+        pattern = os.path.join(self.root, ticker, model_type, self._short(fingerprint) if fingerprint else '*',
+                               '*', self.METADATA_FILE)
+        entries = []
+        for metadata_file in glob.glob(pattern):
+            with open(metadata_file) as f:
+                entries.append(ModelEntry(self, os.path.dirname(metadata_file), json.load(f)))
+        return sorted(entries, key=lambda entry: (entry.data_end, entry.metadata['created_at']))
+
+    def latest(self, ticker: str, model_type: str, fingerprint: str,
+               min_data_end=None) -> Optional[ModelEntry]:
+        """Newest version, or None if there is none trained on data up to min_data_end"""
+        entries = [entry for entry in self.entries(ticker, model_type, fingerprint)
+                   if entry.metadata['fingerprint'] == fingerprint]
+        if not entries:
+            return None
+        entry = entries[-1]
+        if min_data_end is not None and entry.data_end < pd.Timestamp(min_data_end):
+            return None
+        return entry
+
+    def _load(self, path: str, name: str) -> Any:
+        key = (path, name)
+        with self._lock:
+            if key in self._loaded:
+                self._loaded.move_to_end(key)
+                return self._loaded[key]
+
+        if name == 'model' and os.path.exists(os.path.join(path, 'model.keras')):
+            from tensorflow.keras.models import load_model
+            obj = load_model(os.path.join(path, 'model.keras'))
+        else:
+            obj = joblib.load(os.path.join(path, f'{name}.joblib'), mmap_mode='r')
+
+        with self._lock:
+            self._loaded[key] = obj
+            self._loaded.move_to_end(key)
+            while len(self._loaded) > self.max_loaded:
+                self._loaded.popitem(last=False)
+        return obj
+
+    def _entry_path(self, ticker: str, model_type: str, fingerprint: str,
+                    data_start: pd.Timestamp, data_end: pd.Timestamp) -> str:
+        version = f'{data_start:%Y%m%d}_{data_end:%Y%m%d}'
+        return os.path.join(self.root, ticker, model_type, self._short(fingerprint), version)
+
+    @staticmethod
+    def _short(fingerprint: str) -> str:
+        return fingerprint[:16]
@@ -0,0 +1,51 @@
+import numpy as np
+import pandas as pd
+from dataclasses import dataclass
+from typing import Optional, Sequence
+from src.features.feature_constants import PREDICTION_FEATURES
+from src.features.feature_generator import simulate_future_features
+
+@dataclass
+class MonteCarloForecast:
+    """Predicted daily returns for many simulated paths"""
+    dates: pd.DatetimeIndex
+    returns: np.ndarray  # (n_paths, n_days)
+    last_close: float
+
+    @property
+    def n_paths(self) -> int:
+        return self.returns.shape[0]
+
+    def expected_returns(self) -> pd.Series:
+        return pd.Series(self.returns.mean(axis=0), index=self.dates)
+
+    def price_paths(self) -> np.ndarray:
+        return self.last_close * np.cumprod(1 + self.returns, axis=1)
+
+    def expected_path(self) -> pd.Series:
+        """Mean simulated price for each future day"""
+        return pd.Series(self.price_paths().mean(axis=0), index=self.dates)
+
+    def bands(self, percentiles: Sequence[float] = (5, 25, 50, 75, 95)) -> pd.DataFrame:
+        """Price percentiles across paths, one column per percentile"""
+        values = np.percentile(self.price_paths(), percentiles, axis=0)
+        return pd.DataFrame(values.T, index=self.dates, columns=[f'P{p:g}' for p in percentiles])
+
+def future_business_days(last_date: pd.Timestamp, n_days: int) -> pd.DatetimeIndex:
+    return pd.bdate_range(last_date + pd.Timedelta(days=1), periods=n_days)
+
+def monte_carlo_forecast(model, scaler, df: pd.DataFrame, n_days: int = 15, n_paths: int = 1000,
+                         seed: Optional[int] = None, clip_quantiles: Optional[tuple] = (0.05, 0.95)) -> MonteCarloForecast:
+    """Simulate feature paths and run them all through the model in one predict call"""
+    paths = simulate_future_features(df, df.iloc[-1], n_days, n_paths, seed)
+
+    # One batched transform and predict over every (path, day) row
+    X = pd.DataFrame(paths.reshape(-1, len(PREDICTION_FEATURES)), columns=PREDICTION_FEATURES)
+    predicted = model.predict(scaler.transform(X)).reshape(n_paths, n_days)
+
+    # Apply smoothing to avoid extreme predictions
+    if clip_quantiles is not None:
+        low, high = df['Returns'].quantile(list(clip_quantiles))
+        predicted = np.clip(predicted, low, high)
+
+    return MonteCarloForecast(future_business_days(df.index[-1], n_days), predicted, float(df['Close'].iloc[-1]))
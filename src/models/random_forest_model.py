@@ -1,20 +1,54 @@
 import numpy as np
 import joblib
 from sklearn.ensemble import RandomForestRegressor
+from src.evaluation.drift import DriftDetector, drift_gate
 from src.models.base_model import BaseModel
-from typing import Dict
+from typing import Dict, Optional
+
+MAX_SEED = np.iinfo(np.int32).max
+
+def grow_forest(forest: RandomForestRegressor, X: np.ndarray, y: np.ndarray,
+                n_new_trees: int, max_trees: Optional[int] = None) -> RandomForestRegressor:
+    """Add n_new_trees fitted on (X, y) only, keeping the existing trees
+    
+    With max_trees, the oldest trees are dropped afterwards so the forest
+    tracks recent data. Trees are kept in estimators_ oldest first.
+    
+    warm_start derives the new trees' seeds from random_state after skipping
+    one draw per existing tree, so once trees have been pruned the same
+    seeds would come round again. An integer random_state is therefore
+    advanced to a seed drawn from itself before every growth.
+    """
+    if not hasattr(forest, 'estimators_'):
+        raise ValueError("Forest must be trained before it can be grown")
+    if isinstance(forest.random_state, (int, np.integer)):
+        forest.set_params(random_state=int(np.random.RandomState(forest.random_state).randint(MAX_SEED)))
+    forest.set_params(warm_start=True, n_estimators=len(forest.estimators_) + n_new_trees)
+    forest.fit(X, y)
+    forest.set_params(warm_start=False)
+    
+    if max_trees is not None and len(forest.estimators_) > max_trees:
+        forest.estimators_ = forest.estimators_[-max_trees:]
+        forest.n_estimators = max_trees
+    return forest
 
 class RandomForestModel(BaseModel):
     def __init__(self, config):
         self.config = config
         self.model = RandomForestRegressor(
             n_estimators=config.rf_n_estimators,
+            max_depth=config.rf_max_depth,
+            min_samples_split=config.rf_min_samples_split,
+            min_samples_leaf=config.rf_min_samples_leaf,
+            max_features=config.rf_max_features,
             random_state=config.random_state,
             n_jobs=-1
         )
+        self.drift_detector = None
     
     def train(self, X_train, y_train, X_val, y_val) -> Dict:
         self.model.fit(X_train, y_train)
+        self.drift_detector = DriftDetector(X_train)
         train_score = self.model.score(X_train, y_train)
         val_score = self.model.score(X_val, y_val)
         
@@ -23,11 +57,28 @@ class RandomForestModel(BaseModel):
             'val_score': val_score
         }
     
-    def predict(self, X: np.ndarray) -> np.ndarray:
+    def update(self, X_new: np.ndarray, y_new: np.ndarray, n_new_trees: Optional[int] = None,
+               max_trees: Optional[int] = None) -> Dict:
+        """Grow trees on recent data instead of retraining on the full history
+        
+        Nothing is grown if the drift gate flags X_new; the result's drift
+        report then says why a full retrain is needed.
+        """
+        report = drift_gate(self.drift_detector, X_new, y_new, self.model.predict(X_new))
+        if not report.needs_retrain:
+            n_new_trees = n_new_trees or self.config.rf_update_trees
+            max_trees = max_trees or self.config.rf_max_trees
+            grow_forest(self.model, X_new, y_new, n_new_trees, max_trees)
+        return {'n_trees': len(self.model.estimators_), 'drift': report}
+    
+    def predict(self, X: np.ndarray, context: Optional[np.ndarray] = None) -> np.ndarray:
         return self.model.predict(X)
     
     def save(self, path: str) -> None:
         joblib.dump(self.model, path)
+        if self.drift_detector is not None:
+            self.drift_detector.save(f'{path}.drift')
     
     def load(self, path: str) -> None:
-        self.model = joblib.load(path)
\ No newline at end of file
+        self.model = joblib.load(path)
+        self.drift_detector = DriftDetector.load(f'{path}.drift')
\ No newline at end of file
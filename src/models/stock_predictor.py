@@ -1,60 +1,177 @@
+import copy
 import numpy as np
 import pandas as pd
 from sklearn.preprocessing import StandardScaler
 from sklearn.ensemble import RandomForestRegressor
-from datetime import datetime, timedelta
-from src.features.feature_constants import TRAINING_FEATURES, PREDICTION_FEATURES
+import time
+from typing import Dict, Optional, Union
+from src.features.feature_constants import TRAINING_FEATURES
+from src.features.feature_registry import REGISTRY
+from src.models.model_registry import ModelEntry, ModelRegistry
+from src.evaluation.drift import DriftDetector, DriftReport, drift_gate
+from src.models.random_forest_model import grow_forest
+from src.models.monte_carlo import MonteCarloForecast, future_business_days, monte_carlo_forecast
 
 class StockPredictor:
-    def __init__(self, n_estimators: int = 200, random_state: int = 42):
+    def __init__(self, n_estimators: int = 200, random_state: int = 42, horizon: Optional[int] = None,
+                 max_depth: Optional[int] = 8, min_samples_split: int = 5, min_samples_leaf: int = 2,
+                 max_features: Union[str, float] = 'sqrt', update_trees: int = 20,
+                 max_trees: Optional[int] = None, update_window: int = 252):
+        """horizon switches to direct multi-horizon mode: one multi-output
+        forest predicts the returns 1..horizon days ahead from the last row.
+        update_trees, max_trees and update_window are the defaults of update"""
+        self.horizon = horizon
+        self.update_trees = update_trees
+        self.max_trees = max_trees
+        self.update_window = update_window
         self.model = RandomForestRegressor(
             n_estimators=n_estimators,
             random_state=random_state,
-            max_depth=8,
-            min_samples_split=5,
-            min_samples_leaf=2,
-            max_features='sqrt'
+            max_depth=max_depth,
+            min_samples_split=min_samples_split,
+            min_samples_leaf=min_samples_leaf,
+            max_features=max_features,
+            n_jobs=-1
         )
         self.scaler = StandardScaler()
+        self.drift_detector = None
+        self._shared_model = False  # Model is the registry's cached instance
+    
+    @classmethod
+    def from_config(cls, config, horizon: Optional[int] = None) -> 'StockPredictor':
+        """Predictor with the forest settings of a ModelConfig (e.g. one returned by tuning)"""
+        return cls(
+            n_estimators=config.rf_n_estimators,
+            random_state=config.random_state,
+            horizon=horizon,
+            max_depth=config.rf_max_depth,
+            min_samples_split=config.rf_min_samples_split,
+            min_samples_leaf=config.rf_min_samples_leaf,
+            max_features=config.rf_max_features,
+            update_trees=config.rf_update_trees,
+            max_trees=config.rf_max_trees,
+            update_window=config.rf_update_window
+        )
         
-    def prepare_data(self, df: pd.DataFrame) -> tuple:
-        """Prepare data for training"""
+    @staticmethod
+    def model_type(horizon: Optional[int] = None) -> str:
+        return 'stock_predictor' if horizon is None else f'stock_predictor_h{horizon}'
+    
+    def register(self, registry: ModelRegistry, ticker: str, data_start, data_end,
+                 metadata: Optional[Dict] = None) -> ModelEntry:
+        """Store the trained forest, scaler and drift reference, keyed by the range of bars it was trained on"""
+        return registry.register(
+            ticker, self.model_type(self.horizon), REGISTRY.fingerprint(TRAINING_FEATURES),
+            data_start, data_end, self.model, self.scaler,
+            {**(metadata or {}), 'horizon': self.horizon, 'params': self.model.get_params()},
+            artifacts={'drift_detector': self.drift_detector}
+        )
+    
+    @classmethod
+    def from_registry(cls, registry: ModelRegistry, ticker: str, df: pd.DataFrame,
+                      horizon: Optional[int] = None, config=None) -> Optional['StockPredictor']:
+        """Predictor trained on data up to the last bar of df, or None if none is registered
+        
+        config, if given, supplies the update settings of the predictor.
+        """
+        entry = registry.latest(ticker, cls.model_type(horizon), REGISTRY.fingerprint(TRAINING_FEATURES),
+                                min_data_end=df.index[-1])
+        if entry is None:
+            return None
+        predictor = cls.from_config(config, horizon=horizon) if config else cls(horizon=horizon)
+        predictor.model = entry.model
+        predictor.scaler = entry.scaler
+        predictor._shared_model = True
+        # Artifacts from BatchTrainer keep the single thread they were fitted with
+        predictor.model.set_params(n_jobs=-1)
+        detector = entry.artifact('drift_detector')
+        predictor.drift_detector = copy.deepcopy(detector) if detector is not None else None
+        return predictor
+    
+    def _features_and_targets(self, df: pd.DataFrame) -> tuple:
+        """Unscaled training features and targets, without rows lacking a target"""
         X = df[TRAINING_FEATURES]
+        
+        if self.horizon is not None:
+            # Column h-1 is the return h days ahead
+            y = pd.concat(
+                {f'Return_t+{h}': df['Returns'].shift(-h) for h in range(1, self.horizon + 1)}, axis=1
+            )
+            return X[:-self.horizon], y[:-self.horizon]
+        
         y = df['Returns'].shift(-1)  # Predict next day's returns
         
         # Remove last row since we don't have next day's return
-        X = X[:-1]
-        y = y[:-1]
-        
+        return X[:-1], y[:-1]
+    
+    def prepare_data(self, df: pd.DataFrame) -> tuple:
+        """Prepare data for training"""
+        X, y = self._features_and_targets(df)
         X_scaled = self.scaler.fit_transform(X)
         return X_scaled, y, TRAINING_FEATURES
     
     def train(self, X: np.ndarray, y: np.ndarray):
         """Train the model"""
         self.model.fit(X, y)
+        self.drift_detector = DriftDetector(X, TRAINING_FEATURES)
     
-    def predict_future(self, df: pd.DataFrame, n_days: int = 15) -> pd.Series:
-        """Predict future stock returns"""
-        from src.features.feature_generator import generate_future_features
+    def update(self, df: pd.DataFrame, n_new_rows: int, n_new_trees: Optional[int] = None,
+               max_trees: Optional[int] = None) -> DriftReport:
+        """Incrementally update on the newest n_new_rows training rows of df
         
-        last_date = df.index[-1]
-        future_dates = []
-        current_date = last_date
+        The new rows are first scored with the current model. Unless the drift
+        gate flags them, new trees are grown on the trailing
+        max(n_new_rows, update_window) rows, so even a single new row gets
+        trees fitted on a meaningful sample (the scaler stays as trained);
+        otherwise the predictor is retrained on all of df.
+        """
+        if self.drift_detector is None:
+            raise ValueError("Predictor must be trained before it can be updated")
+        n_new_trees = n_new_trees or self.update_trees
+        max_trees = max_trees or self.max_trees
         
-        while len(future_dates) < n_days:
-            current_date += timedelta(days=1)
-            if current_date.weekday() < 5:  # Monday = 0, Friday = 4
-                future_dates.append(current_date)
+        if self._shared_model:
+            # Grow or refit a private copy, not the registry's cached instance
+            self.model = copy.deepcopy(self.model)
+            self._shared_model = False
         
-        last_known = df.iloc[-1]
-        future_features = generate_future_features(df, last_known, n_days)
+        X, y = self._features_and_targets(df)
+        window = max(n_new_rows, self.update_window)
+        X_recent = self.scaler.transform(X[-window:])
+        y_recent = y[-window:]
+        X_new, y_new = X_recent[-n_new_rows:], y_recent[-n_new_rows:]
         
-        # Ensure we use the same features for prediction as training
-        future_features_scaled = self.scaler.transform(
-            future_features[PREDICTION_FEATURES]
-        )
+        report = drift_gate(self.drift_detector, X_new, y_new, self.model.predict(X_new))
+        if report.needs_retrain:
+            X_scaled, y, _ = self.prepare_data(df)
+            self.train(X_scaled, y)
+        else:
+            grow_forest(self.model, X_recent, y_recent, n_new_trees, max_trees)
+        return report
+    
+    def forecast(self, df: pd.DataFrame, n_days: int = 15, n_paths: int = 1000,
+                 seed: Optional[int] = None) -> MonteCarloForecast:
+        """Monte Carlo forecast over n_paths simulated feature paths"""
+        if self.horizon is not None:
+            raise ValueError("Monte Carlo forecasts need a next-day model; "
+                             "use predict_future for a direct-mode predictor")
+        return monte_carlo_forecast(self.model, self.scaler, df, n_days, n_paths, seed)
+    
+    def predict_future(self, df: pd.DataFrame, n_days: int = 15, n_paths: int = 1000,
+                       seed: Optional[int] = None) -> pd.Series:
+        """Predict future stock returns
         
-        predicted_returns = self.model.predict(future_features_scaled)
+        In direct mode every horizon comes from one predict call on the last
+        known feature row; otherwise this is the expected path across
+        Monte Carlo simulations.
+        """
+        if self.horizon is None:
+            return self.forecast(df, n_days, n_paths, seed).expected_returns()
+        if n_days > self.horizon:
+            raise ValueError(f"n_days={n_days} exceeds the trained horizon of {self.horizon}")
+        
+        last_row = self.scaler.transform(df[TRAINING_FEATURES].iloc[[-1]])
+        predicted_returns = self.model.predict(last_row)[0, :n_days]
         
         # Apply smoothing to avoid extreme predictions
         predicted_returns = np.clip(
@@ -63,4 +180,27 @@ class StockPredictor:
             df['Returns'].quantile(0.95)   # Upper bound
         )
         
-        return pd.Series(predicted_returns, index=future_dates)
\ No newline at end of file
+        return pd.Series(predicted_returns, index=future_business_days(df.index[-1], n_days))
+
+def compare_forecast_modes(df: pd.DataFrame, n_days: int = 15, n_paths: int = 1000,
+                           n_estimators: int = 200) -> Dict[str, Dict[str, float]]:
+    """Time training and a full-horizon forecast for the recursive and direct modes"""
+    timings = {}
+    for mode, horizon in [('recursive', None), ('direct', n_days)]:
+        predictor = StockPredictor(n_estimators=n_estimators, horizon=horizon)
+        
+        start = time.perf_counter()
+        X_scaled, y, _ = predictor.prepare_data(df)
+        predictor.train(X_scaled, y)
+        train_seconds = time.perf_counter() - start
+        
+        start = time.perf_counter()
+        predictor.predict_future(df, n_days, n_paths=n_paths)
+        predict_seconds = time.perf_counter() - start
+        
+        timings[mode] = {'train_seconds': train_seconds, 'predict_seconds': predict_seconds}
+        print(f"{mode:>9}: train {train_seconds:.3f}s, {n_days}-day forecast {predict_seconds:.3f}s")
+    
+    speedup = timings['recursive']['predict_seconds'] / timings['direct']['predict_seconds']
+    print(f"Direct forecast is {speedup:.1f}x faster than the recursive path ({n_paths} paths)")
+    return timings
@@ -0,0 +1,93 @@
+import dataclasses
+import numpy as np
+from joblib import parallel_config
+from sklearn.ensemble import RandomForestRegressor
+from sklearn.experimental import enable_halving_search_cv  # noqa: F401
+from sklearn.model_selection import HalvingGridSearchCV, HalvingRandomSearchCV, TimeSeriesSplit
+from typing import Dict, Optional, Tuple
+from src.utils.config import ModelConfig
+
+# Default search space for the forest settings that ModelConfig exposes
+RF_PARAM_GRID = {
+    'max_depth': [4, 8, 12, None],
+    'min_samples_split': [2, 5, 10],
+    'min_samples_leaf': [1, 2, 4],
+    'max_features': ['sqrt', 0.5, 1.0]
+}
+
+# RandomForestRegressor parameter -> ModelConfig field
+CONFIG_FIELDS = {
+    'n_estimators': 'rf_n_estimators',
+    'max_depth': 'rf_max_depth',
+    'min_samples_split': 'rf_min_samples_split',
+    'min_samples_leaf': 'rf_min_samples_leaf',
+    'max_features': 'rf_max_features'
+}
+
+def tune_random_forest(X: np.ndarray, y: np.ndarray, config: Optional[ModelConfig] = None,
+                       param_grid: Optional[Dict] = None, resource: str = 'n_estimators',
+                       max_resources: Optional[int] = None, min_resources: Optional[int] = None,
+                       factor: int = 3, n_splits: int = 5, gap: int = 0, n_candidates: Optional[int] = None,
+                       n_jobs: int = -1) -> Tuple[ModelConfig, object]:
+    """Successive-halving search over random forest settings.
+
+    Every round scores the surviving candidates with time-ordered CV
+    (TimeSeriesSplit, with gap rows dropped before each test fold) and keeps
+    the best 1/factor of them for the next round with factor times more
+    budget. The budget is either the number of trees (resource='n_estimators')
+    or the number of training rows ('n_samples'). With n_candidates, that
+    many settings are sampled from param_grid instead of trying every one.
+
+    Candidates are fitted in parallel worker processes; X and y are dumped
+    once to a memory-mapped file that every worker reads, instead of being
+    pickled for each task.
+
+    Returns config updated with the best settings, and the fitted search.
+    Use StockPredictor.prepare_data for X and y, then
+    StockPredictor.from_config or RandomForestModel with the returned config.
+    """
+    config = config or ModelConfig()
+    param_grid = param_grid or RF_PARAM_GRID
+    if resource not in ('n_estimators', 'n_samples'):
+        raise ValueError(f"resource must be 'n_estimators' or 'n_samples', got {resource}")
+
+    if resource == 'n_estimators':
+        max_resources = max_resources or max(config.rf_n_estimators, 200)
+        min_resources = min_resources or max(max_resources // factor ** 3, 10)
+    else:
+        max_resources = max_resources or 'auto'
+        min_resources = min_resources or 'exhaust'
+
+    # Forests run single-threaded so the parallelism goes to candidates
+    estimator = RandomForestRegressor(
+        n_estimators=config.rf_n_estimators,
+        random_state=config.random_state,
+        n_jobs=1
+    )
+    search_params = dict(
+        factor=factor,
+        resource=resource,
+        max_resources=max_resources,
+        min_resources=min_resources,
+        cv=TimeSeriesSplit(n_splits=n_splits, gap=gap),
+        scoring='neg_mean_squared_error',
+        random_state=config.random_state,
+        n_jobs=n_jobs
+    )
+    if n_candidates is None:
+        search = HalvingGridSearchCV(estimator, param_grid, **search_params)
+    else:
+        search = HalvingRandomSearchCV(estimator, param_grid, n_candidates=n_candidates, **search_params)
+
+    with parallel_config(backend='loky', max_nbytes=0, mmap_mode='r'):
+        search.fit(X, y)
+
+    best = dict(search.best_params_)
+    print(f"Best settings after {search.n_iterations_} rounds: {best} (MSE {-search.best_score_:.6g})")
+
+    tuned = {CONFIG_FIELDS[name]: value for name, value in best.items() if name != resource}
+    if resource == 'n_estimators':
+        # best_params_ holds the tree budget of the winning round, not a tuned
+        # setting; train with the full budget the search worked up to
+        tuned['rf_n_estimators'] = max(config.rf_n_estimators, max_resources)
+    return dataclasses.replace(config, **tuned), search
@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import List, Dict
+from typing import List, Dict, Optional, Tuple, Union
 from datetime import datetime
 
 @dataclass
@@ -11,8 +11,19 @@ class ModelConfig:
     test_size: float = 0.15
     
     # Data provider settings
-    data_provider: str = 'yfinance'  # 'yfinance' or 'finnhub'
+    data_provider: str = 'yfinance'  # 'yfinance', 'finnhub' or 'hedged'
+    hedged_providers: Tuple[str, ...] = ('yfinance', 'finnhub')  # Failover order for 'hedged'; finnhub needs a key
+    hedge_latency_budget: float = 2.0  # Seconds before asking the next provider
     finnhub_api_key: str = ''  # Required if using Finnhub
+    finnhub_calls_per_minute: int = 60  # Free plan limit
+    
+    # Bar cache settings
+    use_bar_cache: bool = True
+    bar_cache_dir: str = 'data/cache/bars'
+    bar_cache_max_mb: float = 512
+    
+    # Storage settings
+    storage_backend: str = 'csv'  # 'csv' or 'parquet'
     
     # Auto-update settings
     auto_update: bool = True
@@ -22,11 +33,34 @@ class ModelConfig:
     lookback_periods: List[int] = (1, 5, 10)
     target_col: str = 'Close'
     
+    # Models trained by main.py, by plugin name (see src.utils.plugins)
+    models: List[str] = ('lstm', 'rf')
+    show_plots: bool = True
+    
     # Model parameters
     random_state: int = 42
     lstm_units: int = 50
     lstm_epochs: int = 100
+    lstm_lookback: int = 20  # Timesteps per window when LSTMModel gets 2-D input
+    lstm_early_stopping_patience: int = 10  # Epochs without improvement before stopping
+    lstm_lr_patience: int = 4  # Epochs without improvement before reducing the learning rate
+    lstm_lr_factor: float = 0.5
+    lstm_min_lr: float = 1e-5
+    lstm_backup_dir: str = 'models/lstm_backup'  # Per-epoch state for resuming killed jobs
+    lstm_verbose: int = 0  # Keras progress output; EpochTimer logs every epoch regardless
     rf_n_estimators: int = 100
+    rf_max_depth: Optional[int] = None
+    rf_min_samples_split: int = 2
+    rf_min_samples_leaf: int = 1
+    rf_max_features: Union[str, float] = 1.0
+    
+    # Incremental update parameters
+    rf_update_trees: int = 20  # Trees grown on new data per update
+    rf_max_trees: Optional[int] = None  # Oldest trees beyond this are pruned
+    rf_update_window: int = 252  # Trailing rows new trees are fitted on (at least the new rows)
+    lstm_checkpoint_path: str = 'models/lstm_checkpoint.keras'
+    lstm_finetune_epochs: int = 5
+    lstm_finetune_learning_rate: float = 0.0001
     
     # Training parameters
     batch_size: int = 32
@@ -0,0 +1,105 @@
+"""Import-time benchmark for the CLI entry points.
+
+Runs ``python -X importtime -c "import <module>"`` in fresh interpreters,
+keeps the fastest run, and reports the slowest imports. A run fails when an
+entry point pulls in a heavy back-end it should only import lazily, or when
+its import time grows beyond a saved baseline by more than the tolerance.
+
+    python -m src.utils.import_benchmark                 # check predict and main
+    python -m src.utils.import_benchmark --save-baseline # record current timings
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+DEFAULT_BASELINE = os.path.join(ROOT, 'data', 'import_baseline.json')
+
+# Back-ends that must stay lazy: importing the entry point must not import them
+LAZY_MODULES = {
+    'predict': ['tensorflow', 'keras', 'matplotlib', 'mplcursors', 'mplfinance', 'seaborn', 'bs4', 'yfinance'],
+    'main': ['tensorflow', 'keras', 'matplotlib', 'mplcursors', 'mplfinance', 'seaborn', 'bs4']
+}
+
+def measure(module: str, runs: int = 3) -> Dict[str, Tuple[int, int]]:
+    """Self and cumulative import microseconds of every module imported, fastest run"""
+    best = None
+    for _ in range(runs):
+        completed = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+            cwd=ROOT, capture_output=True, text=True
+        )
+        if completed.returncode != 0:
+            raise Exception(f"Importing {module} failed:\n{completed.stderr.strip().splitlines()[-1]}")
+        timings = parse_importtime(completed.stderr)
+        if best is None or timings[module][1] < best[module][1]:
+            best = timings
+    return best
+
+def parse_importtime(output: str) -> Dict[str, Tuple[int, int]]:
+    """Parse '-X importtime' lines: 'import time: self [us] | cumulative | imported package'"""
+    timings = {}
+    for line in output.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        parts = line[len('import time:'):].split('|')
+        if len(parts) != 3 or not parts[0].strip().isdigit():
+            continue  # Header line
+        timings[parts[2].strip()] = (int(parts[0]), int(parts[1]))
+    return timings
+
+def check(module: str, timings: Dict[str, Tuple[int, int]], baseline: Dict[str, float],
+          tolerance: float) -> List[str]:
+    problems = []
+    for heavy in LAZY_MODULES.get(module, []):
+        if any(name == heavy or name.startswith(f'{heavy}.') for name in timings):
+            problems.append(f"{module} imports {heavy} at startup")
+
+    seconds = timings[module][1] / 1e6
+    if module in baseline and seconds > baseline[module] * (1 + tolerance):
+        problems.append(f"{module} import took {seconds:.2f}s, baseline {baseline[module]:.2f}s (+{tolerance:.0%} allowed)")
+    return problems
+
+def report(module: str, timings: Dict[str, Tuple[int, int]], top: int) -> None:
+    print(f"\n{module}: {timings[module][1] / 1e6:.3f}s total, {len(timings)} modules")
+    top_level = [(name, cumulative) for name, (_, cumulative) in timings.items() if '.' not in name and name != module]
+    for name, cumulative in sorted(top_level, key=lambda item: -item[1])[:top]:
+        print(f"  {cumulative / 1e6:8.3f}s  {name}")
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('modules', nargs='*', default=list(LAZY_MODULES))
+    parser.add_argument('--runs', type=int, default=3)
+    parser.add_argument('--top', type=int, default=10)
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE)
+    parser.add_argument('--tolerance', type=float, default=0.25)
+    parser.add_argument('--save-baseline', action='store_true')
+    args = parser.parse_args(argv)
+
+    baseline = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+
+    problems, results = [], {}
+    for module in args.modules:
+        timings = measure(module, args.runs)
+        report(module, timings, args.top)
+        results[module] = timings[module][1] / 1e6
+        problems.extend(check(module, timings, {} if args.save_baseline else baseline, args.tolerance))
+
+    if args.save_baseline:
+        os.makedirs(os.path.dirname(args.baseline), exist_ok=True)
+        with open(args.baseline, 'w') as f:
+            json.dump({**baseline, **results}, f, indent=2)
+        print(f"\nSaved baseline to {args.baseline}")
+
+    for problem in problems:
+        print(f"REGRESSION: {problem}")
+    return 1 if problems else 0
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,52 @@
+"""Lazily imported model and visualizer plugins.
+
+Entry points look models and plots up by name instead of importing their
+modules at the top, so TensorFlow, matplotlib and friends are only imported
+by runs that actually use them.
+"""
+import importlib
+from typing import Any, Dict, List
+
+class PluginRegistry:
+    def __init__(self, kind: str):
+        self.kind = kind
+        self._targets: Dict[str, str] = {}
+        self._loaded: Dict[str, Any] = {}
+
+    def register(self, name: str, target: str) -> None:
+        """target is 'package.module:attribute', attribute may be dotted"""
+        self._targets[name] = target
+        self._loaded.pop(name, None)
+
+    @property
+    def names(self) -> List[str]:
+        return list(self._targets)
+
+    def is_loaded(self, name: str) -> bool:
+        return name in self._loaded
+
+    def get(self, name: str) -> Any:
+        if name not in self._loaded:
+            if name not in self._targets:
+                raise KeyError(f"Unknown {self.kind}: {name} (available: {', '.join(self._targets)})")
+            module_name, attribute = self._targets[name].split(':')
+            obj = importlib.import_module(module_name)
+            for part in attribute.split('.'):
+                obj = getattr(obj, part)
+            self._loaded[name] = obj
+        return self._loaded[name]
+
+    def create(self, name: str, *args, **kwargs) -> Any:
+        return self.get(name)(*args, **kwargs)
+
+MODELS = PluginRegistry('model')
+MODELS.register('lstm', 'src.models.lstm_model:LSTMModel')
+MODELS.register('rf', 'src.models.random_forest_model:RandomForestModel')
+MODELS.register('stock_predictor', 'src.models.stock_predictor:StockPredictor')
+
+VISUALIZERS = PluginRegistry('visualizer')
+VISUALIZERS.register('predictions', 'src.visualization.plotter:plot_predictions')
+VISUALIZERS.register('financial_summary', 'src.visualization.financial_plot:plot_financial_summary')
+VISUALIZERS.register('model_predictions', 'src.visualization.visualizer:Visualizer.plot_predictions')
+VISUALIZERS.register('feature_importance', 'src.visualization.visualizer:Visualizer.plot_feature_importance')
+VISUALIZERS.register('metrics_history', 'src.visualization.visualizer:Visualizer.plot_metrics_history')
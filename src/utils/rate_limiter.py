@@ -0,0 +1,35 @@
+import threading
+import time
+from typing import Optional
+
+class RateLimiter:
+    """Thread-safe token bucket allowing ``rate`` calls per second on average.
+
+    Up to ``capacity`` calls may burst before callers start to block.
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        if rate <= 0:
+            raise ValueError("Rate must be positive")
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self._tokens = self.capacity
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def per_minute(cls, calls: float, capacity: Optional[float] = None) -> 'RateLimiter':
+        return cls(calls / 60.0, capacity)
+
+    def acquire(self, tokens: float = 1.0) -> None:
+        """Block until ``tokens`` are available and consume them"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate)
+                self._last = now
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return
+                wait = (tokens - self._tokens) / self.rate
+            time.sleep(wait)
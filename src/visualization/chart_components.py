@@ -2,7 +2,6 @@
 import matplotlib.pyplot as plt
 from matplotlib.dates import DateFormatter
 from matplotlib.gridspec import GridSpec
-import mplfinance as mpf
 
 def setup_chart_layout(figsize=(15, 8)):
     """Create and setup the basic chart layout"""
@@ -1,11 +1,12 @@
 """Different chart type implementations"""
-import mplfinance as mpf
 import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
 
 def plot_candlestick(ax1, data):
     """Plot candlestick chart"""
+    import mplfinance as mpf
+    
     # Prepare data for mplfinance
     df = data.copy()
     
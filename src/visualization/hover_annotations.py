@@ -1,10 +1,11 @@
 """Hover annotations for matplotlib plots"""
-import mplcursors
 import matplotlib.dates as mdates
 import pandas as pd
 
 def add_hover_annotations(lines):
     """Add hover annotations to the plot lines"""
+    import mplcursors
+    
     for line in lines:
         cursor = mplcursors.cursor(line, hover=True)
         
@@ -4,8 +4,12 @@ from matplotlib.dates import DateFormatter
 import mplcursors
 from .hover_annotations import add_hover_annotations
 
-def plot_predictions(df, future_predictions):
-    """Plot historical prices and future predictions"""
+def plot_predictions(df, future_predictions, bands=None):
+    """Plot historical prices and future predictions
+    
+    bands is an optional frame of price percentiles (e.g. from
+    MonteCarloForecast.bands); its outermost columns are shaded.
+    """
     # Calculate future prices
     last_close = df['Close'].iloc[-1]
     future_prices = [last_close]
@@ -29,6 +33,11 @@ def plot_predictions(df, future_predictions):
     prediction_line = ax1.plot(future_predictions.index, future_prices,
                              label='Predicted', color='red', linestyle='--', linewidth=1.5)
     
+    # Shade the Monte Carlo percentile range
+    if bands is not None:
+        ax1.fill_between(bands.index, bands.iloc[:, 0], bands.iloc[:, -1], color='red', alpha=0.15,
+                         label=f'{bands.columns[0]}-{bands.columns[-1]}')
+    
     # Plot volume
     ax2.bar(last_2y.index, last_2y['Volume'], color='gray', alpha=0.5)
     
@@ -1,5 +1,4 @@
 import matplotlib.pyplot as plt
-import seaborn as sns
 from typing import Dict, List
 
 class Visualizer:
@@ -14,6 +13,8 @@ class Visualizer:
     
     @staticmethod
     def plot_feature_importance(feature_names: List, importance: List) -> None:
+        import seaborn as sns
+        
         plt.figure(figsize=(10, 6))
         sns.barplot(x=importance, y=feature_names)
         plt.title('Feature Importance')
@@ -0,0 +1,21 @@
+from src.data.data_splitter import DataSplitter
+
+def test_embargo_drops_rows_from_the_end_of_training():
+    plain = DataSplitter.walk_forward_splits(200, test_size=20, min_train_size=100, purge=2)
+    embargoed = DataSplitter.walk_forward_splits(200, test_size=20, min_train_size=100, purge=2, embargo=5)
+
+    for fold in embargoed:
+        assert fold.train.stop - fold.train.start >= 100
+        assert fold.val.start - fold.train.stop == 2 + 5
+        assert fold.test.start - fold.val.stop == 2
+    # Test windows stay back to back; only the training ranges shrink
+    assert [f.test.start for f in embargoed[1:]] == [f.test.stop for f in embargoed[:-1]]
+    assert [f.test.start for f in embargoed] == [f.test.start + 5 for f in plain][:len(embargoed)]
+
+def test_rolling_window_keeps_train_size_with_embargo():
+    folds = DataSplitter.walk_forward_splits(300, test_size=25, min_train_size=50, window='rolling',
+                                             train_size=80, embargo=10)
+
+    assert all(fold.train.stop - fold.train.start == 80 for fold in folds)
+    assert all(fold.val.start - fold.train.stop == 10 for fold in folds)
+    assert folds[0].train.start == 0
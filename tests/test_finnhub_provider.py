@@ -0,0 +1,90 @@
+import json
+import math
+import threading
+import time
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+import pandas as pd
+import pytest
+from src.data.providers.finnhub_provider import FinnhubProvider
+from src.utils.rate_limiter import RateLimiter
+
+class CandleStub(BaseHTTPRequestHandler):
+    """Serves /stock/candle with one daily bar per business day in [from, to]"""
+
+    protocol_version = 'HTTP/1.1'  # Keep-alive, so pooled connections are reused
+
+    def do_GET(self):
+        params = {k: v[0] for k, v in parse_qs(urlparse(self.path).query).items()}
+        self.server.log.append((time.monotonic(), self.client_address[1], params))
+        start, end = int(params['from']), int(params['to'])
+        days = [d for d in pd.bdate_range(pd.Timestamp(start, unit='s').normalize(), pd.Timestamp(end, unit='s'))
+                if start <= d.timestamp() <= end]
+        t = [int(d.timestamp()) for d in days]
+        body = json.dumps({'s': 'ok' if t else 'no_data', 't': t, 'o': [1.0] * len(t), 'h': [2.0] * len(t),
+                           'l': [0.5] * len(t), 'c': [1.5] * len(t), 'v': [100] * len(t)}).encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+@pytest.fixture
+def server():
+    server = ThreadingHTTPServer(('127.0.0.1', 0), CandleStub)
+    server.log = []
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+def provider_for(server, **kwargs) -> FinnhubProvider:
+    host, port = server.server_address
+    return FinnhubProvider('test-key', base_url=f'http://{host}:{port}', calls_per_minute=60_000, **kwargs)
+
+def expected_chunks(start_date: str, end_date: str, chunk_days: int) -> int:
+    start_ts = datetime.strptime(start_date, '%Y-%m-%d').timestamp()
+    end_ts = datetime.strptime(end_date, '%Y-%m-%d').timestamp()
+    return math.ceil((end_ts - start_ts + 1) / timedelta(days=chunk_days).total_seconds())
+
+def test_multi_year_range_is_chunked_and_stitched(server):
+    provider = provider_for(server, chunk_days=365, max_workers=4)
+
+    df = provider.fetch_data('AAPL', '2019-01-01', '2023-01-01')
+
+    assert len(server.log) == expected_chunks('2019-01-01', '2023-01-01', 365) == 5
+    assert df.index.is_unique and df.index.is_monotonic_increasing
+    start = datetime.strptime('2019-01-01', '%Y-%m-%d').timestamp()
+    end = datetime.strptime('2023-01-01', '%Y-%m-%d').timestamp()
+    bars = [d for d in pd.bdate_range(pd.Timestamp(start, unit='s').normalize(), pd.Timestamp(end, unit='s'))
+            if start <= d.timestamp() <= end]
+    assert list(df.index) == bars
+    # Chunks are contiguous and do not overlap
+    ranges = sorted((int(p['from']), int(p['to'])) for _, _, p in server.log)
+    assert all(b[0] == a[1] + 1 for a, b in zip(ranges, ranges[1:]))
+
+def test_batch_shares_one_connection_pool(server):
+    provider = provider_for(server, chunk_days=365, max_workers=3)
+
+    results = provider.fetch_batch(['A', 'B', 'C', 'D'], '2019-01-01', '2023-01-01')
+
+    assert len(server.log) == 4 * expected_chunks('2019-01-01', '2023-01-01', 365)
+    assert all(len(df) == len(results['A']) for df in results.values())
+    # Every request went over one of at most max_workers kept-alive connections
+    assert len({port for _, port, _ in server.log}) <= 3
+
+def test_rate_limiter_spaces_requests(server):
+    provider = provider_for(server, chunk_days=180, max_workers=4)
+    provider.rate_limiter = RateLimiter(rate=20, capacity=1)
+
+    provider.fetch_data('AAPL', '2020-01-01', '2023-01-01')
+
+    times = sorted(t for t, _, _ in server.log)
+    assert len(times) == expected_chunks('2020-01-01', '2023-01-01', 180)
+    # One token every 1/20 s, so n requests span at least (n - 1) / 20 s
+    assert times[-1] - times[0] >= (len(times) - 1) / 20 * 0.9
@@ -0,0 +1,69 @@
+import time
+import pandas as pd
+from src.data.providers.fake_provider import FakeProvider
+from src.data.providers.hedged_provider import HedgedProvider
+
+def bars(close: float) -> pd.DataFrame:
+    index = pd.bdate_range('2024-01-01', periods=5)
+    return pd.DataFrame({'Open': close, 'High': close, 'Low': close, 'Close': close, 'Volume': 1.0}, index=index)
+
+def providers(primary_kwargs, secondary_kwargs=None):
+    primary = FakeProvider(data={'X': bars(1.0)}, **primary_kwargs)
+    secondary = FakeProvider(data={'X': bars(2.0)}, **(secondary_kwargs or {}))
+    return primary, secondary
+
+def test_slow_primary_is_hedged_by_fast_secondary():
+    primary, secondary = providers({'latency': 1.0})
+    hedged = HedgedProvider([primary, secondary], latency_budget=0.05)
+
+    started = time.monotonic()
+    df = hedged.fetch_data('X')
+
+    assert time.monotonic() - started < 0.5
+    assert (df['Close'] == 2.0).all()
+    assert len(primary.calls) == 1 and len(secondary.calls) == 1
+
+def test_fast_primary_answers_alone():
+    primary, secondary = providers({})
+    hedged = HedgedProvider([primary, secondary], latency_budget=0.5)
+
+    df = hedged.fetch_data('X')
+
+    assert (df['Close'] == 1.0).all()
+    assert not secondary.calls
+
+def test_erroring_primary_fails_over_without_waiting_for_budget():
+    primary, secondary = providers({'failures': {'X': 1}})
+    hedged = HedgedProvider([primary, secondary], latency_budget=5.0)
+
+    started = time.monotonic()
+    df = hedged.fetch_data('X')
+
+    assert time.monotonic() - started < 1.0
+    assert (df['Close'] == 2.0).all()
+    assert hedged.stats()[0]['errors'] == 1
+
+def test_repeatedly_failing_primary_is_demoted():
+    primary, secondary = providers({'failures': {'X': 100}})
+    hedged = HedgedProvider([primary, secondary], latency_budget=5.0,
+                            max_consecutive_errors=2, demotion_period=60.0)
+
+    for _ in range(2):
+        hedged.fetch_data('X')
+    assert hedged.stats()[0]['demoted_until'] > time.monotonic()
+
+    # Demoted: the secondary is asked first and answers, so the primary is left alone
+    hedged.fetch_data('X')
+    assert len(primary.calls) == 2
+    assert len(secondary.calls) == 3
+
+def test_slow_primary_is_demoted():
+    primary, secondary = providers({'latency': 0.2})
+    hedged = HedgedProvider([primary, secondary], latency_budget=0.05, slow_factor=2.0)
+
+    hedged.fetch_data('X')
+    time.sleep(0.3)  # Let the abandoned primary call finish and record its latency
+
+    assert hedged.stats()[0]['demoted_until'] > time.monotonic()
+    hedged.fetch_data('X')
+    assert len(primary.calls) == 1 and len(secondary.calls) == 2
@@ -0,0 +1,58 @@
+import numpy as np
+import pandas as pd
+from sklearn.ensemble import RandomForestRegressor
+from src.features.feature_constants import TRAINING_FEATURES
+from src.models.random_forest_model import RandomForestModel, grow_forest
+from src.models.stock_predictor import StockPredictor
+from src.utils.config import ModelConfig
+
+def frame(n: int, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame(rng.normal(size=(n, len(TRAINING_FEATURES))), columns=TRAINING_FEATURES,
+                      index=pd.bdate_range('2020-01-01', periods=n))
+    df['Returns'] = rng.normal(0, 0.01, n)
+    return df
+
+def tree_seeds(forest: RandomForestRegressor) -> list:
+    return [tree.random_state for tree in forest.estimators_]
+
+def test_grown_trees_never_reuse_seeds_after_pruning():
+    rng = np.random.default_rng(1)
+    X, y = rng.normal(size=(200, 4)), rng.normal(size=200)
+    forest = RandomForestRegressor(n_estimators=10, random_state=42).fit(X, y)
+
+    seeds = set(tree_seeds(forest))
+    for _ in range(5):
+        grow_forest(forest, X, y, n_new_trees=10, max_trees=10)
+        new_seeds = tree_seeds(forest)
+        assert seeds.isdisjoint(new_seeds)
+        seeds.update(new_seeds)
+    assert len(forest.estimators_) == 10
+
+def test_update_fits_new_trees_on_a_trailing_window():
+    df = frame(400)
+    predictor = StockPredictor.from_config(ModelConfig(rf_n_estimators=10, rf_update_trees=5,
+                                                       rf_max_trees=12, rf_update_window=100))
+    X_scaled, y, _ = predictor.prepare_data(df.iloc[:-1])
+    predictor.train(X_scaled, y)
+
+    report = predictor.update(df, n_new_rows=1)
+
+    assert not report.needs_retrain
+    assert len(predictor.model.estimators_) == 12
+    # Bootstrap samples of a single row would give trees with one leaf
+    assert all(tree.tree_.node_count > 1 for tree in predictor.model.estimators_[-5:])
+
+def test_random_forest_update_is_gated_by_drift():
+    config = ModelConfig(rf_n_estimators=10, rf_update_trees=5)
+    X, y = frame(300).pipe(lambda df: (df[TRAINING_FEATURES].to_numpy(), df['Returns'].to_numpy()))
+    model = RandomForestModel(config)
+    model.train(X[:200], y[:200], X[200:], y[200:])
+
+    result = model.update(X[200:], y[200:])
+    assert not result['drift'].needs_retrain
+    assert result['n_trees'] == 15
+
+    result = model.update(X[200:] + 5, y[200:])
+    assert result['drift'].needs_retrain
+    assert result['n_trees'] == 15
@@ -0,0 +1,56 @@
+import pytest
+from src.data.data_manager import DataManager
+from src.data.providers.fake_provider import FakeProvider
+from src.data.ticker_manager import TickerManager
+
+TICKERS = ['AAA', 'BBB', 'BAD', 'CCC', 'DDD']
+
+@pytest.fixture
+def manager(tmp_path):
+    def build(provider):
+        manager = DataManager(str(tmp_path / 'stock_data'), 'csv', provider=provider)
+        manager.ticker_manager = TickerManager(str(tmp_path / 'tickers'))
+        for ticker in TICKERS:
+            manager.ticker_manager.add_ticker(ticker)
+        return manager
+    return build
+
+def test_failing_symbol_is_isolated(manager):
+    provider = FakeProvider(latency=0.05, failures={'BAD': 100}, default_start='2024-01-01')
+    dm = manager(provider)
+
+    summary = dm.update_data(max_workers=4, batch_size=2, max_retries=0)
+
+    assert set(summary.failed) == {'BAD'}
+    assert set(summary.fetched) == set(TICKERS) - {'BAD'}
+    assert dm.storage.manifest.get('BAD') is None
+    for ticker in set(TICKERS) - {'BAD'}:
+        stored = dm.get_data(ticker)
+        assert len(stored) == summary.fetched[ticker]
+        assert dm.storage.manifest.get(ticker)['rows'] == len(stored)
+        assert dm.storage.manifest.last_date(ticker) == stored.index[-1]
+
+def test_batches_share_requests_and_run_concurrently(manager):
+    provider = FakeProvider(latency=0.2, default_start='2024-01-01')
+    dm = manager(provider)
+
+    summary = dm.update_data(max_workers=4, batch_size=2, max_retries=0)
+
+    # Five tickers with no stored data share a start date: batches of 2, 2 and 1
+    assert summary.requests == 3
+    assert sorted(len(key) for key, _, _ in provider.calls) == [1, 2, 2]
+    # Run one after another the three requests would take at least 0.6s
+    assert summary.elapsed < 0.5
+    assert not summary.failed
+
+def test_second_refresh_only_fetches_new_rows(manager):
+    provider = FakeProvider(default_start='2024-01-01')
+    dm = manager(provider)
+    dm.update_data(max_retries=0)
+    rows = {ticker: dm.storage.manifest.get(ticker)['rows'] for ticker in TICKERS}
+
+    summary = dm.update_data(max_retries=0)
+
+    assert not summary.fetched and not summary.failed
+    assert sorted(summary.up_to_date) == sorted(TICKERS)
+    assert {ticker: dm.storage.manifest.get(ticker)['rows'] for ticker in TICKERS} == rows
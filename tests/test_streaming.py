@@ -0,0 +1,93 @@
+import numpy as np
+import pandas as pd
+import pytest
+from src.data.data_manager import DataManager
+from src.data.providers.fake_provider import FakeProvider
+from src.data.streaming.bar_aggregator import BarAggregator, Trade, bars_to_frame
+from src.data.streaming.bar_writer import BarWriter, stream_to_store
+
+SYMBOLS = ['AAA', 'BBB']
+RESOLUTIONS = ['1min', '5min']
+
+@pytest.fixture
+def trades():
+    """Interleaved trades of two symbols over 23.5 minutes, with quiet minutes and a partial last bar"""
+    rng = np.random.default_rng(7)
+    n = 2_000
+    offsets = np.sort(rng.uniform(0, 23.5 * 60, n))
+    offsets = offsets[(offsets < 6 * 60) | (offsets >= 9 * 60)]  # Three minutes without trades
+    timestamps = pd.Timestamp('2024-03-01 14:30') + pd.to_timedelta(offsets, unit='s')
+    symbols = rng.choice(SYMBOLS, len(offsets))
+    prices = 100 + np.cumsum(rng.normal(0, 0.05, len(offsets)))
+    sizes = rng.integers(1, 500, len(offsets)).astype(float)
+    return [Trade(ts, symbol, float(price), float(size))
+            for ts, symbol, price, size in zip(timestamps, symbols, prices, sizes)]
+
+def resampled(trades, symbol: str, resolution: str) -> pd.DataFrame:
+    """Batch reference: pandas resampling of the same ticks"""
+    ticks = pd.DataFrame([t for t in trades if t.symbol == symbol]).set_index('timestamp')
+    ohlc = ticks['price'].resample(resolution).ohlc()
+    ohlc['volume'] = ticks['size'].resample(resolution).sum()
+    ohlc = ohlc.dropna(subset=['open'])
+    ohlc.columns = ['Open', 'High', 'Low', 'Close', 'Volume']
+    return ohlc
+
+def test_replayed_bars_match_resampled_ticks(trades):
+    aggregator = BarAggregator(RESOLUTIONS)
+    bars = list(aggregator.aggregate(trades))
+
+    assert aggregator.late_trades == 0
+    for symbol in SYMBOLS:
+        for resolution in RESOLUTIONS:
+            streamed = bars_to_frame(b for b in bars if b.symbol == symbol and b.resolution == resolution)
+            expected = resampled(trades, symbol, resolution)
+            pd.testing.assert_frame_equal(streamed, expected, check_names=False, check_freq=False)
+
+def test_partial_last_bar_is_only_emitted_on_flush(trades):
+    aggregator = BarAggregator(['5min'])
+    completed = [bar for trade in trades for bar in aggregator.update(trade)]
+    flushed = aggregator.flush()
+
+    last_bucket = pd.Timestamp('2024-03-01 14:50')  # Trades stop at 14:53:30
+    assert all(bar.start < last_bucket for bar in completed)
+    assert sorted(bar.symbol for bar in flushed) == SYMBOLS
+    assert all(bar.start == last_bucket for bar in flushed)
+    assert not aggregator.flush()
+
+def test_late_trades_are_dropped():
+    aggregator = BarAggregator(['1min'])
+    aggregator.update(Trade(pd.Timestamp('2024-03-01 14:31:10'), 'AAA', 10.0, 1.0))
+    aggregator.update(Trade(pd.Timestamp('2024-03-01 14:30:50'), 'AAA', 99.0, 1.0))
+
+    assert aggregator.late_trades == 1
+    assert aggregator.flush()[0].high == 10.0
+
+def test_writer_flushes_match_resampled_ticks(tmp_path, trades):
+    dm = DataManager(str(tmp_path / 'stock_data'), 'csv', provider=FakeProvider())
+
+    # A small batch size forces many micro-batch appends per symbol and resolution
+    written = stream_to_store(trades, dm, RESOLUTIONS, batch_size=7, flush_interval=3600)
+
+    total = 0
+    for symbol in SYMBOLS:
+        for resolution in RESOLUTIONS:
+            stored = dm.get_data(symbol, resolution=resolution)
+            expected = resampled(trades, symbol, resolution)
+            pd.testing.assert_frame_equal(stored[expected.columns], expected, check_names=False,
+                                          check_freq=False, check_index_type=False,
+                                          check_exact=False, rtol=1e-12)
+            key = dm.bar_key(symbol, resolution)
+            assert dm.storage.manifest.get(key)['rows'] == len(expected)
+            total += len(expected)
+    assert written == total
+
+def test_writer_buffers_until_batch_size(tmp_path, trades):
+    dm = DataManager(str(tmp_path / 'stock_data'), 'csv', provider=FakeProvider())
+    writer = BarWriter(dm, batch_size=1_000, flush_interval=3600)
+    aggregator = BarAggregator(['1min'])
+
+    writer.write(aggregator.aggregate(trades))
+
+    assert writer.bars_written == 0
+    writer.flush()
+    assert writer.bars_written == sum(len(resampled(trades, s, '1min')) for s in SYMBOLS)